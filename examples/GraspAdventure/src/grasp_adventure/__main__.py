@@ -1,11 +1,16 @@
 import argparse
+import sys
+
+from grasp_adventure.v5.game import Game
+from grasp_adventure.v5.game_factory import GameFactory
+from grasp_adventure.v5.instrumentation import ENV_VARIABLE, Instrumentation
 
 
 def say_hi(name="world"):
     print(f"Hello, {name}!")
 
 
-def main():
+def main(args=None):
     parser = argparse.ArgumentParser(
         prog="grasp-adventure",
         description="A simple adventure game demonstrating GRASP (and other) patterns",
@@ -14,9 +19,58 @@ def main():
     parser.add_argument(
         "-n", "--name", default="world", help="the name of the person to greet"
     )
-    args = parser.parse_args()
-    say_hi(args.name)
+    parser.add_argument(
+        "-w",
+        "--world",
+        help="play in the world stored in this snapshot or JSON (Lines) file",
+    )
+    parser.add_argument(
+        "-p",
+        "--player",
+        action="append",
+        dest="players",
+        help="add a player with this name (default: a single player)",
+    )
+    parser.add_argument(
+        "-r", "--rounds", type=int, default=1, help="the number of rounds to play"
+    )
+    parser.add_argument(
+        "--save-snapshot",
+        metavar="PATH",
+        help="save the world as snapshot to PATH instead of playing",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help=(
+            "record timings of the turns and write a JSON summary to PATH "
+            f"(setting {ENV_VARIABLE}=1 writes it to stderr)"
+        ),
+    )
+    args = parser.parse_args(args)
+    if args.world is None:
+        say_hi(args.name)
+        return
+
+    factory = GameFactory()
+    world = factory.load_world(args.world)
+    if args.save_snapshot:
+        world.save_snapshot(args.save_snapshot)
+        return
+    game = Game(
+        players=factory.create_players(args.players or [args.name]), world=world
+    )
+    if args.profile:
+        game.instrument(Instrumentation())
+    for _ in range(args.rounds):
+        game.play_round()
+    if game.instrumentation is not None:
+        if args.profile:
+            with open(args.profile, "w", encoding="utf-8") as file:
+                print(game.instrumentation.to_json(), file=file)
+        else:
+            print(game.instrumentation.to_json(), file=sys.stderr)
 
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
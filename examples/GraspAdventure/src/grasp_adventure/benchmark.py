@@ -0,0 +1,147 @@
+import argparse
+import json
+import math
+import platform
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterator
+from time import perf_counter
+
+from grasp_adventure.v5.game import Game
+from grasp_adventure.v5.game_factory import GameFactory
+from grasp_adventure.v5.location import LocationDescription
+from grasp_adventure.v5.player import random_action_strategy
+from grasp_adventure.v5.simulation import Simulation
+from grasp_adventure.v5.world_generator import (
+    grid_locations,
+    maze_locations,
+    random_locations,
+)
+
+WorldGenerator = Callable[[int, int], Iterator[LocationDescription]]
+
+
+def _square(generator):
+    def generate(num_locations: int, seed: int) -> Iterator[LocationDescription]:
+        side = max(1, math.isqrt(num_locations))
+        return generator(side, side, seed)
+
+    return generate
+
+
+WORLD_GENERATORS: dict[str, WorldGenerator] = {
+    "grid": _square(lambda width, height, seed: grid_locations(width, height)),
+    "maze": _square(maze_locations),
+    "random": lambda num_locations, seed: random_locations(num_locations, 2, seed),
+}
+
+
+def benchmark_world(
+    generator: WorldGenerator,
+    num_locations: int,
+    players: int = 100,
+    turns: int = 100_000,
+    seed: int = 0,
+) -> dict[str, float]:
+    """Measure how fast worlds of one kind are built and played.
+
+    Returns the construction times of a `World` and a `CompactWorld`, the
+    memory that they need per location, and the turns per second of a
+    simulation with `players` random players that plays about `turns` turns.
+
+    >>> result = benchmark_world(WORLD_GENERATORS["grid"], 100, 2, 20)
+    >>> sorted(result)  # doctest: +NORMALIZE_WHITESPACE
+    ['bytes_per_location', 'compact_bytes_per_location',
+     'compact_world_seconds', 'locations', 'turns_per_second', 'world_seconds']
+    """
+    result = {}
+    for prefix, compact in [("", False), ("compact_", True)]:
+        start = perf_counter()
+        world = GameFactory().create_world(generator(num_locations, seed), compact)
+        result[f"{prefix}world_seconds"] = perf_counter() - start
+        result["locations"] = len(world.locations)
+        del world
+
+        tracemalloc.start()
+        try:
+            world = GameFactory().create_world(generator(num_locations, seed), compact)
+            memory = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+        result[f"{prefix}bytes_per_location"] = memory / len(world.locations)
+        del world
+
+    factory = GameFactory()
+    world = factory.create_world(generator(num_locations, seed))
+    game = Game(
+        players=factory.create_players([f"Player {i}" for i in range(players)], seed),
+        world=world,
+    )
+    for player in game.players:
+        player.select_action = random_action_strategy
+    rounds = max(1, turns // players)
+    start = perf_counter()
+    Simulation(game).run(rounds)
+    result["turns_per_second"] = rounds * players / (perf_counter() - start)
+    return result
+
+
+def main(args):
+    parser = argparse.ArgumentParser(
+        prog="python -m grasp_adventure.benchmark",
+        description="Measure world construction, memory and turns per second.",
+        epilog="Have fun!",
+    )
+    parser.add_argument(
+        "-s",
+        "--size",
+        type=int,
+        default=100_000,
+        help="the number of locations per world (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-k",
+        "--kind",
+        action="append",
+        choices=sorted(WORLD_GENERATORS),
+        help="only benchmark worlds of this kind (default: all)",
+    )
+    parser.add_argument(
+        "-p", "--players", type=int, default=100, help="players in the simulation"
+    )
+    parser.add_argument(
+        "-t", "--turns", type=int, default=100_000, help="turns in the simulation"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="the random seed")
+    parser.add_argument("-o", "--output", help="write the results as JSON to this file")
+    args = parser.parse_args(args)
+
+    results = {}
+    for kind in args.kind or WORLD_GENERATORS:
+        result = benchmark_world(
+            WORLD_GENERATORS[kind], args.size, args.players, args.turns, args.seed
+        )
+        results[kind] = result
+        print(
+            f"{kind:8} {result['locations']:>10} locations"
+            f" {result['world_seconds']:8.3f}s build"
+            f" {result['bytes_per_location']:8.0f} B/location"
+            f" {result['compact_world_seconds']:8.3f}s build (compact)"
+            f" {result['compact_bytes_per_location']:8.0f} B/location (compact)"
+            f" {result['turns_per_second']:10.0f} turns/s"
+        )
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": results,
+                },
+                file,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
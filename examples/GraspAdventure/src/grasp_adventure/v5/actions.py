@@ -8,7 +8,7 @@ if TYPE_CHECKING:
     from .player import Player
 
 
-@dataclass
+@dataclass(frozen=True)
 class MoveAction(Action):
     direction: str
     target: Location
@@ -21,7 +21,7 @@ class MoveAction(Action):
         instigator.location = self.target
 
 
-@dataclass
+@dataclass(frozen=True)
 class SkipTurnAction(Action):
     @property
     def description(self) -> str:
@@ -32,6 +32,10 @@ class SkipTurnAction(Action):
         pass
 
 
+# Skipping a turn has no state, so all players can share a single instance.
+SKIP_TURN_ACTION = SkipTurnAction()
+
+
 @dataclass
 class InspectAction(Action):
     object: GameObject
@@ -0,0 +1,125 @@
+import asyncio
+import inspect
+from collections.abc import Iterable
+from time import perf_counter_ns
+
+from .actions import SKIP_TURN_ACTION
+from .base_classes import Action
+from .events import ActionChosen, TurnStarted
+from .game import Game
+from .player import Player
+
+
+class AsyncGame:
+    """Play a game in an asyncio event loop.
+
+    At the start of each round all players choose their actions concurrently;
+    the actions are then executed in the order of `Game.players`. A player's
+    `select_action` may be a normal function or a coroutine function. If a
+    coroutine does not produce an action within `turn_timeout` seconds, the
+    player skips the turn.
+
+    Since waiting for one player does not block the event loop, a single
+    process can host many games at the same time, e.g., with `play_games()`.
+    The turns of instrumented players are recorded like in `Player.take_turn`,
+    but their strategy time includes the time spent waiting for the choices.
+
+    >>> from grasp_adventure.data.locations import simple_locations
+    >>> from grasp_adventure.v5.game_factory import GameFactory
+    >>> game = GameFactory().create_game(simple_locations, ["Alice"])
+    >>> actions = asyncio.run(AsyncGame(game).play_round())
+    >>> [action.description for action in actions]
+    ['move north to Room 2']
+    """
+
+    def __init__(self, game: Game, turn_timeout: float | None = None):
+        self.game = game
+        self.turn_timeout = turn_timeout
+
+    async def play_round(self) -> list[Action]:
+        """Play one round and return the executed actions."""
+        players = self.game.players
+        turns = await asyncio.gather(*map(self._choose_action, players))
+        actions = []
+        for player, (action, timings) in zip(players, turns):
+            if timings is None:
+                player.perform_action(action)
+            else:
+                start = perf_counter_ns()
+                player.perform_action(action)
+                player.instrumentation.record_turn(*timings, perf_counter_ns() - start)
+            actions.append(action)
+        self.game.finish_round()
+        return actions
+
+    async def run(self, rounds: int) -> None:
+        for _ in range(rounds):
+            await self.play_round()
+
+    async def select_action(self, player: Player) -> Action:
+        """Await the action of `player`, skipping the turn on timeout."""
+        player.publish(TurnStarted)
+        action = player.select_action(player)
+        if inspect.isawaitable(action):
+            try:
+                action = await asyncio.wait_for(action, self.turn_timeout)
+            except asyncio.TimeoutError:
+                action = SKIP_TURN_ACTION
+        player.publish(ActionChosen, action)
+        return action
+
+    async def _choose_action(
+        self, player: Player
+    ) -> tuple[Action, tuple[int, int, int] | None]:
+        """Await the action of `player` and, if the player is instrumented,
+        the number of actions and the times of the first two phases."""
+        if player.instrumentation is None:
+            return await self.select_action(player), None
+        start = perf_counter_ns()
+        num_actions = len(player.actions)
+        actions_built = perf_counter_ns()
+        action = await self.select_action(player)
+        timings = (
+            num_actions,
+            actions_built - start,
+            perf_counter_ns() - actions_built,
+        )
+        return action, timings
+
+
+async def play_games(games: Iterable[AsyncGame], rounds: int) -> None:
+    """Play `rounds` rounds of all `games` concurrently."""
+    await asyncio.gather(*(game.run(rounds) for game in games))
+
+
+class QueuedActionStrategy:
+    """An action strategy for players whose choices arrive asynchronously.
+
+    Another task, e.g., the connection handler of a remote player, submits
+    the index of the chosen action in `Player.actions`; the player's turn
+    waits until a choice is available. Invalid choices skip the turn, and
+    choices submitted after a turn timed out are used for the next turn.
+
+    >>> async def main(player):
+    ...     strategy = QueuedActionStrategy()
+    ...     strategy.submit(0)
+    ...     return await strategy(player)
+    >>> from grasp_adventure.data.locations import simple_locations
+    >>> from grasp_adventure.v5.game_factory import GameFactory
+    >>> game = GameFactory().create_game(simple_locations, ["Alice"])
+    >>> asyncio.run(main(game.players[0])).description
+    'move north to Room 2'
+    """
+
+    def __init__(self):
+        self.choices: asyncio.Queue[int] = asyncio.Queue()
+
+    def submit(self, choice: int) -> None:
+        self.choices.put_nowait(choice)
+
+    async def __call__(self, player: Player) -> Action:
+        choice = await self.choices.get()
+        actions = player.actions
+        if 0 <= choice < len(actions):
+            return actions[choice]
+        return SKIP_TURN_ACTION
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
     from .player import Player
@@ -15,6 +15,9 @@ class Action(ABC):
 
 
 class GameObject(ABC):
+    # Objects of stateless classes can be shared between locations.
+    stateless: ClassVar[bool] = False
+
     @abstractmethod
     def __str__(self): ...
 
@@ -0,0 +1,413 @@
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from enum import IntEnum
+from os import PathLike
+from typing import TYPE_CHECKING
+
+from .base_classes import Action
+from .location import LocationDescription, build_move_actions, build_turn_actions
+
+if TYPE_CHECKING:
+    from .world import World
+
+
+class Direction(IntEnum):
+    NORTH = 0
+    EAST = 1
+    SOUTH = 2
+    WEST = 3
+    UP = 4
+    DOWN = 5
+
+    @classmethod
+    def from_name(cls, name: str) -> "Direction":
+        try:
+            return cls[name.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown direction: {name!r}") from None
+
+    def __str__(self):
+        return self.name.lower()
+
+
+class CompactWorld:
+    """An immutable world that stores its locations in flat arrays.
+
+    Location names are interned to integer ids, and the connections of all
+    locations are stored in compressed sparse row form: the connections of
+    the location with id `i` are the pairs `(directions[j], targets[j])` for
+    `offsets[i] <= j < offsets[i + 1]`. Locations are accessed through
+    lightweight `LocationView` objects that are created on demand and support
+    the same queries as `Location`.
+
+    The arrays may be any sequences of integers, e.g., memory views of a
+    snapshot file (see `grasp_adventure.v5.world_snapshot`). Worlds created by
+    `from_descriptions()` and `from_world()` store their ids in 4-byte arrays
+    and their names and descriptions as UTF-8 in a `StringTable`; names are
+    looked up by binary search in a `SortedNameIndex`.
+
+    >>> from grasp_adventure.data.locations import simple_locations
+    >>> world = CompactWorld.from_descriptions(simple_locations)
+    >>> world["Room 1"]
+    LocationView('Room 1')
+    >>> world["Room 1"]["north"]
+    LocationView('Room 2')
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        descriptions: Sequence[str],
+        offsets: Sequence[int],
+        directions: Sequence[int],
+        targets: Sequence[int],
+        initial_location_name: str | None = None,
+        ids: Mapping[str, int] | None = None,
+        max_cached_actions: int = 1024,
+    ):
+        self.names = names
+        self.descriptions = descriptions
+        self.offsets = offsets
+        self.directions = directions
+        self.targets = targets
+        if ids is None:
+            ids = {name: i for i, name in enumerate(names)}
+        self.ids = ids
+        # Action tables of the most recently used locations, indexed by
+        # location id. Views are short-lived, so the tables live in the world;
+        # their number is bounded to keep the world compact.
+        self.max_cached_actions = max_cached_actions
+        self.move_actions: "OrderedDict[int, tuple[Action, ...]]" = OrderedDict()
+        self.turn_actions: "OrderedDict[int, tuple[Action, ...]]" = OrderedDict()
+        self.initial_location_name = (
+            names[0] if initial_location_name is None else initial_location_name
+        )
+
+    @classmethod
+    def from_descriptions(
+        cls, location_descriptions: Iterable[LocationDescription]
+    ) -> "CompactWorld":
+        """Create a compact world from a description of its locations.
+
+        The descriptions are read in a single pass, so they may be streamed.
+        Locations get ids in the order in which they are first mentioned,
+        either by their own description or by a connection."""
+        names: list[str] = []
+        ids: dict[str, int] = {}
+        descriptions: list[str] = []
+        described = bytearray()
+        first_edges, edge_counts = array("I"), array("I")
+        directions, targets = array("B"), array("I")
+
+        def location_id(name: str) -> int:
+            result = ids.get(name)
+            if result is None:
+                result = ids[name] = len(names)
+                names.append(name)
+                descriptions.append("")
+                described.append(0)
+                first_edges.append(0)
+                edge_counts.append(0)
+            return result
+
+        # The first described location gets id 0 and becomes the initial one.
+        for data in location_descriptions:
+            source = location_id(data["name"])
+            descriptions[source] = data.get("description", "")
+            described[source] = 1
+            connections = data.get("connections", {})
+            first_edges[source] = len(targets)
+            edge_counts[source] = len(connections)
+            for direction, target_name in connections.items():
+                directions.append(Direction.from_name(direction))
+                targets.append(location_id(target_name))
+        if not names:
+            raise ValueError("A world needs at least one location.")
+        if not all(described):
+            raise KeyError(names[described.index(0)])
+
+        # The edges were stored in the order of the descriptions; sort them by
+        # location id to obtain the compressed sparse row layout.
+        offsets = array("I", [0])
+        sorted_directions, sorted_targets = array("B"), array("I")
+        for first_edge, edge_count in zip(first_edges, edge_counts):
+            end = first_edge + edge_count
+            sorted_directions.extend(directions[first_edge:end])
+            sorted_targets.extend(targets[first_edge:end])
+            offsets.append(len(sorted_targets))
+        return cls._from_arrays(
+            names, descriptions, offsets, sorted_directions, sorted_targets
+        )
+
+    @classmethod
+    def from_world(cls, world: "World") -> "CompactWorld":
+        """Create a compact copy of a world built from `Location` objects."""
+        locations = list(world.locations.values())
+        ids = {location.name: i for i, location in enumerate(locations)}
+        offsets, directions, targets = array("I", [0]), array("B"), array("I")
+        for location in locations:
+            for direction, target in location.connections.items():
+                directions.append(Direction.from_name(direction))
+                targets.append(ids[target.name])
+            offsets.append(len(targets))
+        return cls._from_arrays(
+            [location.name for location in locations],
+            [location.description for location in locations],
+            offsets,
+            directions,
+            targets,
+            ids[world.initial_location_name],
+        )
+
+    @classmethod
+    def _from_arrays(
+        cls,
+        names: Sequence[str],
+        descriptions: Sequence[str],
+        offsets: array,
+        directions: array,
+        targets: array,
+        initial_location_id: int = 0,
+    ) -> "CompactWorld":
+        """Create a compact world whose names and descriptions are packed
+        into a string table."""
+        packed_names, packed_descriptions, ids = pack_strings(names, descriptions)
+        return cls(
+            names=packed_names,
+            descriptions=packed_descriptions,
+            offsets=offsets,
+            directions=directions,
+            targets=targets,
+            initial_location_name=packed_names[initial_location_id],
+            ids=ids,
+        )
+
+    @property
+    def is_packed(self) -> bool:
+        """Whether the names and descriptions are stored like `pack_strings()`
+        stores them, i.e., as in a snapshot file."""
+        names, descriptions = self.names, self.descriptions
+        return (
+            isinstance(names, StringTable)
+            and isinstance(descriptions, StringTable)
+            and isinstance(self.ids, SortedNameIndex)
+            and names.data is descriptions.data
+            and names.offsets[0] == 0
+            and names.offsets[-1] == descriptions.offsets[0]
+            and descriptions.offsets[-1] == len(names.data)
+        )
+
+    @staticmethod
+    def load_snapshot(path: str | PathLike[str]) -> "CompactWorld":
+        """Map a snapshot file into memory; see `World.load_snapshot()`."""
+        from .world_snapshot import load_snapshot
+
+        return load_snapshot(path)
+
+    def save_snapshot(self, path: str | PathLike[str]) -> None:
+        """Write this world to a snapshot file; see `World.save_snapshot()`."""
+        from .world_snapshot import save_snapshot
+
+        save_snapshot(self, path)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, location_name: str) -> "LocationView":
+        """Get a location by name."""
+        return LocationView(self, self.ids[location_name])
+
+    @property
+    def locations(self) -> "CompactLocations":
+        return CompactLocations(self)
+
+    @property
+    def initial_location(self) -> "LocationView":
+        return self[self.initial_location_name]
+
+    @property
+    def description(self):
+        return "Nothing noteworthy is happening in the world."
+
+    def neighbor_id(self, location_id: int, direction: Direction) -> int | None:
+        """Return the id of the location in `direction` of `location_id`."""
+        directions = self.directions
+        for i in range(self.offsets[location_id], self.offsets[location_id + 1]):
+            if directions[i] == direction:
+                return self.targets[i]
+        return None
+
+    def cached_actions(
+        self,
+        cache: "OrderedDict[int, tuple[Action, ...]]",
+        location_id: int,
+        build: Callable[[], tuple[Action, ...]],
+    ) -> tuple[Action, ...]:
+        """Look up the actions of a location in `cache`, building them with
+        `build()` and evicting the least recently used entry if necessary."""
+        actions = cache.get(location_id)
+        if actions is None:
+            actions = cache[location_id] = build()
+            if len(cache) > self.max_cached_actions:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(location_id)
+        return actions
+
+
+class CompactLocations(Mapping):
+    """A read-only mapping from location names to views of a compact world."""
+
+    __slots__ = ("world",)
+
+    def __init__(self, world: CompactWorld):
+        self.world = world
+
+    def __getitem__(self, location_name: str) -> "LocationView":
+        return self.world[location_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.world.names)
+
+    def __len__(self) -> int:
+        return len(self.world)
+
+
+class StringTable(Sequence):
+    """A sequence of strings that are decoded from a buffer on access."""
+
+    def __init__(self, data: memoryview, offsets: Sequence[int]):
+        self.data = data
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if not -len(self) <= index < len(self):
+            raise IndexError(index)
+        index %= len(self)
+        return self.encoded(index).decode("utf-8")
+
+    def encoded(self, index: int) -> bytes:
+        return bytes(self.data[self.offsets[index] : self.offsets[index + 1]])
+
+
+class SortedNameIndex(Mapping):
+    """A mapping from names to ids that uses binary search in a list of ids
+    sorted by the encoded names."""
+
+    def __init__(self, names: StringTable, sorted_ids: Sequence[int]):
+        self.names = names
+        self.sorted_ids = sorted_ids
+
+    def __getitem__(self, name: str) -> int:
+        encoded_name = name.encode("utf-8")
+        low, high = 0, len(self.sorted_ids)
+        while low < high:
+            middle = (low + high) // 2
+            if self.names.encoded(self.sorted_ids[middle]) < encoded_name:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self.sorted_ids):
+            location_id = self.sorted_ids[low]
+            if self.names.encoded(location_id) == encoded_name:
+                return location_id
+        raise KeyError(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return (self.names[location_id] for location_id in self.sorted_ids)
+
+    def __len__(self) -> int:
+        return len(self.sorted_ids)
+
+
+def pack_strings(
+    names: Sequence[str], descriptions: Sequence[str]
+) -> tuple["StringTable", "StringTable", "SortedNameIndex"]:
+    """Encode the names and then the descriptions of the locations into one
+    buffer, and sort the location ids by the encoded names."""
+    encoded_names = [name.encode("utf-8") for name in names]
+    strings = bytearray()
+    name_offsets, description_offsets = array("Q", [0]), array("Q", [0])
+    for encoded_name in encoded_names:
+        strings += encoded_name
+        name_offsets.append(len(strings))
+    description_offsets[0] = len(strings)
+    for description in descriptions:
+        strings += description.encode("utf-8")
+        description_offsets.append(len(strings))
+    sorted_ids = array(
+        "I", sorted(range(len(encoded_names)), key=encoded_names.__getitem__)
+    )
+    del encoded_names
+    data = memoryview(bytes(strings))
+    packed_names = StringTable(data, name_offsets)
+    return (
+        packed_names,
+        StringTable(data, description_offsets),
+        SortedNameIndex(packed_names, sorted_ids),
+    )
+
+
+class LocationView:
+    """A view of a single location of a `CompactWorld`."""
+
+    __slots__ = ("world", "id")
+
+    def __init__(self, world: CompactWorld, location_id: int):
+        self.world = world
+        self.id = location_id
+
+    def __repr__(self):
+        return f"LocationView({self.name!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, LocationView):
+            return NotImplemented
+        return self.world is other.world and self.id == other.id
+
+    def __hash__(self):
+        return hash((id(self.world), self.id))
+
+    @property
+    def name(self) -> str:
+        return self.world.names[self.id]
+
+    @property
+    def description(self) -> str:
+        return self.world.descriptions[self.id]
+
+    @property
+    def connections(self) -> dict[str, "LocationView"]:
+        world = self.world
+        start, end = world.offsets[self.id], world.offsets[self.id + 1]
+        return {
+            str(Direction(world.directions[i])): LocationView(world, world.targets[i])
+            for i in range(start, end)
+        }
+
+    def __getitem__(self, direction: str) -> "LocationView | None":
+        try:
+            target_id = self.world.neighbor_id(self.id, Direction.from_name(direction))
+        except ValueError:
+            return None
+        return None if target_id is None else LocationView(self.world, target_id)
+
+    @property
+    def move_actions(self) -> tuple[Action, ...]:
+        return self.world.cached_actions(
+            self.world.move_actions,
+            self.id,
+            lambda: build_move_actions(self.connections),
+        )
+
+    @property
+    def turn_actions(self) -> tuple[Action, ...]:
+        return self.world.cached_actions(
+            self.world.turn_actions,
+            self.id,
+            lambda: build_turn_actions(self.move_actions),
+        )
@@ -0,0 +1,94 @@
+import numpy as np
+
+from .compact_world import CompactWorld
+from .game import Game
+from .player import Player, random_action_strategy
+from .world import World
+
+
+class CrowdSimulation:
+    """Simulate many players that use `random_action_strategy` at once.
+
+    The locations of these players are kept as an array of location ids of a
+    `CompactWorld`, and each round samples the actions of all of them with a
+    few NumPy operations on the world's adjacency arrays. As with
+    `random_action_strategy`, every move and skipping the turn are equally
+    likely. The players' `location` attributes are only updated by `sync()`;
+    players with other strategies take their turns normally each round.
+
+    The random numbers come from a NumPy generator seeded with `seed`, so the
+    results are reproducible but differ from the players' own generators.
+
+    >>> from grasp_adventure.data.locations import simple_locations
+    >>> from grasp_adventure.v5.game_factory import GameFactory
+    >>> game = GameFactory().create_game(simple_locations, ["Alice", "Bob"])
+    >>> for player in game.players:
+    ...     player.select_action = random_action_strategy
+    >>> crowd = CrowdSimulation(game, seed=1)
+    >>> crowd.run(100)
+    >>> crowd.sync()
+    >>> int(crowd.moves.sum() + crowd.waits.sum())
+    200
+    >>> [player.location.name for player in game.players]
+    ['Room 1', 'Room 1']
+    """
+
+    def __init__(self, game: Game, seed: int | None = None):
+        self.game = game
+        world = game.world
+        self.world = world if isinstance(world, CompactWorld) else None
+        if self.world is None:
+            self.world = CompactWorld.from_world(world)
+        # The adjacency arrays of the world with an additional connection of
+        # every location to itself, which represents skipping the turn.
+        offsets = np.asarray(self.world.offsets, dtype=np.int64)
+        location_ids = np.arange(len(offsets) - 1)
+        self.num_actions = (np.diff(offsets) + 1).astype(np.float64)
+        self.offsets = offsets[:-1] + location_ids
+        self.targets = np.insert(
+            np.asarray(self.world.targets, dtype=np.int64), offsets[1:], location_ids
+        )
+        self.rng = np.random.default_rng(seed)
+        self.crowd: list[Player] = []
+        self.other_players: list[Player] = []
+        for player in game.players:
+            if player.select_action is random_action_strategy:
+                self.crowd.append(player)
+            else:
+                self.other_players.append(player)
+        self.location_ids = np.array(
+            [self.world.ids[player.location.name] for player in self.crowd],
+            dtype=np.int64,
+        )
+        self.moves = np.zeros(len(self.crowd), dtype=np.int64)
+        self.waits = np.zeros(len(self.crowd), dtype=np.int64)
+
+    def run(self, rounds: int) -> None:
+        for _ in range(rounds):
+            self.step()
+            for player in self.other_players:
+                player.take_turn()
+            self.game.finish_round()
+
+    def step(self) -> None:
+        """Let every player in the crowd take one turn."""
+        location_ids = self.location_ids
+        choices = self.rng.random(len(location_ids))
+        choices *= self.num_actions[location_ids]
+        new_location_ids = self.targets[
+            self.offsets[location_ids] + choices.astype(np.int64)
+        ]
+        # Like `Simulation`, count moves that end where they started as waits.
+        moving = new_location_ids != location_ids
+        self.moves += moving
+        self.waits += ~moving
+        self.location_ids = new_location_ids
+
+    def sync(self) -> None:
+        """Move the players in the crowd to their simulated locations."""
+        world: World | CompactWorld = self.game.world
+        names = self.world.names
+        for player, location_id in zip(self.crowd, self.location_ids.tolist()):
+            name = names[location_id]
+            if player.location.name != name:
+                player.location = world[name]
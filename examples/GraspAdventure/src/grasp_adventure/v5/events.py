@@ -0,0 +1,122 @@
+import weakref
+from types import MethodType
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from .base_classes import Action
+    from .game import Game
+    from .location import Location
+    from .player import Player
+
+
+class Event:
+    """Base class for game events.
+
+    Event objects are pooled and reused by the `EventBus`, so subscribers must
+    not keep references to them after they return."""
+
+    __slots__ = ()
+
+    def set(self, *args: Any) -> None:
+        for name, value in zip(self.__slots__, args):
+            setattr(self, name, value)
+
+    def clear(self) -> None:
+        for name in self.__slots__:
+            setattr(self, name, None)
+
+
+class TurnStarted(Event):
+    __slots__ = ("player",)
+    player: "Player"
+
+
+class ActionChosen(Event):
+    __slots__ = ("player", "action")
+    player: "Player"
+    action: "Action"
+
+
+class ActionExecuted(Event):
+    __slots__ = ("player", "action")
+    player: "Player"
+    action: "Action"
+
+
+class PlayerMoved(Event):
+    __slots__ = ("player", "old_location", "new_location")
+    player: "Player"
+    old_location: "Location"
+    new_location: "Location"
+
+
+class RoundFinished(Event):
+    __slots__ = ("game", "round_number")
+    game: "Game"
+    round_number: int
+
+
+E = TypeVar("E", bound=Event)
+Subscriber = Callable[[Any], None]
+
+
+class EventBus:
+    """Deliver game events to subscribers (Observer pattern).
+
+    Subscribers are held through weak references, so subscribing does not
+    keep an object alive; a subscriber that is a bound method is removed when
+    its object is garbage collected. Publishing an event type that nobody
+    subscribed to only costs a dictionary lookup, and publishers can skip
+    even that by checking `subscribers` first.
+
+    >>> bus = EventBus()
+    >>> def print_round(event):
+    ...     print(f"Round {event.round_number} finished")
+    >>> bus.subscribe(RoundFinished, print_round)
+    >>> bus.publish(RoundFinished, None, 1)
+    Round 1 finished
+    """
+
+    def __init__(self):
+        # Maps event types to weak references to their subscribers; event
+        # types without subscribers are not in the dict.
+        self.subscribers: dict[type[Event], list[weakref.ref]] = {}
+        self._pools: dict[type[Event], list[Event]] = {}
+
+    def subscribe(self, event_type: type[E], subscriber: Callable[[E], None]) -> None:
+        if isinstance(subscriber, MethodType):
+            reference = weakref.WeakMethod(subscriber)
+        else:
+            reference = weakref.ref(subscriber)
+        self.subscribers.setdefault(event_type, []).append(reference)
+
+    def unsubscribe(self, event_type: type[E], subscriber: Callable[[E], None]) -> None:
+        references = self.subscribers.get(event_type, [])
+        for reference in references:
+            if reference() == subscriber:
+                references.remove(reference)
+                break
+        if not references:
+            self.subscribers.pop(event_type, None)
+
+    def publish(self, event_type: type[Event], *args: Any) -> None:
+        """Deliver an event of `event_type` with the given field values."""
+        references = self.subscribers.get(event_type)
+        if not references:
+            return
+        pool = self._pools.setdefault(event_type, [])
+        event = pool.pop() if pool else event_type()
+        event.set(*args)
+        try:
+            for reference in tuple(references):
+                subscriber = reference()
+                if subscriber is None:
+                    references.remove(reference)
+                else:
+                    subscriber(event)
+        finally:
+            event.clear()
+            pool.append(event)
+            if not references:
+                self.subscribers.pop(event_type, None)
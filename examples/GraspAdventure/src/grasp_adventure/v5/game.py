@@ -1,6 +1,12 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from io import StringIO
+from random import Random
 
+from .events import EventBus, RoundFinished
+from .game_state import GameState
+from .instrumentation import Instrumentation
+from .occupancy import OccupancyIndex
+from .pawn import Pawn
 from .player import Player
 from .world import World
 
@@ -9,6 +15,78 @@ from .world import World
 class Game:
     players: list[Player]
     world: World
+    events: EventBus = field(default_factory=EventBus, repr=False, compare=False)
+    round_number: int = 0
+    instrumentation: Instrumentation | None = field(
+        default_factory=Instrumentation.from_environment, repr=False, compare=False
+    )
+    occupancy: OccupancyIndex = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        for player in self.players:
+            player.events = self.events
+        self.occupancy = OccupancyIndex(self.players)
+        self.instrument(self.instrumentation)
+
+    def instrument(self, instrumentation: Instrumentation | None) -> None:
+        """Record timings of all turns in `instrumentation` (or stop if `None`)."""
+        self.instrumentation = instrumentation
+        for player in self.players:
+            player.instrumentation = instrumentation
+
+    def snapshot(self) -> GameState:
+        """Return the current state of the game.
+
+        >>> from grasp_adventure.data.locations import simple_locations
+        >>> from grasp_adventure.v5.game_factory import GameFactory
+        >>> game = GameFactory().create_game(simple_locations, ["Alice"])
+        >>> state = game.snapshot()
+        >>> _ = game.players[0].take_turn()
+        >>> game.restore(state)
+        >>> game.players[0].location.name
+        'Room 1'
+        """
+        return GameState(
+            locations=tuple(player.pawn.location for player in self.players),
+            round_number=self.round_number,
+        )
+
+    def restore(self, state: GameState) -> None:
+        """Move the players back to the locations in `state`."""
+        if len(state.locations) != len(self.players):
+            raise ValueError("The state belongs to a game with other players.")
+        for player, location in zip(self.players, state.locations):
+            if player.pawn.location is not location:
+                player.location = location
+        self.round_number = state.round_number
+
+    def fork(self) -> "Game":
+        """Return a game in the same state that can be played independently.
+
+        The fork shares the world with this game; its players are copies that
+        use the same strategies and copies of the random number generators.
+        It has its own event bus and no instrumentation.
+        """
+        players = []
+        for player in self.players:
+            rng = None
+            if player.rng is not None:
+                rng = Random()
+                rng.setstate(player.rng.getstate())
+            players.append(
+                Player(
+                    name=player.name,
+                    pawn=Pawn(location=player.pawn.location),
+                    select_action=player.select_action,
+                    rng=rng,
+                )
+            )
+        return Game(
+            players=players,
+            world=self.world,
+            round_number=self.round_number,
+            instrumentation=None,
+        )
 
     @property
     def description(self):
@@ -21,9 +99,17 @@ class Game:
     def play_round(self):
         for player in self.players:
             player.take_turn()
+        self.finish_round()
         self.print_round_header()
         print(self.description)
 
+    def finish_round(self):
+        self.round_number += 1
+        if self.instrumentation is not None:
+            self.instrumentation.count("rounds")
+        if RoundFinished in self.events.subscribers:
+            self.events.publish(RoundFinished, self, self.round_number)
+
     @staticmethod
     def print_round_header():
         header = "Playing a round."
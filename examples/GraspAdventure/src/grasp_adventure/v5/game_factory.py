@@ -1,11 +1,17 @@
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
+from os import PathLike
+from random import Random
 from typing import Any
 
+from .compact_world import CompactWorld
 from .game import Game
-from .location import Location, LocationDescriptions
+from .location import Location, LocationDescription, LocationDescriptions
+from .location_loader import read_location_descriptions
+from .object_pool import LazyObjects, ObjectPool
 from .pawn import Pawn
 from .player import Player
 from .world import World
+from .world_snapshot import is_snapshot, load_snapshot
 
 
 class GameFactory:
@@ -18,21 +24,29 @@ class GameFactory:
         self.object_classes: dict[str, type] = (
             {} if object_classes is None else object_classes
         )
+        self.object_pool = ObjectPool(self.object_descriptions, self.object_classes)
         self.objects = {}
-        self.world: World | None = None
+        self.world: World | CompactWorld | None = None
         self.players = {}
 
     def create_game(
-        self, location_descriptions: LocationDescriptions, player_descriptions
+        self,
+        location_descriptions: LocationDescriptions,
+        player_descriptions,
+        seed: int | None = None,
     ) -> Game:
+        """Create a game; if `seed` is given, every player gets a random
+        number generator seeded with `seed` and the player's name."""
         world = self.create_world(location_descriptions)
-        players = self.create_players(player_descriptions)
+        players = self.create_players(player_descriptions, seed)
         return Game(players=players, world=world)
 
-    def create_players(self, player_descriptions) -> list[Player]:
-        return [self.create_player(desc) for desc in player_descriptions]
+    def create_players(
+        self, player_descriptions, seed: int | None = None
+    ) -> list[Player]:
+        return [self.create_player(desc, seed) for desc in player_descriptions]
 
-    def create_player(self, player_description) -> Player:
+    def create_player(self, player_description, seed: int | None = None) -> Player:
         assert self.world is not None
         if not isinstance(player_description, Mapping):
             player_description = {"name": player_description}
@@ -44,23 +58,56 @@ class GameFactory:
             self.players[player_name] = Player(
                 name=player_description["name"],
                 pawn=Pawn(location=self.world[location_name]),
+                rng=None if seed is None else Random(f"{seed}:{player_name}"),
             )
         return self.players[player_name]
 
     def create_world(
         self,
-        location_descriptions: LocationDescriptions,
-    ) -> World:
-        """Create a World from a description of its locations."""
-        if self.world is None:
-            locations = GameFactory._create_locations(location_descriptions)
+        location_descriptions: Iterable[LocationDescription],
+        compact: bool = False,
+    ) -> World | CompactWorld:
+        """Create a World from a description of its locations.
+
+        The descriptions are read only once, so they may be streamed, e.g.,
+        from `read_location_descriptions()`. The first location becomes the
+        initial location. If `compact` is true, create an immutable,
+        array-backed `CompactWorld` that needs much less memory for large
+        maps but does not contain objects. Otherwise, the objects listed in
+        the descriptions are created when they are first accessed; objects
+        without an object description are left out."""
+        if self.world is not None:
+            raise ValueError("The world has already been created.")
+        if compact:
+            self.world = CompactWorld.from_descriptions(location_descriptions)
+        else:
+            locations = GameFactory._create_locations(
+                location_descriptions, self.object_pool
+            )
+            if not locations:
+                raise ValueError("A world needs at least one location.")
             self.world = World(
                 locations=locations,
-                initial_location_name=location_descriptions[0]["name"],
+                initial_location_name=next(iter(locations)),
             )
-            return self.world
-        else:
+        return self.world
+
+    def load_world(
+        self, path: str | PathLike[str], compact: bool = False
+    ) -> World | CompactWorld:
+        """Create a World by streaming location descriptions from a file.
+
+        The file contains either one JSON object per line (JSON Lines) or a
+        JSON array of objects; see `read_location_descriptions()`. If it is a
+        snapshot written by `World.save_snapshot()`, it is memory-mapped as a
+        `CompactWorld` instead."""
+        if self.world is not None:
             raise ValueError("The world has already been created.")
+        if is_snapshot(path):
+            self.world = load_snapshot(path)
+            return self.world
+        with open(path, encoding="utf-8") as file:
+            return self.create_world(read_location_descriptions(file), compact)
 
     def create_object(self, object_name):
         """Create an object from the stored object descriptions.
@@ -71,37 +118,51 @@ class GameFactory:
         [1, 2, 3]
         """
         if self.objects.get(object_name) is None:
-            object_description = self.object_descriptions[object_name]
-            object_class = self.object_classes[object_description["class_name"]]
-            self.objects[object_name] = object_class(
-                *object_description.get("args", []),
-                **object_description.get("kwargs", {})
-            )
+            self.objects[object_name] = self.object_pool.create(object_name)
         return self.objects.get(object_name)
 
     @staticmethod
     def _create_locations(
-        location_descriptions: LocationDescriptions,
+        location_descriptions: Iterable[LocationDescription],
+        object_pool: ObjectPool | None = None,
     ) -> dict[str, Location]:
-        """Create a World from a description of its locations."""
-        locations = {
-            data["name"]: Location.from_description(data)
-            for data in location_descriptions
-        }
-        GameFactory._build_connections_for_all_locations(
-            locations, location_descriptions
-        )
-        return locations
+        """Create the locations of a World in a single pass over their descriptions.
 
-    @staticmethod
-    def _build_connections_for_all_locations(
-        locations: dict[str, Location], location_descriptions: LocationDescriptions
-    ):
-        for location_description in location_descriptions:
-            connections = {
-                direction: locations[name]
-                for direction, name in location_description.get(
-                    "connections", {}
-                ).items()
+        Connections to locations that are described later are resolved through
+        placeholder locations, which are completed when their description is
+        read. The result is ordered like the descriptions. If `object_pool` is
+        given, the objects of each location are created lazily from it;
+        objects that the pool has no description of are left out."""
+        locations: dict[str, Location] = {}
+        placeholders: dict[str, Location] = {}
+
+        def find_or_create_location(name: str) -> Location:
+            location = locations.get(name)
+            if location is None:
+                location = placeholders.get(name)
+            if location is None:
+                location = placeholders[name] = Location(name)
+            return location
+
+        for data in location_descriptions:
+            location = placeholders.pop(data["name"], None)
+            if location is None:
+                location = Location.from_description(data)
+            else:
+                location.description = data.get("description", "")
+            locations[location.name] = location
+            if object_pool is not None and data.get("objects"):
+                object_names = [
+                    name
+                    for name in data["objects"]
+                    if name in object_pool.object_descriptions
+                ]
+                if object_names:
+                    location.objects = LazyObjects(object_pool, object_names)
+            location.connections = {
+                direction: find_or_create_location(name)
+                for direction, name in data.get("connections", {}).items()
             }
-            locations[location_description["name"]].connections = connections
+        if placeholders:
+            raise KeyError(next(iter(placeholders)))
+        return locations
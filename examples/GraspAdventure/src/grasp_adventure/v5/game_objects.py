@@ -17,5 +17,10 @@ class TreasureChest(GameObject):
 
 @dataclass()
 class Torch(GameObject):
+    stateless = True
+
     def __str__(self):
         return "a torch"
+
+
+OBJECT_CLASSES = {"TreasureChest": TreasureChest, "Torch": Torch}
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+from .location import Location
+
+
+@dataclass(frozen=True)
+class GameState:
+    """The mutable state of a game: the locations of the players' pawns,
+    indexed like `Game.players`, and the number of finished rounds.
+
+    The locations are references into the game's world, so a state takes
+    memory proportional to the number of players."""
+
+    locations: tuple[Location, ...]
+    round_number: int = 0
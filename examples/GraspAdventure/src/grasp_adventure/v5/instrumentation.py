@@ -0,0 +1,113 @@
+"""Optional timers and counters for the turn loop.
+
+Instrumentation is disabled unless a `Game` is created with an
+`Instrumentation` object or the environment variable named by `ENV_VARIABLE`
+is set to a non-empty value other than "0". Disabled instrumentation costs one
+attribute check per turn.
+"""
+
+import json
+import os
+from collections import Counter
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base_classes import Action
+    from .player import Player
+
+ENV_VARIABLE = "GRASP_ADVENTURE_INSTRUMENTATION"
+PHASES = ("actions", "strategy", "execute")
+
+
+class Instrumentation:
+    """Per-phase timers, counters and a strategy latency histogram.
+
+    Every turn is split into three phases: building the available actions,
+    selecting one of them with the player's strategy, and executing it. The
+    histogram counts strategy latencies in buckets whose upper bounds are
+    powers of two nanoseconds.
+
+    >>> from grasp_adventure.data.locations import simple_locations
+    >>> from grasp_adventure.v5.game_factory import GameFactory
+    >>> from grasp_adventure.v5.simulation import Simulation
+    >>> game = GameFactory().create_game(simple_locations, ["Alice"])
+    >>> game.instrument(Instrumentation())
+    >>> _ = Simulation(game).run(10)
+    >>> summary = game.instrumentation.to_dict()
+    >>> summary["counters"]
+    {'turns': 10, 'actions_generated': 20, 'rounds': 10}
+    >>> sorted(summary["phases"])
+    ['actions', 'execute', 'strategy']
+    """
+
+    def __init__(self):
+        self.counters: Counter[str] = Counter()
+        self.phase_ns: dict[str, int] = dict.fromkeys(PHASES, 0)
+        # Maps the bit length of a latency in ns to the number of turns.
+        self.strategy_latency_histogram: Counter[int] = Counter()
+
+    @classmethod
+    def from_environment(cls) -> "Instrumentation | None":
+        """Return an `Instrumentation` if it is enabled in the environment."""
+        if os.environ.get(ENV_VARIABLE, "0") not in ("", "0"):
+            return cls()
+        return None
+
+    def take_turn(self, player: "Player") -> "Action":
+        """Let `player` take a turn and record the time of each phase."""
+        start = perf_counter_ns()
+        num_actions = len(player.actions)
+        actions_built = perf_counter_ns()
+        action = player.choose_action()
+        action_chosen = perf_counter_ns()
+        player.perform_action(action)
+        end = perf_counter_ns()
+        self.record_turn(
+            num_actions,
+            actions_built - start,
+            action_chosen - actions_built,
+            end - action_chosen,
+        )
+        return action
+
+    def record_turn(
+        self, num_actions: int, actions_ns: int, strategy_ns: int, execute_ns: int
+    ) -> None:
+        """Record a turn whose phases were timed by the caller."""
+        phase_ns = self.phase_ns
+        phase_ns["actions"] += actions_ns
+        phase_ns["strategy"] += strategy_ns
+        phase_ns["execute"] += execute_ns
+        self.counters["turns"] += 1
+        self.counters["actions_generated"] += num_actions
+        self.strategy_latency_histogram[strategy_ns.bit_length()] += 1
+
+    def count(self, name: str, increment: int = 1) -> None:
+        self.counters[name] += increment
+
+    @property
+    def turns_per_second(self) -> float:
+        total_ns = sum(self.phase_ns.values())
+        return self.counters["turns"] * 1e9 / total_ns if total_ns else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "counters": dict(self.counters),
+            "phases": {
+                phase: {"total_seconds": ns / 1e9, "share": self._share(ns)}
+                for phase, ns in self.phase_ns.items()
+            },
+            "turns_per_second": self.turns_per_second,
+            "strategy_latency_histogram": {
+                f"<{1 << bits}ns": count
+                for bits, count in sorted(self.strategy_latency_histogram.items())
+            },
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def _share(self, ns: int) -> float:
+        total_ns = sum(self.phase_ns.values())
+        return ns / total_ns if total_ns else 0.0
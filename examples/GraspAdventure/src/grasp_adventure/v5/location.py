@@ -1,17 +1,103 @@
 from dataclasses import dataclass, field
 from typing import Any, Mapping, Sequence
 
-from .base_classes import Action
+from .base_classes import Action, GameObject
 
 LocationDescription = Mapping[str, Any]
 LocationDescriptions = Sequence[LocationDescription]
 
 
+class Topology:
+    """The version of the connections of the locations in a world.
+
+    The version is incremented whenever the connections of one of the
+    locations change, so that indices derived from the connections know when
+    they are out of date."""
+
+    __slots__ = ("version",)
+
+    def __init__(self):
+        self.version = 0
+
+
+class Connections(dict):
+    """The connections of a location, which tells the location when they
+    change, so that it can reset the caches derived from them."""
+
+    __slots__ = ("location",)
+
+    def __init__(self, location: "Location", connections=()):
+        super().__init__(connections)
+        self.location = location
+
+    def __reduce__(self):
+        return Connections, (self.location, dict(self))
+
+    def __setitem__(self, direction: str, target: "Location") -> None:
+        super().__setitem__(direction, target)
+        self.location._connections_changed()
+
+    def __delitem__(self, direction: str) -> None:
+        super().__delitem__(direction)
+        self.location._connections_changed()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self.location._connections_changed()
+
+    def pop(self, *args):
+        result = super().pop(*args)
+        self.location._connections_changed()
+        return result
+
+    def popitem(self):
+        result = super().popitem()
+        self.location._connections_changed()
+        return result
+
+    def setdefault(self, direction: str, target: "Location | None" = None):
+        result = super().setdefault(direction, target)
+        self.location._connections_changed()
+        return result
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.location._connections_changed()
+
+
 @dataclass
 class Location:
     name: str
     description: str = ""
     connections: dict[str, "Location"] = field(default_factory=dict)
+    # The objects in this location; `GameFactory` stores them as `LazyObjects`
+    # that are only created when they are first accessed.
+    objects: Sequence[GameObject] = field(default=(), repr=False, compare=False)
+    # Caches for `move_actions` and `turn_actions`; reset when the connections
+    # of this location change.
+    _move_actions: tuple[Action, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _turn_actions: tuple[Action, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # The topology of the world that contains this location; set by `World`.
+    # Its version is incremented whenever the connections change: assigned
+    # dicts are wrapped in `Connections`, which reports changes in place.
+    topology: Topology | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any):
+        if name == "connections":
+            super().__setattr__(name, Connections(self, value))
+            self._connections_changed()
+        else:
+            super().__setattr__(name, value)
 
     @classmethod
     def from_description(cls, data: LocationDescription) -> "Location":
@@ -20,11 +106,50 @@ class Location:
     def __getitem__(self, direction: str) -> "Location | None":
         return self.connections.get(direction)
 
+    def connect(self, direction: str, target: "Location") -> None:
+        self.connections[direction] = target
+
+    def disconnect(self, direction: str) -> None:
+        del self.connections[direction]
+
+    @property
+    def move_actions(self) -> tuple[Action, ...]:
+        """The actions for moving to the neighbors of this location."""
+        if self._move_actions is None:
+            self._move_actions = build_move_actions(self.connections)
+        return self._move_actions
+
+    @property
+    def turn_actions(self) -> tuple[Action, ...]:
+        """All actions a player can take here: the move actions and skipping
+        the turn."""
+        if self._turn_actions is None:
+            self._turn_actions = build_turn_actions(self.move_actions)
+        return self._turn_actions
+
     @property
-    def move_actions(self) -> list[Action]:
-        from .actions import MoveAction
+    def inspect_actions(self) -> tuple[Action, ...]:
+        """The actions for inspecting the objects in this location."""
+        from .actions import InspectAction
+
+        return tuple(InspectAction(obj) for obj in self.objects)
+
+    def _connections_changed(self) -> None:
+        if self.topology is not None:
+            self.topology.version += 1
+        self._move_actions = None
+        self._turn_actions = None
+
+
+def build_move_actions(connections: Mapping[str, Any]) -> tuple[Action, ...]:
+    from .actions import MoveAction
+
+    return tuple(
+        MoveAction(direction, location) for direction, location in connections.items()
+    )
+
+
+def build_turn_actions(move_actions: tuple[Action, ...]) -> tuple[Action, ...]:
+    from .actions import SKIP_TURN_ACTION
 
-        return [
-            MoveAction(direction, location)
-            for direction, location in self.connections.items()
-        ]
+    return (*move_actions, SKIP_TURN_ACTION)
@@ -0,0 +1,129 @@
+import json
+from collections.abc import Iterator
+from typing import TextIO
+
+from .location import LocationDescription
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+# Characters that end a JSON number or literal such as `true`.
+_TOKEN_DELIMITERS = frozenset(" \t\r\n,:[]{}")
+
+
+def read_location_descriptions(
+    file: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[LocationDescription]:
+    """Lazily read location descriptions from a JSON file.
+
+    The file may contain a sequence of JSON objects separated by whitespace
+    (e.g., JSON Lines) or a single JSON array of objects. Either way, the file
+    is read in chunks of `chunk_size` characters and each description is
+    yielded as soon as it has been parsed, so memory use does not depend on
+    the size of the file.
+
+    >>> from io import StringIO
+    >>> text = '[{"name": "Room 1"},\\n {"name": "Room 2"}]'
+    >>> [data["name"] for data in read_location_descriptions(StringIO(text))]
+    ['Room 1', 'Room 2']
+    >>> text = '{"name": "Room 1"}\\n{"name": "Room 2"}\\n'
+    >>> [data["name"] for data in read_location_descriptions(StringIO(text))]
+    ['Room 1', 'Room 2']
+    """
+    return _JsonObjectReader(file, chunk_size).read_objects()
+
+
+class _JsonObjectReader:
+    def __init__(self, file: TextIO, chunk_size: int):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        # The number of lines in the part of the file that has been dropped
+        # from the buffer, and the length of its last, incomplete line.
+        self.dropped_lines = 0
+        self.dropped_columns = 0
+
+    def read_objects(self) -> Iterator[LocationDescription]:
+        in_array = self.peek() == "["
+        if in_array:
+            self.pos += 1
+            if self.peek() == "]":
+                self.pos += 1
+                return
+        while self.peek():
+            yield self.read_object()
+            if in_array:
+                separator = self.peek()
+                self.pos += 1
+                if separator == "]":
+                    return
+                if separator != ",":
+                    raise ValueError(
+                        f"Expected ',' or ']' but found {separator!r}: "
+                        f"{self.position(self.pos - 1)}."
+                    )
+        if in_array:
+            raise ValueError("Unterminated JSON array.")
+
+    def read_object(self) -> LocationDescription:
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                break
+            except json.JSONDecodeError as error:
+                # Only an error at the end of the buffer may be caused by an
+                # incomplete object; reading on would load the rest of the file.
+                if not self.is_at_end(error) or not self.read_chunk():
+                    raise ValueError(
+                        f"{error.msg}: {self.position(error.pos)}."
+                    ) from None
+        if not isinstance(value, dict):
+            raise ValueError(
+                f"Expected a location description but found {value!r}: "
+                f"{self.position(self.pos)}."
+            )
+        self.pos = end
+        return value
+
+    def is_at_end(self, error: json.JSONDecodeError) -> bool:
+        """Check whether `error` may be caused by the end of the buffer."""
+        if error.msg.startswith("Unterminated string"):
+            # Strings cannot contain line breaks, so the string runs to the end.
+            return True
+        rest = self.buffer[error.pos :]
+        if not rest.strip():
+            return True
+        # A number or literal that may continue in the next chunk.
+        return _TOKEN_DELIMITERS.isdisjoint(rest)
+
+    def position(self, pos: int) -> str:
+        """Describe the position of `pos` in the buffer relative to the file."""
+        line_start = self.buffer.rfind("\n", 0, pos) + 1
+        column = pos - line_start + 1
+        if line_start == 0:
+            column += self.dropped_columns
+        line = self.dropped_lines + self.buffer.count("\n", 0, pos) + 1
+        return f"line {line} column {column}"
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ("" at the end)."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.read_chunk():
+                return ""
+
+    def read_chunk(self) -> bool:
+        """Append a chunk from the file to the unread part of the buffer."""
+        chunk = self.file.read(self.chunk_size)
+        dropped_lines = self.buffer.count("\n", 0, self.pos)
+        if dropped_lines:
+            self.dropped_lines += dropped_lines
+            self.dropped_columns = self.pos - self.buffer.rfind("\n", 0, self.pos) - 1
+        else:
+            self.dropped_columns += self.pos
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return bool(chunk)
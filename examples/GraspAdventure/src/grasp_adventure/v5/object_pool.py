@@ -0,0 +1,73 @@
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from .base_classes import GameObject
+
+
+class ObjectPool:
+    """Create game objects from their descriptions.
+
+    Objects of classes that are marked as stateless (`GameObject.stateless`)
+    and that are described without arguments are flyweights: all of them
+    share one instance per class name. All other objects are created anew for
+    every placement, so that, e.g., every treasure chest has its own gold.
+
+    >>> from grasp_adventure.data.objects import object_descriptions
+    >>> from grasp_adventure.v5.game_objects import OBJECT_CLASSES
+    >>> pool = ObjectPool(object_descriptions, OBJECT_CLASSES)
+    >>> pool.create("Torch") is pool.create("Torch")
+    True
+    >>> pool.create("Treasure Chest") is pool.create("Treasure Chest")
+    False
+    """
+
+    def __init__(
+        self,
+        object_descriptions: Mapping[str, Any],
+        object_classes: Mapping[str, type],
+    ):
+        self.object_descriptions = object_descriptions
+        self.object_classes = object_classes
+        self.flyweights: dict[str, GameObject] = {}
+
+    def create(self, object_name: str) -> GameObject:
+        object_description = self.object_descriptions[object_name]
+        class_name = object_description["class_name"]
+        args = object_description.get("args", [])
+        kwargs = object_description.get("kwargs", {})
+        object_class = self.object_classes[class_name]
+        if args or kwargs or not getattr(object_class, "stateless", False):
+            return object_class(*args, **kwargs)
+        flyweight = self.flyweights.get(class_name)
+        if flyweight is None:
+            flyweight = self.flyweights[class_name] = object_class()
+        return flyweight
+
+
+class LazyObjects(Sequence):
+    """The objects in a location, created by `pool` when first accessed.
+
+    Only the object names are stored until then, so worlds with many objects
+    can be loaded without creating any of them."""
+
+    __slots__ = ("pool", "names", "_objects")
+
+    def __init__(self, pool: ObjectPool, names: Sequence[str]):
+        self.pool = pool
+        self.names = tuple(names)
+        self._objects: list[GameObject] | None = None
+
+    @property
+    def is_created(self) -> bool:
+        return self._objects is not None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if self._objects is None:
+            self._objects = [self.pool.create(name) for name in self.names]
+        return self._objects[index]
+
+    def __repr__(self) -> str:
+        return f"LazyObjects({list(self.names)!r})"
@@ -0,0 +1,73 @@
+from collections.abc import Iterable, ValuesView
+from typing import TYPE_CHECKING
+
+from .location import Location
+
+if TYPE_CHECKING:
+    from .player import Player
+
+
+class OccupancyIndex:
+    """An index of the players in each location.
+
+    The index is updated by the `Player.location` setter of the players that
+    belong to it, so moving a player and querying the players in a location
+    take constant time, independent of the number of players in the game.
+    Locations are identified by name, so the index works for both `World`
+    and `CompactWorld`.
+
+    >>> from grasp_adventure.data.locations import simple_locations
+    >>> from grasp_adventure.v5.game_factory import GameFactory
+    >>> game = GameFactory().create_game(simple_locations, ["Alice", "Bob"])
+    >>> alice, bob = game.players
+    >>> _ = alice.take_turn()
+    >>> [player.name for player in game.occupancy.players_at(bob.location)]
+    ['Bob']
+    >>> game.occupancy.count(alice.location)
+    1
+    """
+
+    def __init__(self, players: Iterable["Player"] = ()):
+        # Maps location names to the players in the location, keyed by their
+        # ids since players are not hashable.
+        self._players: dict[str, dict[int, "Player"]] = {}
+        for player in players:
+            self.add(player)
+
+    def add(self, player: "Player") -> None:
+        player.occupancy = self
+        self._players.setdefault(player.location.name, {})[id(player)] = player
+
+    def remove(self, player: "Player") -> None:
+        self._remove(player, player.location)
+        player.occupancy = None
+
+    def move(self, player: "Player", old_location: Location, new_location: Location):
+        self._remove(player, old_location)
+        self._players.setdefault(new_location.name, {})[id(player)] = player
+
+    def players_at(self, location: Location) -> ValuesView["Player"]:
+        """The players in `location`, in the order in which they arrived."""
+        return self._players.get(location.name, {}).values()
+
+    def count(self, location: Location) -> int:
+        return len(self._players.get(location.name, ()))
+
+    def is_occupied(self, location: Location) -> bool:
+        return location.name in self._players
+
+    def players_near(self, location: Location) -> dict[str, list["Player"]]:
+        """The players in the neighbors of `location`, by direction.
+
+        Only directions that lead to occupied locations are included."""
+        return {
+            direction: list(self.players_at(neighbor))
+            for direction, neighbor in location.connections.items()
+            if self.is_occupied(neighbor)
+        }
+
+    def _remove(self, player: "Player", location: Location) -> None:
+        players = self._players[location.name]
+        del players[id(player)]
+        if not players:
+            del self._players[location.name]
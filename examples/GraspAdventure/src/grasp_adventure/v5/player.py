@@ -1,11 +1,24 @@
-from dataclasses import dataclass
-from random import choice
-from typing import Callable
+from dataclasses import dataclass, field
+from random import Random, choice
+from typing import TYPE_CHECKING, Callable
 
+from .actions import SKIP_TURN_ACTION
 from .base_classes import Action
+from .events import (
+    ActionChosen,
+    ActionExecuted,
+    Event,
+    EventBus,
+    PlayerMoved,
+    TurnStarted,
+)
 from .location import Location
 from .pawn import Pawn
 
+if TYPE_CHECKING:
+    from .instrumentation import Instrumentation
+    from .occupancy import OccupancyIndex
+
 
 def first_action_strategy(player: "Player"):
     """Return the first available action.
@@ -16,23 +29,23 @@ def first_action_strategy(player: "Player"):
     if actions:
         return actions[0]
     else:
-        from .actions import SkipTurnAction
-
-        return SkipTurnAction()
+        return SKIP_TURN_ACTION
 
 
 def random_action_strategy(player: "Player"):
     """Return a random choice from the available actions.
 
-    If no action is available, return a wait action."""
+    If the player has its own random number generator, use it, so that the
+    player's choices are reproducible. If no action is available, return a
+    wait action."""
 
     actions = player.actions
     if actions:
+        if player.rng is not None:
+            return player.rng.choice(actions)
         return choice(actions)
     else:
-        from .actions import SkipTurnAction
-
-        return SkipTurnAction()
+        return SKIP_TURN_ACTION
 
 
 def interactive_action_strategy(player: "Player"):
@@ -55,6 +68,12 @@ class Player:
     name: str
     pawn: Pawn
     select_action: Callable[["Player"], Action] = first_action_strategy
+    events: EventBus | None = field(default=None, repr=False, compare=False)
+    rng: Random | None = field(default=None, repr=False, compare=False)
+    occupancy: "OccupancyIndex | None" = field(default=None, repr=False, compare=False)
+    instrumentation: "Instrumentation | None" = field(
+        default=None, repr=False, compare=False
+    )
 
     @property
     def location(self) -> Location:
@@ -62,18 +81,48 @@ class Player:
 
     @location.setter
     def location(self, new_location: Location):
+        old_location = self.pawn.location
         self.pawn.location = new_location
+        if self.occupancy is not None:
+            self.occupancy.move(self, old_location, new_location)
+        events = self.events
+        if events is not None and PlayerMoved in events.subscribers:
+            events.publish(PlayerMoved, self, old_location, new_location)
 
     @property
     def description(self) -> str:
         return f"{self.name} at {self.location.name}"
 
     @property
-    def actions(self) -> list[Action]:
-        from .actions import SkipTurnAction
-
-        return [*self.pawn.actions, SkipTurnAction()]
-
-    def take_turn(self):
+    def actions(self) -> tuple[Action, ...]:
+        return self.location.turn_actions
+
+    def take_turn(self) -> Action:
+        """Select and execute an action; return the executed action."""
+        if self.instrumentation is not None:
+            return self.instrumentation.take_turn(self)
+        events = self.events
+        if events is None or not events.subscribers:
+            action = self.select_action(self)
+            action.execute(self)
+            return action
+        action = self.choose_action()
+        self.perform_action(action)
+        return action
+
+    def choose_action(self) -> Action:
+        """Select an action, publishing the turn's events."""
+        self.publish(TurnStarted)
         action = self.select_action(self)
+        self.publish(ActionChosen, action)
+        return action
+
+    def perform_action(self, action: Action) -> None:
+        """Execute `action`, publishing the turn's events."""
         action.execute(self)
+        self.publish(ActionExecuted, action)
+
+    def publish(self, event_type: type[Event], *args) -> None:
+        """Publish an event about this player if it has an event bus."""
+        if self.events is not None:
+            self.events.publish(event_type, self, *args)
@@ -0,0 +1,142 @@
+from array import array
+from collections.abc import Mapping
+
+from .location import Location
+
+
+class ReachabilityIndex:
+    """The strongly connected components of a world and their reachability.
+
+    The components are computed with Tarjan's algorithm in time linear in the
+    number of locations and connections. Tarjan's algorithm numbers the
+    components in reverse topological order, i.e., every connection between
+    two components leads from a higher to a lower component id. A location
+    can reach another one if both are in the same component; it cannot if
+    its component id is lower. Otherwise, the components reachable from its
+    component are computed once and cached.
+
+    >>> from grasp_adventure.data.locations import dungeon_locations
+    >>> from grasp_adventure.v5.game_factory import GameFactory
+    >>> world = GameFactory().create_world(dungeon_locations)
+    >>> index = ReachabilityIndex(world.locations)
+    >>> index.num_components
+    1
+    >>> index.can_reach("Treasure Chamber", "Vestibule")
+    True
+    """
+
+    def __init__(self, locations: Mapping[str, Location]):
+        self.ids = ids = {name: i for i, name in enumerate(locations)}
+        offsets, targets = array("l", [0]), array("l")
+        for location in locations.values():
+            targets.extend(
+                [ids[target.name] for target in location.connections.values()]
+            )
+            offsets.append(len(targets))
+        self.components = components = _strongly_connected_components(offsets, targets)
+        self.num_components = max(components, default=-1) + 1
+        # The connections between components (the condensation of the world).
+        self.successors: list[set[int]] = [set() for _ in range(self.num_components)]
+        for source in range(len(components)):
+            start, end = offsets[source], offsets[source + 1]
+            if start == end:
+                continue
+            source_component = components[source]
+            for target in targets[start:end]:
+                target_component = components[target]
+                if target_component != source_component:
+                    self.successors[source_component].add(target_component)
+        self._reachable_components: dict[int, set[int]] = {}
+
+    def component(self, location_name: str) -> int:
+        return self.components[self.ids[location_name]]
+
+    def can_reach(self, start: str, goal: str) -> bool:
+        start_component, goal_component = self.component(start), self.component(goal)
+        if start_component == goal_component:
+            return True
+        if start_component < goal_component:
+            return False
+        return goal_component in self.reachable_components(start_component)
+
+    def reachable_components(self, component: int) -> set[int]:
+        """The ids of all components reachable from `component`."""
+        reachable = self._reachable_components.get(component)
+        if reachable is None:
+            reachable = {component}
+            stack = [component]
+            while stack:
+                for successor in self.successors[stack.pop()]:
+                    if successor not in reachable:
+                        reachable.add(successor)
+                        stack.append(successor)
+            self._reachable_components[component] = reachable
+        return reachable
+
+    def add_connection(self, source: str, target: str) -> bool:
+        """Update the index for a new connection from `source` to `target`.
+
+        Returns `False` if the connection may merge components; the index is
+        then out of date and has to be recomputed."""
+        source_component, target_component = (
+            self.component(source),
+            self.component(target),
+        )
+        if source_component == target_component:
+            return True
+        if source_component < target_component:
+            return False
+        if target_component not in self.successors[source_component]:
+            self.successors[source_component].add(target_component)
+            self._reachable_components.clear()
+        return True
+
+
+def _strongly_connected_components(offsets: array, targets: array) -> array:
+    """Return the component id of every node of a graph in compressed sparse
+    row form (iterative Tarjan)."""
+    num_nodes = len(offsets) - 1
+    unvisited = num_nodes
+    indices = array("l", [unvisited]) * num_nodes
+    low_links = array("l", [0]) * num_nodes
+    components = array("l", [-1]) * num_nodes
+    on_stack = bytearray(num_nodes)
+    stack: list[int] = []
+    next_index = next_component = 0
+    for root in range(num_nodes):
+        if indices[root] != unvisited:
+            continue
+        # Each frame holds a node and the position of its next outgoing edge.
+        frames = [(root, offsets[root])]
+        indices[root] = low_links[root] = next_index
+        next_index += 1
+        stack.append(root)
+        on_stack[root] = 1
+        while frames:
+            node, edge = frames[-1]
+            if edge < offsets[node + 1]:
+                frames[-1] = (node, edge + 1)
+                neighbor = targets[edge]
+                if indices[neighbor] == unvisited:
+                    indices[neighbor] = low_links[neighbor] = next_index
+                    next_index += 1
+                    stack.append(neighbor)
+                    on_stack[neighbor] = 1
+                    frames.append((neighbor, offsets[neighbor]))
+                elif on_stack[neighbor] and indices[neighbor] < low_links[node]:
+                    low_links[node] = indices[neighbor]
+                continue
+            frames.pop()
+            if frames:
+                parent = frames[-1][0]
+                if low_links[node] < low_links[parent]:
+                    low_links[parent] = low_links[node]
+            if low_links[node] == indices[node]:
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = 0
+                    components[member] = next_component
+                    if member == node:
+                        break
+                next_component += 1
+    return components
@@ -0,0 +1,64 @@
+from .events import PlayerMoved
+from .game import Game
+
+
+class IncrementalRenderer:
+    """Render a game, re-rendering only the players that moved.
+
+    The renderer subscribes to the `PlayerMoved` events of the game and
+    caches one line per player. `render()` returns the same text as
+    `Game.description`, but only re-renders the lines of players that moved
+    since the last frame; `render_changes()` returns just these lines, so
+    that spectators can update their views in time proportional to the
+    number of moves.
+
+    >>> from grasp_adventure.data.locations import simple_locations
+    >>> from grasp_adventure.v5.game_factory import GameFactory
+    >>> game = GameFactory().create_game(simple_locations, ["Alice", "Bob"])
+    >>> renderer = IncrementalRenderer(game)
+    >>> _ = game.players[1].take_turn()
+    >>> renderer.render_changes()
+    [(1, 'Bob at Room 2')]
+    >>> renderer.render() == game.description
+    True
+    """
+
+    def __init__(self, game: Game):
+        self.game = game
+        self.lines = [player.description for player in game.players]
+        self.indices = {id(player): index for index, player in enumerate(game.players)}
+        self.changed: set[int] = set()
+        self._text: str | None = None
+        game.events.subscribe(PlayerMoved, self.player_moved)
+
+    def player_moved(self, event: PlayerMoved) -> None:
+        index = self.indices.get(id(event.player))
+        if index is not None:
+            self.changed.add(index)
+
+    def render_changes(self) -> list[tuple[int, str]]:
+        """Return the indices and new lines of the players that moved since
+        the last frame, and start a new frame."""
+        players, lines = self.game.players, self.lines
+        changes = []
+        for index in sorted(self.changed):
+            line = players[index].description
+            if line != lines[index]:
+                lines[index] = line
+                changes.append((index, line))
+        self.changed.clear()
+        if changes:
+            self._text = None
+        return changes
+
+    def render(self) -> str:
+        """Return the description of the game and start a new frame."""
+        self.render_changes()
+        if self._text is None:
+            self._text = "".join(
+                f"{line}\n" for line in [*self.lines, self.game.world.description]
+            )
+        return self._text
+
+    def close(self) -> None:
+        self.game.events.unsubscribe(PlayerMoved, self.player_moved)
@@ -0,0 +1,139 @@
+"""Record games and replay them without running the players' strategies.
+
+A replay log stores one byte per turn: the index of the executed move in the
+`move_actions` of the player's location, or `SKIP` for actions that do not
+move the player. The file format is a JSON header line with the players and
+their start locations followed by the raw turn bytes.
+"""
+
+import json
+from array import array
+from dataclasses import dataclass, field
+from os import PathLike
+
+from .actions import MoveAction
+from .base_classes import Action
+from .events import ActionChosen, ActionExecuted
+from .game import Game
+from .location import Location
+
+VERSION = 1
+SKIP = 255
+
+
+@dataclass
+class ReplayLog:
+    """The executed actions of a game, round by round in player order."""
+
+    player_names: list[str]
+    start_location_names: list[str]
+    seed: int | None = None
+    turns: array = field(default_factory=lambda: array("B"), repr=False)
+
+    @property
+    def rounds(self) -> int:
+        return len(self.turns) // len(self.player_names)
+
+    def save(self, path: str | PathLike[str]) -> None:
+        header = {
+            "version": VERSION,
+            "players": self.player_names,
+            "locations": self.start_location_names,
+            "seed": self.seed,
+        }
+        with open(path, "wb") as file:
+            file.write(json.dumps(header).encode("utf-8") + b"\n")
+            self.turns.tofile(file)
+
+    @staticmethod
+    def load(path: str | PathLike[str]) -> "ReplayLog":
+        with open(path, "rb") as file:
+            header = json.loads(file.readline())
+            if header.get("version") != VERSION:
+                raise ValueError(f"{path} has an unsupported replay log version.")
+            turns = array("B", file.read())
+        return ReplayLog(
+            player_names=header["players"],
+            start_location_names=header["locations"],
+            seed=header["seed"],
+            turns=turns,
+        )
+
+
+class ReplayRecorder:
+    """Record the actions executed in `game` into `log`.
+
+    The recorder subscribes to the game's events, so it has to be kept alive
+    while the game is played, and it has to be created before the first turn.
+    Actions are encoded when they are chosen, relative to the player's
+    location at that time, and appended to the log when they are executed,
+    so that the log is in player order even if the players choose their
+    actions concurrently, as in `AsyncGame`.
+
+    >>> from grasp_adventure.data.locations import simple_locations
+    >>> from grasp_adventure.v5.game_factory import GameFactory
+    >>> game = GameFactory().create_game(simple_locations, ["Alice", "Bob"])
+    >>> recorder = ReplayRecorder(game)
+    >>> for _ in range(3):
+    ...     for player in game.players:
+    ...         _ = player.take_turn()
+    >>> recorder.log.rounds, list(recorder.log.turns)
+    (3, [0, 0, 0, 0, 0, 0])
+    """
+
+    def __init__(self, game: Game, seed: int | None = None):
+        self.game = game
+        self.log = ReplayLog(
+            player_names=[player.name for player in game.players],
+            start_location_names=[player.location.name for player in game.players],
+            seed=seed,
+        )
+        # The codes of the chosen actions that have not been executed yet.
+        self.chosen: dict[int, int] = {}
+        game.events.subscribe(ActionChosen, self.encode)
+        game.events.subscribe(ActionExecuted, self.record)
+
+    def encode(self, event: ActionChosen) -> None:
+        self.chosen[id(event.player)] = encode_action(
+            event.player.location, event.action
+        )
+
+    def record(self, event: ActionExecuted) -> None:
+        self.log.turns.append(self.chosen.pop(id(event.player)))
+
+    def close(self) -> None:
+        self.game.events.unsubscribe(ActionChosen, self.encode)
+        self.game.events.unsubscribe(ActionExecuted, self.record)
+
+
+def encode_action(location: Location, action: Action) -> int:
+    """Return the byte that represents `action` executed at `location`."""
+    if isinstance(action, MoveAction):
+        for index, move_action in enumerate(location.move_actions):
+            if move_action.direction == action.direction:
+                if index >= SKIP:
+                    raise ValueError(f"{location.name} has too many exits to record.")
+                return index
+    return SKIP
+
+
+def fast_forward(game: Game, log: ReplayLog, round_number: int) -> None:
+    """Put the players of `game` where they were after round `round_number`.
+
+    The players start at the locations recorded in `log` and only the moves
+    are applied, without running strategies or executing actions, so the
+    game has to be played in the same world as the recorded game.
+    """
+    if not 0 <= round_number <= log.rounds:
+        raise ValueError(f"The log contains only {log.rounds} rounds.")
+    if [player.name for player in game.players] != log.player_names:
+        raise ValueError("The game has different players than the log.")
+    num_players = len(log.player_names)
+    end = round_number * num_players
+    for index, player in enumerate(game.players):
+        location = game.world[log.start_location_names[index]]
+        for code in log.turns[index:end:num_players]:
+            if code != SKIP:
+                location = location.move_actions[code].target
+        player.location = location
+    game.round_number = round_number
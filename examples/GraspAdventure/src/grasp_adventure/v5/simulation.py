@@ -0,0 +1,91 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .base_classes import Action
+from .game import Game
+from .player import Player
+
+TurnHook = Callable[[int, Player, Action], None]
+RoundHook = Callable[[int, Game], None]
+
+
+@dataclass
+class SimulationStatistics:
+    """Per-player statistics of a simulation, indexed like `Game.players`."""
+
+    player_names: list[str]
+    rounds: int = 0
+    moves: array = field(init=False)
+    waits: array = field(init=False)
+
+    def __post_init__(self):
+        self.moves = array("q", [0]) * len(self.player_names)
+        self.waits = array("q", [0]) * len(self.player_names)
+
+    @property
+    def turns(self) -> int:
+        return self.rounds * len(self.player_names)
+
+    def to_dict(self) -> dict[str, dict[str, int]]:
+        return {
+            name: {"moves": moves, "waits": waits}
+            for name, moves, waits in zip(self.player_names, self.moves, self.waits)
+        }
+
+
+class Simulation:
+    """Run rounds of a game without producing any output.
+
+    Statistics are collected into arrays that are allocated once per
+    simulation. Output is opt-in: `on_turn` is called after each player's turn
+    with the player's index, the player and the executed action, and
+    `on_round` is called after each round with the round number (starting at
+    1) and the game.
+
+    >>> from grasp_adventure.data.locations import simple_locations
+    >>> from grasp_adventure.v5.game_factory import GameFactory
+    >>> game = GameFactory().create_game(simple_locations, ["Alice", "Bob"])
+    >>> statistics = Simulation(game).run(10)
+    >>> statistics.to_dict()
+    {'Alice': {'moves': 10, 'waits': 0}, 'Bob': {'moves': 10, 'waits': 0}}
+    """
+
+    def __init__(
+        self,
+        game: Game,
+        on_turn: TurnHook | None = None,
+        on_round: RoundHook | None = None,
+    ):
+        self.game = game
+        self.on_turn = on_turn
+        self.on_round = on_round
+        self.statistics = SimulationStatistics([p.name for p in game.players])
+
+    def run(self, rounds: int) -> SimulationStatistics:
+        """Play `rounds` rounds and return the accumulated statistics."""
+        players = self.game.players
+        moves, waits = self.statistics.moves, self.statistics.waits
+        on_turn, on_round = self.on_turn, self.on_round
+        first_round = self.statistics.rounds + 1
+        for round_number in range(first_round, first_round + rounds):
+            for index, player in enumerate(players):
+                old_location = player.location
+                action = player.take_turn()
+                if player.location == old_location:
+                    waits[index] += 1
+                else:
+                    moves[index] += 1
+                if on_turn is not None:
+                    on_turn(index, player, action)
+            self.statistics.rounds = round_number
+            self.game.finish_round()
+            if on_round is not None:
+                on_round(round_number, self.game)
+        return self.statistics
+
+
+def print_round(round_number: int, game: Game) -> None:
+    """A round hook that renders the game like `Game.play_round()`."""
+    game.print_round_header()
+    print(game.description)
@@ -0,0 +1,118 @@
+import os
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable
+
+from .base_classes import Action
+from .game_factory import GameFactory
+from .location import LocationDescriptions
+from .player import Player
+from .simulation import Simulation
+
+Strategy = Callable[[Player], Action]
+
+
+@dataclass
+class StrategyResult:
+    """Accumulated results of all players that used one strategy."""
+
+    games: int = 0
+    moves: int = 0
+    waits: int = 0
+    locations_visited: int = 0
+
+    @property
+    def mean_locations_visited(self) -> float:
+        return self.locations_visited / self.games if self.games else 0.0
+
+    def add(self, other: "StrategyResult") -> None:
+        self.games += other.games
+        self.moves += other.moves
+        self.waits += other.waits
+        self.locations_visited += other.locations_visited
+
+
+@dataclass
+class Tournament:
+    """Compare action strategies by playing many independent games.
+
+    Every game contains one player per strategy, and the players of each
+    game are seeded with `seed` and the game's index, so results do not
+    depend on how the games are distributed over worker processes as long as
+    strategies draw their random numbers from `player.rng`. Strategies have
+    to be picklable, i.e., defined at the top level of a module.
+
+    >>> from grasp_adventure.data.locations import dungeon_locations
+    >>> from grasp_adventure.v5.player import first_action_strategy
+    >>> tournament = Tournament(dungeon_locations, {"first": first_action_strategy})
+    >>> tournament.run(games=3, rounds=4, jobs=1)
+    {'first': StrategyResult(games=3, moves=12, waits=0, locations_visited=12)}
+    """
+
+    location_descriptions: LocationDescriptions
+    strategies: Mapping[str, Strategy]
+    seed: int = 0
+    games_per_task: int = field(default=16, repr=False)
+
+    def run(
+        self, games: int, rounds: int, jobs: int | None = None
+    ) -> dict[str, StrategyResult]:
+        """Play `games` games of `rounds` rounds in `jobs` worker processes.
+
+        If `jobs` is `None` or 0, one worker per CPU is used; with a single
+        job all games are played in this process.
+        """
+        jobs = jobs or os.cpu_count() or 1
+        tasks = [
+            range(start, min(start + self.games_per_task, games))
+            for start in range(0, games, self.games_per_task)
+        ]
+        play = partial(self.play_games, rounds=rounds)
+        results = {name: StrategyResult() for name in self.strategies}
+        if jobs == 1:
+            self._merge(results, map(play, tasks))
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                self._merge(results, executor.map(play, tasks))
+        return results
+
+    def play_games(self, game_indices: range, rounds: int) -> dict[str, StrategyResult]:
+        results = {name: StrategyResult() for name in self.strategies}
+        for game_index in game_indices:
+            self._merge(results, [self.play_game(game_index, rounds)])
+        return results
+
+    def play_game(self, game_index: int, rounds: int) -> dict[str, StrategyResult]:
+        """Play the game with index `game_index` and return its results."""
+        names = list(self.strategies)
+        game = GameFactory().create_game(
+            self.location_descriptions, names, seed=self.seed * 2**32 + game_index
+        )
+        for player in game.players:
+            player.select_action = self.strategies[player.name]
+        visited = [{player.location.name} for player in game.players]
+
+        def record_location(index: int, player: Player, _action: Action) -> None:
+            visited[index].add(player.location.name)
+
+        statistics = Simulation(game, on_turn=record_location).run(rounds)
+        return {
+            name: StrategyResult(
+                games=1,
+                moves=statistics.moves[index],
+                waits=statistics.waits[index],
+                locations_visited=len(visited[index]),
+            )
+            for index, name in enumerate(names)
+        }
+
+    @staticmethod
+    def _merge(
+        results: dict[str, StrategyResult],
+        other_results: Iterable[dict[str, StrategyResult]],
+    ) -> None:
+        for other in other_results:
+            for name, result in other.items():
+                results[name].add(result)
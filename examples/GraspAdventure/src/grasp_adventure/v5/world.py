@@ -1,12 +1,52 @@
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from os import PathLike
 
-from .location import Location
+from .compact_world import CompactWorld
+from .location import Location, Topology
+from .reachability import ReachabilityIndex
+
+# A breadth-first search tree: maps each reachable location name to its
+# distance from the root and the name of its predecessor on a shortest path.
+SearchTree = dict[str, tuple[int, str | None]]
 
 
 @dataclass
 class World:
+    """The locations of a game.
+
+    The caches of the world are invalidated when the connections of its
+    locations change. The locations therefore share a `Topology`, which is
+    set when the world is created; locations must not be added later.
+    """
+
     locations: dict[str, Location]
     initial_location_name: str
+    max_cached_search_trees: int = field(default=256, repr=False, compare=False)
+    _search_trees: "OrderedDict[str, SearchTree]" = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    _search_trees_version: int = field(
+        default=-1, init=False, repr=False, compare=False
+    )
+    _reachability: ReachabilityIndex | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _reachability_version: int = field(
+        default=-1, init=False, repr=False, compare=False
+    )
+    topology: Topology = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Locations that are shared with another world keep its topology, so
+        # that changes through either world invalidate the caches of both.
+        self.topology = Topology()
+        for location in self.locations.values():
+            if location.topology is not None:
+                self.topology = location.topology
+                break
+        for location in self.locations.values():
+            location.topology = self.topology
 
     def __getitem__(self, location_name: str):
         """Get a location by name."""
@@ -19,3 +59,152 @@ class World:
     @property
     def description(self):
         return "Nothing noteworthy is happening in the world."
+
+    @staticmethod
+    def load_snapshot(path: str | PathLike[str]) -> CompactWorld:
+        """Load a world from a snapshot file written by `save_snapshot()`.
+
+        The file is memory-mapped and decoded lazily, so loading takes constant
+        time, and processes that load the same snapshot share its pages. The
+        result is an immutable `CompactWorld`."""
+        return CompactWorld.load_snapshot(path)
+
+    def save_snapshot(self, path: str | PathLike[str]) -> None:
+        """Write this world to a compact binary snapshot file."""
+        CompactWorld.from_world(self).save_snapshot(path)
+
+    @property
+    def reachability(self) -> ReachabilityIndex:
+        """The strongly connected components of this world.
+
+        The index is computed on first use and recomputed after connections
+        of this world's locations have changed, unless they were added with
+        `connect()`. Other worlds and locations do not affect it."""
+        if (
+            self._reachability is None
+            or self._reachability_version != self.topology.version
+        ):
+            self._reachability = ReachabilityIndex(self.locations)
+            self._reachability_version = self.topology.version
+        return self._reachability
+
+    def can_reach(self, start: str, goal: str) -> bool:
+        """Check whether `goal` can be reached from `start`.
+
+        >>> from grasp_adventure.data.locations import simple_locations
+        >>> from grasp_adventure.v5.game_factory import GameFactory
+        >>> world = GameFactory().create_world(simple_locations)
+        >>> world.can_reach("Room 2", "Room 1")
+        True
+        """
+        return self.reachability.can_reach(start, goal)
+
+    def unreachable_locations(self) -> list[Location]:
+        """Return the locations that cannot be reached from the initial
+        location."""
+        index = self.reachability
+        reachable = index.reachable_components(
+            index.component(self.initial_location_name)
+        )
+        return [
+            location
+            for name, location in self.locations.items()
+            if index.component(name) not in reachable
+        ]
+
+    def connect(self, source: str, direction: str, target: str) -> None:
+        """Connect the location `source` to `target` in `direction`.
+
+        Unlike changing the connections of the locations directly, this keeps
+        the reachability index up to date without recomputing it if the new
+        connection does not merge components."""
+        index = self._reachability
+        index_is_current = (
+            index is not None and self._reachability_version == self.topology.version
+        )
+        source_location = self[source]
+        is_new_connection = source_location[direction] is None
+        source_location.connect(direction, self[target])
+        if (
+            index_is_current
+            and is_new_connection
+            and index.add_connection(source, target)
+        ):
+            self._reachability_version = self.topology.version
+
+    def shortest_path(self, start: str, goal: str) -> list[Location] | None:
+        """Return the locations on a shortest path from `start` to `goal`.
+
+        The path includes both `start` and `goal`. Returns `None` if `goal`
+        cannot be reached from `start`.
+
+        >>> from grasp_adventure.data.locations import dungeon_locations
+        >>> from grasp_adventure.v5.game_factory import GameFactory
+        >>> world = GameFactory().create_world(dungeon_locations)
+        >>> path = world.shortest_path("Vestibule", "Treasure Chamber")
+        >>> [location.name for location in path]
+        ['Vestibule', 'Entrance Hall', 'Dark Corridor', 'Treasure Chamber']
+        """
+        tree = self._search_tree(start)
+        if goal not in tree:
+            self._check_location_name(goal)
+            return None
+        path = []
+        name: str | None = goal
+        while name is not None:
+            path.append(self[name])
+            name = tree[name][1]
+        path.reverse()
+        return path
+
+    def distance(self, start: str, goal: str) -> int | None:
+        """Return the number of moves needed to get from `start` to `goal`.
+
+        Returns `None` if `goal` cannot be reached from `start`.
+
+        >>> from grasp_adventure.data.locations import simple_locations
+        >>> from grasp_adventure.v5.game_factory import GameFactory
+        >>> world = GameFactory().create_world(simple_locations)
+        >>> world.distance("Room 1", "Room 2")
+        1
+        """
+        entry = self._search_tree(start).get(goal)
+        if entry is None:
+            self._check_location_name(goal)
+            return None
+        return entry[0]
+
+    def _search_tree(self, start: str) -> SearchTree:
+        """Return the (cached) breadth-first search tree rooted at `start`.
+
+        The cache keeps the trees of the most recently used start locations
+        and is cleared when the connections of any location change.
+        """
+        if self._search_trees_version != self.topology.version:
+            self._search_trees.clear()
+            self._search_trees_version = self.topology.version
+        tree = self._search_trees.get(start)
+        if tree is None:
+            tree = self._compute_search_tree(start)
+            self._search_trees[start] = tree
+            if len(self._search_trees) > self.max_cached_search_trees:
+                self._search_trees.popitem(last=False)
+        else:
+            self._search_trees.move_to_end(start)
+        return tree
+
+    def _check_location_name(self, location_name: str) -> None:
+        if location_name not in self.locations:
+            raise KeyError(location_name)
+
+    def _compute_search_tree(self, start: str) -> SearchTree:
+        tree: SearchTree = {start: (0, None)}
+        queue = deque([self[start]])
+        while queue:
+            location = queue.popleft()
+            distance = tree[location.name][0] + 1
+            for neighbor in location.connections.values():
+                if neighbor.name not in tree:
+                    tree[neighbor.name] = (distance, location.name)
+                    queue.append(neighbor)
+        return tree
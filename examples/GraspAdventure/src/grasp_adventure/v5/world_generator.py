@@ -0,0 +1,156 @@
+"""Seeded generators for large worlds.
+
+The generators yield location descriptions in the schema of
+`grasp_adventure.data.locations` one at a time, so they can be passed to
+`GameFactory.create_world()` without building a list of all descriptions.
+Connections may refer to locations that are yielded later.
+"""
+
+from array import array
+from collections.abc import Iterator
+from random import Random
+
+from .location import LocationDescription
+
+
+def location_name(index: int) -> str:
+    return f"Room {index}"
+
+
+def grid_locations(width: int, height: int) -> Iterator[LocationDescription]:
+    """Yield a `width` x `height` grid of rooms, row by row from the north.
+
+    >>> [data["connections"] for data in grid_locations(2, 1)]
+    [{'east': 'Room 1'}, {'west': 'Room 0'}]
+    """
+    _check_size(width, height)
+    for row in range(height):
+        for column in range(width):
+            index = row * width + column
+            connections = {}
+            if row > 0:
+                connections["north"] = location_name(index - width)
+            if row < height - 1:
+                connections["south"] = location_name(index + width)
+            if column < width - 1:
+                connections["east"] = location_name(index + 1)
+            if column > 0:
+                connections["west"] = location_name(index - 1)
+            yield _description(index, connections, f"row {row}, column {column}")
+
+
+def maze_locations(
+    width: int, height: int, seed: int = 0
+) -> Iterator[LocationDescription]:
+    """Yield a maze of `width` x `height` rooms, row by row from the north.
+
+    The maze is a spanning tree of the grid, i.e., there is exactly one path
+    between any two rooms. It is generated with the sidewinder algorithm,
+    which only needs to remember two rows at a time.
+
+    >>> from grasp_adventure.v5.game_factory import GameFactory
+    >>> world = GameFactory().create_world(maze_locations(30, 20, seed=1))
+    >>> len(world.locations), world.distance("Room 0", "Room 599") is not None
+    (600, True)
+    """
+    _check_size(width, height)
+    rng = Random(seed)
+    # `east[c]` tells whether the room in column `c` is connected to its east
+    # neighbor, `north[c]` whether it is connected to its north neighbor.
+    east, north = _sidewinder_row(rng, width, first_row=True)
+    for row in range(height):
+        if row < height - 1:
+            next_east, next_north = _sidewinder_row(rng, width, first_row=False)
+        else:
+            next_east, next_north = None, bytearray(width)
+        for column in range(width):
+            index = row * width + column
+            connections = {}
+            if north[column]:
+                connections["north"] = location_name(index - width)
+            if next_north[column]:
+                connections["south"] = location_name(index + width)
+            if east[column]:
+                connections["east"] = location_name(index + 1)
+            if column > 0 and east[column - 1]:
+                connections["west"] = location_name(index - 1)
+            yield _description(index, connections, f"row {row}, column {column}")
+        east, north = next_east, next_north
+
+
+def random_locations(
+    num_locations: int, degree: int = 2, seed: int = 0
+) -> Iterator[LocationDescription]:
+    """Yield a random world in which all rooms can reach each other.
+
+    The north/south connections form a cycle through all rooms in random
+    order; with a `degree` of 2 or 3, random pairs of rooms are connected
+    east/west and up/down as well. Every connection leads back through the
+    opposite direction. The connections are computed upfront in arrays of
+    8 bytes per room and degree.
+
+    >>> rooms = list(random_locations(4, degree=1, seed=3))
+    >>> [data["connections"]["north"] for data in rooms]
+    ['Room 2', 'Room 3', 'Room 1', 'Room 0']
+    """
+    if num_locations < 1:
+        raise ValueError("A world needs at least one location.")
+    if not 1 <= degree <= 3:
+        raise ValueError("The degree must be 1, 2 or 3.")
+    rng = Random(seed)
+    direction_pairs = [("north", "south"), ("east", "west"), ("up", "down")]
+    neighbors: dict[str, array] = {}
+    for forward, backward in direction_pairs[:degree]:
+        order = array("I", range(num_locations))
+        rng.shuffle(order)
+        # Rooms that are their own neighbor have no connection.
+        forward_neighbors = array("I", range(num_locations))
+        backward_neighbors = array("I", range(num_locations))
+        if forward == "north":
+            # A random cycle through all rooms keeps the world connected.
+            pairs = zip(order, order[1:] + order[:1])
+        else:
+            # A random matching connects disjoint pairs of rooms.
+            pairs = zip(order[0::2], order[1::2])
+        for first, second in pairs:
+            forward_neighbors[first] = second
+            backward_neighbors[second] = first
+        neighbors[forward] = forward_neighbors
+        neighbors[backward] = backward_neighbors
+    for index in range(num_locations):
+        connections = {}
+        for direction, targets in neighbors.items():
+            target = targets[index]
+            if target != index:
+                connections[direction] = location_name(target)
+        yield _description(index, connections, f"number {index}")
+
+
+def _sidewinder_row(
+    rng: Random, width: int, first_row: bool
+) -> tuple[bytearray, bytearray]:
+    east, north = bytearray(width), bytearray(width)
+    if first_row:
+        east[: width - 1] = b"\x01" * (width - 1)
+        return east, north
+    run_start = 0
+    for column in range(width):
+        if column < width - 1 and rng.random() < 0.5:
+            east[column] = 1
+        else:
+            north[rng.randint(run_start, column)] = 1
+            run_start = column + 1
+    return east, north
+
+
+def _description(index: int, connections: dict[str, str], position: str):
+    return {
+        "name": location_name(index),
+        "description": f"Room {position}",
+        "connections": connections,
+    }
+
+
+def _check_size(width: int, height: int) -> None:
+    if width < 1 or height < 1:
+        raise ValueError("A world needs at least one location.")
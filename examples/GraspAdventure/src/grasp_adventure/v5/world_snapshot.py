@@ -0,0 +1,162 @@
+"""A compact binary file format for worlds that can be memory-mapped.
+
+A snapshot consists of a fixed-size header followed by sections that are
+aligned to 8 bytes and stored in native byte order:
+
+- the CSR offsets of the connections (`uint64[n + 1]`),
+- the offsets of the location names in the string table (`uint64[n + 1]`),
+- the offsets of the descriptions in the string table (`uint64[n + 1]`),
+- the location ids sorted by name, for name lookups (`uint32[n]`),
+- the targets of the connections (`uint32[e]`),
+- the directions of the connections (`uint8[e]`),
+- the string table, i.e., all names and descriptions encoded as UTF-8.
+
+Loading a snapshot maps the file into memory and wraps the sections in memory
+views; names and descriptions are only decoded when they are accessed.
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from collections.abc import Sequence
+from os import PathLike
+
+from .compact_world import CompactWorld, SortedNameIndex, StringTable, pack_strings
+
+MAGIC = b"GRASPWLD"
+VERSION = 1
+# Written in native byte order to detect snapshots from other platforms.
+BYTE_ORDER_MARK = 0x01020304
+HEADER = struct.Struct("=8sIIQQQQ")
+
+
+def is_snapshot(path: str | PathLike[str]) -> bool:
+    """Check whether the file at `path` starts like a world snapshot."""
+    with open(path, "rb") as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def save_snapshot(world: CompactWorld, path: str | PathLike[str]) -> None:
+    """Write `world` to a snapshot file at `path`.
+
+    The snapshot is written to a temporary file that then replaces the file
+    at `path`, so processes that have mapped the old file keep reading it."""
+    if world.is_packed:
+        names, descriptions, ids = world.names, world.descriptions, world.ids
+    else:
+        names, descriptions, ids = pack_strings(world.names, world.descriptions)
+    strings = names.data
+    sections = [
+        _section("Q", world.offsets),
+        _section("Q", names.offsets),
+        _section("Q", descriptions.offsets),
+        _section("I", ids.sorted_ids),
+        _section("I", world.targets),
+        _section("B", world.directions),
+        strings,
+    ]
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        BYTE_ORDER_MARK,
+        len(world),
+        len(world.targets),
+        ids[world.initial_location_name],
+        len(strings),
+    )
+    directory = os.path.dirname(os.path.abspath(path))
+    descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with open(descriptor, "wb") as file:
+            file.write(header)
+            file.write(bytes(_padding(len(header))))
+            for section in sections:
+                data = memoryview(section).cast("B")
+                file.write(data)
+                file.write(bytes(_padding(len(data))))
+        # `mkstemp()` creates files that only the owner can read.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temporary_path, 0o666 & ~umask)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.unlink(temporary_path)
+        raise
+
+
+def load_snapshot(path: str | PathLike[str]) -> CompactWorld:
+    """Map the snapshot file at `path` into memory and return its world."""
+    with open(path, "rb") as file:
+        mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    data = memoryview(mapped_file)
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path} is not a world snapshot.")
+    magic, version, byte_order_mark, num_locations, num_edges, initial_id, size = (
+        HEADER.unpack_from(data)
+    )
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a world snapshot.")
+    if version != VERSION or byte_order_mark != BYTE_ORDER_MARK:
+        raise ValueError(f"{path} has an unsupported version or byte order.")
+
+    section_layout = [
+        ("Q", num_locations + 1),
+        ("Q", num_locations + 1),
+        ("Q", num_locations + 1),
+        ("I", num_locations),
+        ("I", num_edges),
+        ("B", num_edges),
+        ("B", size),
+    ]
+    position = HEADER.size + _padding(HEADER.size)
+    section_sizes = [
+        length * array(typecode).itemsize for typecode, length in section_layout
+    ]
+    expected_size = position + sum(
+        num_bytes + _padding(num_bytes) for num_bytes in section_sizes
+    )
+    if len(data) != expected_size:
+        raise ValueError(
+            f"{path} has {len(data)} bytes, but its header describes a snapshot "
+            f"of {expected_size} bytes."
+        )
+
+    sections = []
+    for (typecode, _), num_bytes in zip(section_layout, section_sizes):
+        sections.append(data[position : position + num_bytes].cast(typecode))
+        position += num_bytes + _padding(num_bytes)
+    (
+        offsets,
+        name_offsets,
+        description_offsets,
+        sorted_ids,
+        targets,
+        directions,
+        strings,
+    ) = sections
+    names = StringTable(strings, name_offsets)
+    return CompactWorld(
+        names=names,
+        descriptions=StringTable(strings, description_offsets),
+        offsets=offsets,
+        directions=directions,
+        targets=targets,
+        initial_location_name=names[initial_id],
+        ids=SortedNameIndex(names, sorted_ids),
+    )
+
+
+def _section(typecode: str, values: Sequence[int]) -> array | memoryview:
+    """Return `values` as an array of `typecode`, without copying arrays and
+    memory views that already have that type."""
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    if isinstance(values, memoryview) and values.format == typecode:
+        return values
+    return array(typecode, values)
+
+
+def _padding(num_bytes: int) -> int:
+    return -num_bytes % 8
@@ -0,0 +1,21 @@
+import json
+
+from grasp_adventure.benchmark import WORLD_GENERATORS, benchmark_world, main
+
+
+def test_benchmark_world():
+    result = benchmark_world(WORLD_GENERATORS["maze"], 400, players=4, turns=40)
+
+    assert result["locations"] == 400
+    assert result["bytes_per_location"] > result["compact_bytes_per_location"] > 0
+    assert result["turns_per_second"] > 0
+
+
+def test_main_writes_results(capsys, tmp_path):
+    output = tmp_path / "results.json"
+    main(["--size", "100", "--kind", "random", "--turns", "100", "-o", str(output)])
+
+    results = json.loads(output.read_text())["results"]
+    assert list(results) == ["random"]
+    assert results["random"]["locations"] == 100
+    assert "random" in capsys.readouterr().out
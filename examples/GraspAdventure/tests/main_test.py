@@ -1,7 +1,37 @@
-from grasp_adventure.__main__ import say_hi
+import json
+
+from grasp_adventure.__main__ import main, say_hi
+from grasp_adventure.data.locations import simple_locations
 
 
 def test_main_function(capsys):
     say_hi()
     captured = capsys.readouterr()
     assert captured.out == "Hello, world!\n"
+
+
+def test_main_plays_in_world_from_snapshot(capsys, tmp_path):
+    json_path = tmp_path / "simple.json"
+    json_path.write_text(json.dumps(simple_locations))
+    snapshot_path = tmp_path / "simple.gaw"
+    main(["--world", str(json_path), "--save-snapshot", str(snapshot_path)])
+
+    main(["--world", str(snapshot_path), "--player", "Alice", "--rounds", "2"])
+
+    captured = capsys.readouterr()
+    assert "Alice at Room 2" in captured.out
+    assert captured.out.rstrip().endswith(
+        "Alice at Room 1\nNothing noteworthy is happening in the world."
+    )
+
+
+def test_main_writes_profile(capsys, tmp_path):
+    json_path = tmp_path / "simple.json"
+    json_path.write_text(json.dumps(simple_locations))
+    profile_path = tmp_path / "profile.json"
+
+    main(["--world", str(json_path), "--rounds", "3", "--profile", str(profile_path)])
+
+    profile = json.loads(profile_path.read_text())
+    assert profile["counters"]["turns"] == 3
+    assert profile["counters"]["rounds"] == 3
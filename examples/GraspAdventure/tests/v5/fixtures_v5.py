@@ -1,8 +1,9 @@
-from grasp_adventure.data.locations import simple_locations
+from grasp_adventure.data.locations import dungeon_locations, simple_locations
+from grasp_adventure.v5.game import Game
 from grasp_adventure.v5.game_objects import TreasureChest
 from grasp_adventure.v5.game_factory import GameFactory
 from grasp_adventure.v5.pawn import Pawn
-from grasp_adventure.v5.player import Player
+from grasp_adventure.v5.player import Player, random_action_strategy
 
 import pytest
 
@@ -36,3 +37,32 @@ def pawn(level):
 def player(level):
     pawn = Pawn(location=level["Room 1"])
     return Player(name="The Player", pawn=pawn)
+
+
+@pytest.fixture()
+def player_names():
+    return ["Alice", "Bob"]
+
+
+@pytest.fixture()
+def game(player_names):
+    return GameFactory().create_game(simple_locations, player_names)
+
+
+def create_random_game(
+    locations=dungeon_locations,
+    player_names=("Alice", "Bob"),
+    seed=None,
+    compact=False,
+):
+    """Create a game whose players all use `random_action_strategy`."""
+    factory = GameFactory()
+    factory.create_world(locations, compact)
+    game = Game(factory.create_players(player_names, seed), factory.world)
+    for player in game.players:
+        player.select_action = random_action_strategy
+    return game
+
+
+def location_names(game):
+    return [player.location.name for player in game.players]
@@ -0,0 +1,122 @@
+import asyncio
+
+from fixtures_v5 import *  # noqa
+from grasp_adventure.v5.actions import SKIP_TURN_ACTION
+from grasp_adventure.v5.async_game import AsyncGame, QueuedActionStrategy, play_games
+from grasp_adventure.v5.events import ActionChosen, ActionExecuted
+from grasp_adventure.v5.instrumentation import Instrumentation
+
+
+def test_play_round_with_sync_strategies(game):
+    actions = asyncio.run(AsyncGame(game).play_round())
+
+    assert [action.description for action in actions] == [
+        "move north to Room 2",
+        "move north to Room 2",
+    ]
+    assert game.players[0].location == game.world["Room 2"]
+    assert game.round_number == 1
+
+
+def test_play_round_awaits_players_concurrently(game):
+    async def slow_strategy(player):
+        await asyncio.sleep(0.2)
+        return player.actions[0]
+
+    for player in game.players:
+        player.select_action = slow_strategy
+
+    async def play():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await AsyncGame(game).play_round()
+        return loop.time() - start
+
+    assert asyncio.run(play()) < 0.35
+    assert all(player.location == game.world["Room 2"] for player in game.players)
+
+
+def test_timed_out_player_skips_turn(game):
+    async def stalled_strategy(player):
+        await asyncio.Event().wait()
+
+    game.players[0].select_action = stalled_strategy
+
+    actions = asyncio.run(AsyncGame(game, turn_timeout=0.01).play_round())
+
+    assert actions[0] is SKIP_TURN_ACTION
+    assert game.players[0].location == game.world["Room 1"]
+    assert game.players[1].location == game.world["Room 2"]
+
+
+def test_queued_action_strategy(game):
+    alice, bob = game.players
+    alice.select_action = QueuedActionStrategy()
+    bob.select_action = QueuedActionStrategy()
+
+    async def play():
+        round_ = asyncio.create_task(AsyncGame(game).play_round())
+        await asyncio.sleep(0)
+        bob.select_action.submit(0)
+        alice.select_action.submit(5)
+        return await round_
+
+    actions = asyncio.run(play())
+
+    assert actions[0] is SKIP_TURN_ACTION
+    assert bob.location == game.world["Room 2"]
+
+
+def test_play_round_publishes_chosen_actions(game):
+    chosen = []
+
+    def record(event):
+        chosen.append((event.player.name, event.action.description))
+
+    game.events.subscribe(ActionChosen, record)
+    asyncio.run(AsyncGame(game).play_round())
+
+    assert chosen == [
+        ("Alice", "move north to Room 2"),
+        ("Bob", "move north to Room 2"),
+    ]
+
+
+def test_play_round_publishes_executed_actions_in_player_order(game):
+    executed = []
+
+    async def slow_strategy(player):
+        await asyncio.sleep(0.05)
+        return player.actions[0]
+
+    def record(event):
+        executed.append(event.player.name)
+
+    game.players[0].select_action = slow_strategy
+    game.events.subscribe(ActionExecuted, record)
+    asyncio.run(AsyncGame(game).play_round())
+
+    assert executed == ["Alice", "Bob"]
+
+
+def test_play_round_records_instrumented_turns(game):
+    game.instrument(Instrumentation())
+
+    asyncio.run(AsyncGame(game).run(3))
+    summary = game.instrumentation.to_dict()
+
+    assert summary["counters"] == {
+        "turns": 6,
+        "actions_generated": 12,
+        "rounds": 3,
+    }
+
+
+def test_play_games():
+    games = [
+        GameFactory().create_game(simple_locations, [f"Player {i}"]) for i in range(50)
+    ]
+
+    asyncio.run(play_games([AsyncGame(game) for game in games], rounds=3))
+
+    assert all(game.round_number == 3 for game in games)
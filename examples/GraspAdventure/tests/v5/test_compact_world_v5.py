@@ -0,0 +1,109 @@
+from fixtures_v5 import *  # noqa
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.v5.actions import MoveAction, SkipTurnAction
+from grasp_adventure.v5.compact_world import CompactWorld, Direction
+
+
+@pytest.fixture()
+def compact_dungeon():
+    return CompactWorld.from_descriptions(dungeon_locations)
+
+
+def test_getitem(compact_dungeon):
+    location = compact_dungeon["Entrance Hall"]
+
+    assert location.name == "Entrance Hall"
+    assert location.description.startswith("You find yourself in the entrance")
+
+
+def test_getitem_raises_key_error(compact_dungeon):
+    with pytest.raises(KeyError):
+        compact_dungeon["Kitchen"]  # noqa
+
+
+def test_initial_location(compact_dungeon):
+    assert compact_dungeon.initial_location == compact_dungeon["Vestibule"]
+
+
+def test_location_directions(compact_dungeon):
+    hall = compact_dungeon["Entrance Hall"]
+
+    assert hall["west"] == compact_dungeon["Dark Corridor"]
+    assert hall["south"] == compact_dungeon["Vestibule"]
+    assert hall["north"] is None
+    assert hall["sideways"] is None
+
+
+def test_connections(compact_dungeon):
+    assert compact_dungeon["Dark Corridor"].connections == {
+        "west": compact_dungeon["Treasure Chamber"],
+        "east": compact_dungeon["Entrance Hall"],
+    }
+
+
+def test_move_actions(compact_dungeon):
+    assert compact_dungeon["Vestibule"].move_actions == (
+        MoveAction("north", compact_dungeon["Entrance Hall"]),
+    )
+    assert (
+        compact_dungeon["Vestibule"].move_actions
+        is compact_dungeon["Vestibule"].move_actions
+    )
+
+
+def test_locations_mapping(compact_dungeon):
+    assert len(compact_dungeon.locations) == 5
+    assert list(compact_dungeon.locations)[0] == "Vestibule"
+    assert compact_dungeon.locations["Vestibule"].name == "Vestibule"
+
+
+def test_from_world_matches_from_descriptions(compact_dungeon):
+    world = GameFactory().create_world(dungeon_locations)
+    compact_world = CompactWorld.from_world(world)
+
+    assert list(compact_world.names) == list(compact_dungeon.names)
+    assert compact_world.offsets == compact_dungeon.offsets
+    assert compact_world.directions == compact_dungeon.directions
+    assert compact_world.targets == compact_dungeon.targets
+
+
+def test_unknown_direction_raises_value_error():
+    with pytest.raises(ValueError):
+        CompactWorld.from_descriptions(
+            [{"name": "A", "connections": {"sideways": "A"}}]
+        )
+
+
+def test_direction_names():
+    assert Direction.from_name("North") == Direction.NORTH
+    assert str(Direction.DOWN) == "down"
+
+
+def test_game_in_compact_world():
+    factory = GameFactory()
+    world = factory.create_world(dungeon_locations, compact=True)
+    player = factory.create_player("The Hero")
+
+    assert isinstance(world, CompactWorld)
+    assert player.actions == (
+        MoveAction("north", world["Entrance Hall"]),
+        SkipTurnAction(),
+    )
+    player.take_turn()
+    assert player.location == world["Entrance Hall"]
+    assert player.description == "The Hero at Entrance Hall"
+
+
+def test_action_caches_are_bounded():
+    world = CompactWorld.from_descriptions(dungeon_locations)
+    world.max_cached_actions = 2
+
+    for name in world.names:
+        assert world[name].turn_actions
+
+    assert len(world.move_actions) == len(world.turn_actions) == 2
+    assert list(world.move_actions) == [3, 4]
+    assert world["Vestibule"].move_actions == (
+        MoveAction("north", world["Entrance Hall"]),
+    )
+    assert list(world.move_actions) == [4, 0]
@@ -0,0 +1,86 @@
+from fixtures_v5 import *  # noqa
+from grasp_adventure.v5.crowd import CrowdSimulation
+from grasp_adventure.v5.player import first_action_strategy
+from grasp_adventure.v5.world_generator import grid_locations
+
+
+def create_game(locations, num_players, compact=False):
+    names = [f"P{i}" for i in range(num_players)]
+    return create_random_game(locations, names, compact=compact)
+
+
+def test_moves_and_waits_are_equally_likely_with_one_exit():
+    game = create_game(simple_locations, 1000)
+    crowd = CrowdSimulation(game, seed=0)
+
+    crowd.run(10)
+
+    assert crowd.moves.sum() + crowd.waits.sum() == 10_000
+    assert 4700 < crowd.moves.sum() < 5300
+    assert game.round_number == 10
+
+
+def test_players_only_move_to_neighbors():
+    game = create_game(grid_locations(5, 5), 200)
+    crowd = CrowdSimulation(game, seed=1)
+
+    for _ in range(10):
+        old_names = [crowd.world.names[i] for i in crowd.location_ids]
+        crowd.step()
+        for old_name, new_id in zip(old_names, crowd.location_ids):
+            new_name = crowd.world.names[new_id]
+            neighbors = game.world[old_name].connections.values()
+            assert new_name == old_name or new_name in [n.name for n in neighbors]
+
+
+def test_sync_updates_players_and_occupancy():
+    game = create_game(grid_locations(3, 3), 50)
+    crowd = CrowdSimulation(game, seed=2)
+    crowd.run(5)
+
+    assert all(player.location.name == "Room 0" for player in game.players)
+    crowd.sync()
+
+    names = [crowd.world.names[i] for i in crowd.location_ids]
+    assert [player.location.name for player in game.players] == names
+    assert (
+        sum(
+            game.occupancy.count(location) for location in game.world.locations.values()
+        )
+        == 50
+    )
+    assert game.occupancy.count(game.world["Room 0"]) == names.count("Room 0")
+
+
+def test_other_players_take_normal_turns():
+    game = create_game(simple_locations, 3)
+    game.players[0].select_action = first_action_strategy
+    crowd = CrowdSimulation(game, seed=3)
+
+    crowd.run(3)
+
+    assert len(crowd.crowd) == 2
+    assert game.players[0].location == game.world["Room 2"]
+
+
+def test_crowd_in_compact_world():
+    game = create_game(grid_locations(4, 4), 20, compact=True)
+    crowd = CrowdSimulation(game, seed=4)
+
+    crowd.run(20)
+    crowd.sync()
+
+    assert crowd.world is game.world
+    assert [player.location.name for player in game.players] == [
+        game.world.names[i] for i in crowd.location_ids
+    ]
+
+
+def test_crowd_is_seeded():
+    results = []
+    for _ in range(2):
+        crowd = CrowdSimulation(create_game(grid_locations(4, 4), 20), seed=5)
+        crowd.run(20)
+        results.append(crowd.location_ids.tolist())
+
+    assert results[0] == results[1]
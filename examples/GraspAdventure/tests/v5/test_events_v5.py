@@ -0,0 +1,130 @@
+import gc
+
+from fixtures_v5 import *  # noqa
+from grasp_adventure.v5.actions import MoveAction
+from grasp_adventure.v5.base_classes import Action
+from grasp_adventure.v5.events import (
+    ActionChosen,
+    ActionExecuted,
+    EventBus,
+    PlayerMoved,
+    RoundFinished,
+    TurnStarted,
+)
+from grasp_adventure.v5.location import Location
+from grasp_adventure.v5.simulation import Simulation
+
+
+class EventRecorder:
+    def __init__(self):
+        self.events = []
+
+    def record(self, event):
+        self.events.append((type(event).__name__, *map(describe, event_fields(event))))
+
+
+def event_fields(event):
+    return [getattr(event, name) for name in event.__slots__]
+
+
+def describe(value):
+    if isinstance(value, (Player, Location)):
+        return value.name
+    if isinstance(value, Action):
+        return value.description
+    return value
+
+
+@pytest.fixture()
+def player_names():
+    return ["Alice"]
+
+
+@pytest.fixture()
+def recorder(game):
+    recorder = EventRecorder()
+    for event_type in [
+        TurnStarted,
+        ActionChosen,
+        ActionExecuted,
+        PlayerMoved,
+        RoundFinished,
+    ]:
+        game.events.subscribe(event_type, recorder.record)
+    return recorder
+
+
+def test_play_round_publishes_events(game, recorder, capsys):
+    game.play_round()
+
+    assert recorder.events == [
+        ("TurnStarted", "Alice"),
+        ("ActionChosen", "Alice", "move north to Room 2"),
+        ("PlayerMoved", "Alice", "Room 1", "Room 2"),
+        ("ActionExecuted", "Alice", "move north to Room 2"),
+        ("RoundFinished", game, 1),
+    ]
+
+
+def test_simulation_publishes_events(game, recorder):
+    Simulation(game).run(2)
+
+    assert [event[0] for event in recorder.events].count("PlayerMoved") == 2
+    assert recorder.events[-1] == ("RoundFinished", game, 2)
+
+
+def test_events_are_pooled(game):
+    events = []
+
+    def remember(event):
+        events.append(event)
+
+    game.events.subscribe(TurnStarted, remember)
+    game.players[0].take_turn()
+    game.players[0].take_turn()
+
+    assert events[0] is events[1]
+    assert events[0].player is None
+
+
+def test_subscribers_are_weakly_referenced(game):
+    recorder = EventRecorder()
+    game.events.subscribe(PlayerMoved, recorder.record)
+    del recorder
+    gc.collect()
+
+    game.players[0].take_turn()
+
+    assert game.events.subscribers == {}
+
+
+def test_unsubscribe(game, recorder):
+    for event_type in list(game.events.subscribers):
+        game.events.unsubscribe(event_type, recorder.record)
+
+    game.players[0].take_turn()
+
+    assert recorder.events == []
+    assert game.events.subscribers == {}
+
+
+def test_moving_a_player_directly_publishes_event(game, recorder):
+    MoveAction("north", game.world["Room 2"]).execute(game.players[0])
+
+    assert recorder.events == [("PlayerMoved", "Alice", "Room 1", "Room 2")]
+
+
+def test_nested_publishing_uses_separate_events():
+    bus = EventBus()
+    seen = []
+
+    def on_round(event):
+        seen.append(event.round_number)
+        if event.round_number == 1:
+            bus.publish(RoundFinished, None, 2)
+            seen.append(event.round_number)
+
+    bus.subscribe(RoundFinished, on_round)
+    bus.publish(RoundFinished, None, 1)
+
+    assert seen == [1, 2, 1]
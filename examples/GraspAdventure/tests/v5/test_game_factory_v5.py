@@ -1,4 +1,8 @@
+import json
+
 from fixtures_v5 import *  # noqa
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.v5.compact_world import CompactWorld
 from grasp_adventure.data.players import (
     player_list,
     players_in_simple_locations,
@@ -106,3 +110,64 @@ def testt_create_world():
     assert [p.name for p in game.players] == ["Player 1", "Player 2", "Player 3"]
     assert [p.location.name for p in game.players] == ["Room 1", "Room 2", "Room 2"]
     assert game.world.initial_location_name == "Room 1"
+
+
+def test_create_world_resolves_forward_references():
+    world = GameFactory().create_world(dungeon_locations)
+
+    assert list(world.locations) == [data["name"] for data in dungeon_locations]
+    assert world["Vestibule"]["north"] is world["Entrance Hall"]
+    assert world["Entrance Hall"].description.startswith("You find yourself")
+    assert world["Treasure Chamber"]["east"]["east"] is world["Entrance Hall"]
+
+
+def test_create_world_from_iterator():
+    world = GameFactory().create_world(iter(simple_locations))
+
+    assert world.initial_location_name == "Room 1"
+    assert world["Room 1"]["north"] is world["Room 2"]
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_create_world_with_undefined_location_raises_key_error(compact):
+    descriptions = [{"name": "Room 1", "connections": {"north": "Nowhere"}}]
+    with pytest.raises(KeyError):
+        GameFactory().create_world(descriptions, compact=compact)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_create_world_without_locations_raises_value_error(compact):
+    with pytest.raises(ValueError):
+        GameFactory().create_world([], compact=compact)
+
+
+def test_create_compact_world_resolves_forward_references():
+    world = GameFactory().create_world(iter(dungeon_locations), compact=True)
+
+    assert isinstance(world, CompactWorld)
+    assert world.initial_location_name == "Vestibule"
+    assert world["Vestibule"]["north"] == world["Entrance Hall"]
+    assert world["Treasure Chamber"]["east"]["east"] == world["Entrance Hall"]
+    assert world["Brightly Lit Corridor"].description == (
+        "You find yourself in a brightly lit corridor"
+    )
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_load_world_from_json_lines(tmp_path, compact):
+    path = tmp_path / "dungeon.jsonl"
+    path.write_text("".join(json.dumps(data) + "\n" for data in dungeon_locations))
+
+    world = GameFactory().load_world(path, compact=compact)
+
+    assert world.initial_location_name == "Vestibule"
+    assert world["Dark Corridor"]["west"] == world["Treasure Chamber"]
+
+
+def test_load_world_from_json_array(tmp_path):
+    path = tmp_path / "dungeon.json"
+    path.write_text(json.dumps(dungeon_locations))
+
+    world = GameFactory().load_world(path)
+
+    assert world.distance("Vestibule", "Treasure Chamber") == 3
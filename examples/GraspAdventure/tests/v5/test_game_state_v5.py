@@ -0,0 +1,69 @@
+from fixtures_v5 import *  # noqa
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.v5.simulation import Simulation
+
+
+@pytest.fixture()
+def game():
+    return create_random_game(seed=4)
+
+
+def test_snapshot_and_restore(game):
+    state = game.snapshot()
+    Simulation(game).run(10)
+    later_state = game.snapshot()
+    later_locations = location_names(game)
+
+    game.restore(state)
+
+    assert location_names(game) == ["Vestibule", "Vestibule"]
+    assert game.round_number == 0
+    assert game.occupancy.count(game.world["Vestibule"]) == 2
+    game.restore(later_state)
+    assert location_names(game) == later_locations
+    assert game.round_number == 10
+
+
+def test_restore_rejects_state_of_other_game(game):
+    other_game = GameFactory().create_game(dungeon_locations, ["Alice"])
+
+    with pytest.raises(ValueError):
+        game.restore(other_game.snapshot())
+
+
+def test_fork_is_independent(game):
+    Simulation(game).run(3)
+    before = location_names(game)
+
+    fork = game.fork()
+    Simulation(fork).run(20)
+
+    assert location_names(game) == before
+    assert fork.round_number == 23
+    assert game.round_number == 3
+    assert fork.world is game.world
+    assert fork.occupancy is not game.occupancy
+
+
+def test_fork_continues_like_original(game):
+    fork = game.fork()
+
+    Simulation(game).run(20)
+    Simulation(fork).run(20)
+
+    assert location_names(fork) == location_names(game)
+
+
+def test_lookahead_with_forks(game):
+    # Evaluate many hypothetical futures without changing the game.
+    state = game.snapshot()
+    fork = game.fork()
+    start = fork.snapshot()
+    reached_treasure = 0
+    for _ in range(200):
+        fork.restore(start)
+        Simulation(fork).run(5)
+        reached_treasure += fork.players[0].location.name == "Treasure Chamber"
+
+    assert game.snapshot() == state
+    assert 0 < reached_treasure < 200
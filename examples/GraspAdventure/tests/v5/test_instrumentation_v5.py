@@ -0,0 +1,74 @@
+from fixtures_v5 import *  # noqa
+from grasp_adventure.v5.actions import SKIP_TURN_ACTION
+from grasp_adventure.v5.events import PlayerMoved
+from grasp_adventure.v5.instrumentation import ENV_VARIABLE, Instrumentation
+from grasp_adventure.v5.simulation import Simulation
+
+
+def test_instrumentation_is_disabled_by_default(monkeypatch):
+    monkeypatch.delenv(ENV_VARIABLE, raising=False)
+
+    game = GameFactory().create_game(simple_locations, ["Alice", "Bob"])
+
+    assert game.instrumentation is None
+    assert all(player.instrumentation is None for player in game.players)
+
+
+@pytest.mark.parametrize("value, enabled", [("1", True), ("0", False), ("", False)])
+def test_instrumentation_from_environment(monkeypatch, value, enabled):
+    monkeypatch.setenv(ENV_VARIABLE, value)
+
+    game = GameFactory().create_game(simple_locations, ["Alice"])
+
+    assert (game.instrumentation is not None) == enabled
+    assert (game.players[0].instrumentation is not None) == enabled
+
+
+def test_instrumentation_records_turns(game):
+    game.instrument(Instrumentation())
+    game.players[1].select_action = lambda player: SKIP_TURN_ACTION
+
+    Simulation(game).run(5)
+    summary = game.instrumentation.to_dict()
+
+    assert summary["counters"] == {
+        "turns": 10,
+        "actions_generated": 20,
+        "rounds": 5,
+    }
+    assert sum(summary["strategy_latency_histogram"].values()) == 10
+    assert sum(phase["share"] for phase in summary["phases"].values()) == (
+        pytest.approx(1.0)
+    )
+    assert summary["turns_per_second"] > 0
+    assert game.players[0].location == game.world["Room 2"]
+    assert game.players[1].location == game.world["Room 1"]
+
+
+def test_instrumented_turns_publish_events(game):
+    moves = []
+
+    def record(event):
+        moves.append(event.player.name)
+
+    game.events.subscribe(PlayerMoved, record)
+    game.instrument(Instrumentation())
+    Simulation(game).run(1)
+
+    assert moves == ["Alice", "Bob"]
+
+
+def test_instrument_none_disables_instrumentation(game):
+    instrumentation = Instrumentation()
+    game.instrument(instrumentation)
+    game.instrument(None)
+
+    Simulation(game).run(1)
+
+    assert instrumentation.counters == {}
+
+
+def test_to_json_of_empty_instrumentation():
+    instrumentation = Instrumentation()
+
+    assert '"turns_per_second": 0.0' in instrumentation.to_json()
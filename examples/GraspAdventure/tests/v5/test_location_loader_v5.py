@@ -0,0 +1,65 @@
+import json
+from io import StringIO
+
+from fixtures_v5 import *  # noqa
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.v5.location_loader import read_location_descriptions
+
+
+def read_all(text, chunk_size=7):
+    return list(read_location_descriptions(StringIO(text), chunk_size=chunk_size))
+
+
+def test_read_json_lines():
+    text = "".join(json.dumps(data) + "\n" for data in dungeon_locations)
+    assert read_all(text) == dungeon_locations
+
+
+def test_read_json_array():
+    text = json.dumps(dungeon_locations, indent=2)
+    assert read_all(text) == dungeon_locations
+    assert read_all(text, chunk_size=1) == dungeon_locations
+
+
+def test_read_empty_inputs():
+    assert read_all("") == []
+    assert read_all("  \n") == []
+    assert read_all(" [ ] ") == []
+
+
+def test_read_is_lazy():
+    descriptions = read_location_descriptions(StringIO('{"name": "A"}\n{"name": '))
+    assert next(descriptions) == {"name": "A"}
+    with pytest.raises(ValueError):
+        next(descriptions)
+
+
+def test_read_unterminated_array_raises_error():
+    with pytest.raises(ValueError):
+        read_all('[{"name": "A"}')
+
+
+def test_read_missing_separator_raises_error():
+    with pytest.raises(ValueError):
+        read_all('[{"name": "A"} {"name": "B"}]')
+
+
+def test_read_non_object_raises_error():
+    with pytest.raises(ValueError):
+        read_all("[1, 2]")
+
+
+def test_read_malformed_object_raises_error_with_position_in_file():
+    lines = [json.dumps({"name": f"Room {i}"}) for i in range(100)]
+    text = "\n".join([*lines, '{"name": x}', *lines]) + "\n"
+    file = StringIO(text)
+
+    with pytest.raises(ValueError, match="line 101 column 10"):
+        list(read_location_descriptions(file, chunk_size=64))
+    assert file.tell() < len(text) // 2 + 128
+
+
+def test_read_objects_split_inside_tokens():
+    text = '{"a": true, "b": 123, "c": "text", "d": [1, 2]}'
+    for chunk_size in range(1, len(text) + 1):
+        assert read_all(text, chunk_size) == [json.loads(text)]
@@ -1,4 +1,8 @@
+import copy
+import pickle
+
 from fixtures_v5 import *  # noqa
+from grasp_adventure.v5.actions import SKIP_TURN_ACTION, MoveAction
 from grasp_adventure.v5.location import Location
 
 
@@ -17,3 +21,70 @@ def test_connections():
 
     assert room1["north"] == room2
     assert room2["south"] == room1
+
+
+def test_move_actions_are_cached():
+    world = GameFactory().create_world(simple_locations)
+    room1 = world["Room 1"]
+
+    assert room1.move_actions == (MoveAction("north", world["Room 2"]),)
+    assert room1.move_actions is room1.move_actions
+    assert room1.turn_actions == (*room1.move_actions, SKIP_TURN_ACTION)
+    assert room1.turn_actions is room1.turn_actions
+
+
+def test_move_actions_are_updated_when_connections_change():
+    world = GameFactory().create_world(simple_locations)
+    room1, room2 = world["Room 1"], world["Room 2"]
+    assert len(room1.turn_actions) == 2
+
+    room1.connect("east", room2)
+    assert room1.move_actions == (
+        MoveAction("north", room2),
+        MoveAction("east", room2),
+    )
+    assert len(room1.turn_actions) == 3
+
+    room1.disconnect("north")
+    assert room1.move_actions == (MoveAction("east", room2),)
+
+    room1.connections = {}
+    assert room1.move_actions == ()
+    assert room1.turn_actions == (SKIP_TURN_ACTION,)
+
+
+def test_move_actions_are_updated_when_connections_change_in_place():
+    world = GameFactory().create_world(simple_locations)
+    room1, room2 = world["Room 1"], world["Room 2"]
+    assert len(room1.turn_actions) == 2
+
+    room1.connections["east"] = room2
+    assert room1.move_actions == (
+        MoveAction("north", room2),
+        MoveAction("east", room2),
+    )
+
+    room1.connections.pop("north")
+    room1.connections.update(west=room2)
+    assert room1.move_actions == (
+        MoveAction("east", room2),
+        MoveAction("west", room2),
+    )
+
+    room1.connections.clear()
+    assert room1.turn_actions == (SKIP_TURN_ACTION,)
+
+
+@pytest.mark.parametrize(
+    "copy_world", [copy.deepcopy, lambda world: pickle.loads(pickle.dumps(world))]
+)
+def test_copied_locations_report_changes(copy_world):
+    world = GameFactory().create_world(simple_locations)
+    copied_world = copy_world(world)
+    room1, room2 = copied_world["Room 1"], copied_world["Room 2"]
+
+    room1.connections["east"] = room2
+
+    assert room1["north"] is room2
+    assert room1.move_actions[-1] == MoveAction("east", room2)
+    assert world["Room 1"]["east"] is None
@@ -0,0 +1,69 @@
+from fixtures_v5 import *  # noqa
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.data.objects import object_descriptions
+from grasp_adventure.v5.game_objects import OBJECT_CLASSES, Torch
+from grasp_adventure.v5.object_pool import LazyObjects, ObjectPool
+
+
+@pytest.fixture()
+def pool():
+    return ObjectPool(object_descriptions, OBJECT_CLASSES)
+
+
+def test_stateless_objects_are_shared_per_class(pool):
+    pool.object_descriptions = {
+        **object_descriptions,
+        "Old Torch": {"class_name": "Torch"},
+    }
+
+    assert pool.create("Torch") is pool.create("Old Torch")
+    assert pool.flyweights == {"Torch": pool.create("Torch")}
+
+
+def test_stateful_objects_are_not_shared(pool):
+    first_chest = pool.create("Treasure Chest")
+    second_chest = pool.create("Treasure Chest")
+    first_chest.gold = 0
+
+    assert second_chest.gold == 200
+
+
+def test_lazy_objects_are_created_on_first_access(pool):
+    objects = LazyObjects(pool, ["Torch", "Treasure Chest"])
+
+    assert len(objects) == 2
+    assert not objects.is_created
+    assert [str(obj) for obj in objects] == ["a torch", "a treasure chest"]
+    assert objects.is_created
+    assert objects[0] is objects[0]
+
+
+def test_factory_wires_objects_to_locations():
+    factory = GameFactory(object_descriptions, OBJECT_CLASSES)
+    world = factory.create_world(dungeon_locations)
+    corridor = world["Brightly Lit Corridor"]
+
+    assert not corridor.objects.is_created
+    assert isinstance(corridor.objects[0], Torch)
+    assert world["Treasure Chamber"].objects[0].gold == 200
+    assert world["Vestibule"].objects == ()
+    assert factory.object_pool.flyweights == {"Torch": corridor.objects[0]}
+
+
+def test_inspect_actions():
+    factory = GameFactory(object_descriptions, OBJECT_CLASSES)
+    world = factory.create_world(dungeon_locations)
+
+    actions = world["Treasure Chamber"].inspect_actions
+
+    assert [action.description for action in actions] == ["inspect a treasure chest"]
+    assert world["Vestibule"].inspect_actions == ()
+
+
+def test_objects_without_description_are_left_out():
+    factory = GameFactory({}, {})
+    world = factory.create_world(dungeon_locations)
+    corridor = world["Brightly Lit Corridor"]
+
+    assert corridor.objects == ()
+    assert corridor.inspect_actions == ()
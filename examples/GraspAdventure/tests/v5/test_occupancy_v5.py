@@ -0,0 +1,81 @@
+from fixtures_v5 import *  # noqa
+from grasp_adventure.v5.actions import SKIP_TURN_ACTION
+from grasp_adventure.v5.occupancy import OccupancyIndex
+from grasp_adventure.v5.simulation import Simulation
+
+
+@pytest.fixture()
+def player_names():
+    return ["Alice", "Bob", "Carol"]
+
+
+def names(players):
+    return [player.name for player in players]
+
+
+def test_index_contains_initial_locations(game):
+    room_1 = game.world["Room 1"]
+
+    assert names(game.occupancy.players_at(room_1)) == ["Alice", "Bob", "Carol"]
+    assert game.occupancy.count(room_1) == 3
+    assert game.occupancy.count(game.world["Room 2"]) == 0
+    assert not game.occupancy.is_occupied(game.world["Room 2"])
+
+
+def test_moves_update_index(game):
+    alice, bob, carol = game.players
+    bob.select_action = lambda player: SKIP_TURN_ACTION
+
+    game.play_round()
+
+    assert names(game.occupancy.players_at(game.world["Room 1"])) == ["Bob"]
+    assert names(game.occupancy.players_at(game.world["Room 2"])) == [
+        "Alice",
+        "Carol",
+    ]
+
+
+def test_index_matches_locations_after_simulation(game):
+    Simulation(game).run(7)
+
+    for location in game.world.locations.values():
+        assert names(game.occupancy.players_at(location)) == [
+            player.name for player in game.players if player.location == location
+        ]
+
+
+def test_players_near(game):
+    alice = game.players[0]
+    alice.take_turn()
+
+    near_room_1 = game.occupancy.players_near(game.world["Room 1"])
+    near_room_2 = game.occupancy.players_near(game.world["Room 2"])
+
+    assert {d: names(players) for d, players in near_room_1.items()} == {
+        "north": ["Alice"]
+    }
+    assert {d: names(players) for d, players in near_room_2.items()} == {
+        "south": ["Bob", "Carol"]
+    }
+
+
+def test_remove_player(game):
+    alice = game.players[0]
+    game.occupancy.remove(alice)
+    alice.take_turn()
+
+    assert alice.occupancy is None
+    assert game.occupancy.count(game.world["Room 2"]) == 0
+    assert names(game.occupancy.players_at(game.world["Room 1"])) == ["Bob", "Carol"]
+
+
+def test_index_for_compact_world():
+    factory = GameFactory()
+    factory.create_world(simple_locations, compact=True)
+    players = factory.create_players(["Alice", "Bob"])
+    index = OccupancyIndex(players)
+
+    players[0].take_turn()
+
+    assert names(index.players_at(factory.world["Room 2"])) == ["Alice"]
+    assert names(index.players_at(factory.world["Room 1"])) == ["Bob"]
@@ -5,4 +5,4 @@ from fixtures_v5 import *  # noqa
 def test_actions(pawn, level):
     actions = pawn.actions
 
-    assert actions == [MoveAction("north", level["Room 2"])]
+    assert actions == (MoveAction("north", level["Room 2"]),)
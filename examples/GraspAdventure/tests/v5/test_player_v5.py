@@ -1,4 +1,4 @@
-from grasp_adventure.v5.actions import MoveAction, SkipTurnAction
+from grasp_adventure.v5.actions import SKIP_TURN_ACTION, MoveAction, SkipTurnAction
 from fixtures_v5 import *  # noqa
 
 
@@ -9,7 +9,12 @@ def test_player_location(player, level):
 def test_actions(player, level):
     actions = player.actions
 
-    assert actions == [MoveAction("north", level["Room 2"]), SkipTurnAction()]
+    assert actions == (MoveAction("north", level["Room 2"]), SkipTurnAction())
+
+
+def test_actions_are_shared_between_turns(player, level):
+    assert player.actions is player.actions
+    assert player.actions[-1] is SKIP_TURN_ACTION
 
 
 def test_select_action(player, level):
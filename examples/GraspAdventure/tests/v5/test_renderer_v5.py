@@ -0,0 +1,54 @@
+from fixtures_v5 import *  # noqa
+from grasp_adventure.v5.actions import SKIP_TURN_ACTION
+from grasp_adventure.v5.renderer import IncrementalRenderer
+from grasp_adventure.v5.simulation import Simulation
+
+
+@pytest.fixture()
+def player_names():
+    return ["Alice", "Bob", "Carol"]
+
+
+def test_render_matches_game_description(game):
+    renderer = IncrementalRenderer(game)
+
+    for _ in range(3):
+        assert renderer.render() == game.description
+        Simulation(game).run(1)
+    assert renderer.render() == game.description
+
+
+def test_render_changes_contains_only_moved_players(game):
+    renderer = IncrementalRenderer(game)
+    game.players[1].select_action = lambda player: SKIP_TURN_ACTION
+
+    Simulation(game).run(1)
+
+    assert renderer.render_changes() == [(0, "Alice at Room 2"), (2, "Carol at Room 2")]
+    assert renderer.render_changes() == []
+
+
+def test_moves_back_and_forth_are_not_changes(game):
+    renderer = IncrementalRenderer(game)
+    alice = game.players[0]
+
+    alice.location = game.world["Room 2"]
+    alice.location = game.world["Room 1"]
+
+    assert renderer.render_changes() == []
+
+
+def test_render_reuses_text_without_changes(game):
+    renderer = IncrementalRenderer(game)
+
+    assert renderer.render() is renderer.render()
+
+
+def test_close_stops_tracking(game):
+    renderer = IncrementalRenderer(game)
+    renderer.close()
+
+    Simulation(game).run(1)
+
+    assert renderer.render_changes() == []
+    assert game.events.subscribers == {}
@@ -0,0 +1,107 @@
+import asyncio
+
+from fixtures_v5 import *  # noqa
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.v5.actions import SKIP_TURN_ACTION
+from grasp_adventure.v5.async_game import AsyncGame
+from grasp_adventure.v5.replay import (
+    SKIP,
+    ReplayLog,
+    ReplayRecorder,
+    encode_action,
+    fast_forward,
+)
+from grasp_adventure.v5.simulation import Simulation
+
+
+def test_seeded_players_are_reproducible():
+    first_game, second_game = create_random_game(seed=1), create_random_game(seed=1)
+
+    visited = []
+    for game in [first_game, second_game]:
+        Simulation(game, on_turn=lambda *_: visited.append(location_names(game))).run(
+            20
+        )
+
+    assert visited[:40] == visited[40:]
+
+
+def test_players_have_independent_random_number_generators():
+    game = create_random_game(seed=1)
+    alice, bob = game.players
+
+    assert alice.rng.random() != bob.rng.random()
+
+
+def test_fast_forward_restores_recorded_locations():
+    game = create_random_game(seed=2)
+    recorder = ReplayRecorder(game, seed=2)
+    history = []
+    Simulation(game, on_round=lambda *_: history.append(location_names(game))).run(50)
+
+    replayed_game = create_random_game()
+    for round_number in [50, 17, 1]:
+        fast_forward(replayed_game, recorder.log, round_number)
+        assert location_names(replayed_game) == history[round_number - 1]
+        assert replayed_game.round_number == round_number
+    fast_forward(replayed_game, recorder.log, 0)
+    assert location_names(replayed_game) == recorder.log.start_location_names
+
+
+def test_recorder_keeps_player_order_in_async_game():
+    game = GameFactory().create_game(dungeon_locations, ["Alice", "Bob"])
+
+    async def slow_first_action_strategy(player):
+        await asyncio.sleep(0.01)
+        return player.actions[0]
+
+    game.players[0].select_action = slow_first_action_strategy
+    game.players[1].select_action = lambda player: SKIP_TURN_ACTION
+    recorder = ReplayRecorder(game)
+    asyncio.run(AsyncGame(game).run(2))
+
+    assert list(recorder.log.turns) == [0, SKIP, 0, SKIP]
+    replayed_game = GameFactory().create_game(dungeon_locations, ["Alice", "Bob"])
+    fast_forward(replayed_game, recorder.log, 2)
+    assert location_names(replayed_game) == location_names(game)
+
+
+def test_save_and_load(tmp_path):
+    game = create_random_game(seed=3)
+    recorder = ReplayRecorder(game, seed=3)
+    Simulation(game).run(10)
+    path = tmp_path / "game.replay"
+
+    recorder.log.save(path)
+    log = ReplayLog.load(path)
+
+    assert log == recorder.log
+    assert log.rounds == 10
+    assert path.stat().st_size < 100 + 20
+
+
+def test_recorder_close_stops_recording():
+    game = create_random_game()
+    recorder = ReplayRecorder(game)
+    Simulation(game).run(1)
+    recorder.close()
+    Simulation(game).run(1)
+
+    assert recorder.log.rounds == 1
+
+
+def test_encode_action():
+    game = GameFactory().create_game(simple_locations, ["Alice"])
+    location = game.world["Room 1"]
+
+    assert encode_action(location, location.move_actions[0]) == 0
+    assert encode_action(location, SKIP_TURN_ACTION) == SKIP
+
+
+def test_fast_forward_checks_rounds_and_players():
+    log = ReplayLog(["Alice", "Bob"], ["Vestibule"] * 2)
+
+    with pytest.raises(ValueError):
+        fast_forward(create_random_game(), log, 1)
+    with pytest.raises(ValueError):
+        fast_forward(GameFactory().create_game(dungeon_locations, ["Alice"]), log, 0)
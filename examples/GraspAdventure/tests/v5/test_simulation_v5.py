@@ -0,0 +1,68 @@
+from fixtures_v5 import *  # noqa
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.v5.actions import SkipTurnAction
+from grasp_adventure.v5.game import Game
+from grasp_adventure.v5.simulation import Simulation, print_round
+
+
+def test_run_collects_statistics(game):
+    game.players[1].select_action = lambda player: SkipTurnAction()
+
+    statistics = Simulation(game).run(5)
+
+    assert statistics.rounds == 5
+    assert statistics.turns == 10
+    assert list(statistics.moves) == [5, 0]
+    assert list(statistics.waits) == [0, 5]
+    assert game.players[0].location == game.world["Room 2"]
+    assert game.players[1].location == game.world["Room 1"]
+
+
+def test_run_accumulates_rounds(game):
+    simulation = Simulation(game)
+    simulation.run(2)
+    statistics = simulation.run(3)
+
+    assert statistics.rounds == 5
+    assert list(statistics.moves) == [5, 5]
+
+
+def test_run_produces_no_output(game, capsys):
+    Simulation(game).run(10)
+
+    assert capsys.readouterr().out == ""
+
+
+def test_hooks_are_called(game):
+    turns, rounds = [], []
+    simulation = Simulation(
+        game,
+        on_turn=lambda index, player, action: turns.append((index, action)),
+        on_round=lambda round_number, _: rounds.append(round_number),
+    )
+
+    simulation.run(2)
+
+    assert [index for index, _ in turns] == [0, 1, 0, 1]
+    assert turns[0][1].description == "move north to Room 2"
+    assert rounds == [1, 2]
+
+
+def test_print_round_renders_like_play_round(game, capsys):
+    Simulation(game, on_round=print_round).run(1)
+    simulation_output = capsys.readouterr().out
+
+    other_game = GameFactory().create_game(simple_locations, ["Alice", "Bob"])
+    other_game.play_round()
+
+    assert simulation_output == capsys.readouterr().out
+
+
+def test_run_in_compact_world():
+    factory = GameFactory()
+    factory.create_world(dungeon_locations, compact=True)
+    game = Game(factory.create_players(["Alice"]), factory.world)
+
+    statistics = Simulation(game).run(4)
+
+    assert list(statistics.moves) == [4]
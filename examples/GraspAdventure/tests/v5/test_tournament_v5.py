@@ -0,0 +1,55 @@
+import random
+
+from fixtures_v5 import *  # noqa
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.v5.player import first_action_strategy, random_action_strategy
+from grasp_adventure.v5.tournament import StrategyResult, Tournament
+
+
+@pytest.fixture()
+def tournament():
+    return Tournament(
+        dungeon_locations,
+        {"first": first_action_strategy, "random": random_action_strategy},
+        seed=42,
+        games_per_task=3,
+    )
+
+
+def test_run_plays_all_games(tournament):
+    results = tournament.run(games=10, rounds=5, jobs=1)
+
+    assert list(results) == ["first", "random"]
+    assert results["first"] == StrategyResult(
+        games=10, moves=50, waits=0, locations_visited=40
+    )
+    assert results["random"].games == 10
+    assert results["random"].moves + results["random"].waits == 50
+
+
+def test_run_is_deterministic(tournament):
+    assert tournament.run(games=10, rounds=20, jobs=1) == tournament.run(
+        games=10, rounds=20, jobs=1
+    )
+
+
+def test_run_in_parallel_matches_sequential_run(tournament):
+    sequential_results = tournament.run(games=10, rounds=20, jobs=1)
+    parallel_results = tournament.run(games=10, rounds=20, jobs=2)
+
+    assert parallel_results == sequential_results
+
+
+def test_run_does_not_reseed_the_global_random_generator(tournament):
+    random.seed(1)
+    expected = random.random()
+    random.seed(1)
+    tournament.run(games=4, rounds=5, jobs=1)
+
+    assert random.random() == expected
+
+
+def test_mean_locations_visited():
+    result = StrategyResult(games=4, locations_visited=10)
+    assert result.mean_locations_visited == 2.5
+    assert StrategyResult().mean_locations_visited == 0.0
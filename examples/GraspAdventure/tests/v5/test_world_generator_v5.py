@@ -0,0 +1,93 @@
+from itertools import islice
+
+from fixtures_v5 import *  # noqa
+from grasp_adventure.v5.world_generator import (
+    grid_locations,
+    maze_locations,
+    random_locations,
+)
+
+OPPOSITE_DIRECTIONS = {
+    "north": "south",
+    "south": "north",
+    "east": "west",
+    "west": "east",
+    "up": "down",
+    "down": "up",
+}
+
+
+def assert_connections_are_symmetric(descriptions):
+    connections = {data["name"]: data["connections"] for data in descriptions}
+    for name, exits in connections.items():
+        for direction, target in exits.items():
+            assert connections[target][OPPOSITE_DIRECTIONS[direction]] == name
+
+
+def num_connections(descriptions):
+    return sum(len(data["connections"]) for data in descriptions)
+
+
+def test_grid_locations():
+    descriptions = list(grid_locations(4, 3))
+
+    assert len(descriptions) == 12
+    assert descriptions[5]["connections"] == {
+        "north": "Room 1",
+        "south": "Room 9",
+        "east": "Room 6",
+        "west": "Room 4",
+    }
+    assert_connections_are_symmetric(descriptions)
+
+
+@pytest.mark.parametrize("width, height", [(1, 1), (1, 7), (7, 1), (20, 30)])
+def test_maze_is_spanning_tree(width, height):
+    descriptions = list(maze_locations(width, height, seed=5))
+    world = GameFactory().create_world(descriptions)
+
+    assert len(descriptions) == width * height
+    # A spanning tree has one connection less than locations, in both
+    # directions.
+    assert num_connections(descriptions) == 2 * (width * height - 1)
+    assert_connections_are_symmetric(descriptions)
+    last_room = f"Room {width * height - 1}"
+    assert world.distance("Room 0", last_room) is not None
+
+
+@pytest.mark.parametrize("degree", [1, 2, 3])
+def test_random_locations_are_connected(degree):
+    descriptions = list(random_locations(101, degree, seed=7))
+    world = GameFactory().create_world(descriptions)
+
+    assert_connections_are_symmetric(descriptions)
+    assert all(
+        world.distance("Room 0", data["name"]) is not None for data in descriptions
+    )
+    assert num_connections(descriptions) == 2 * (101 + (degree - 1) * 50)
+
+
+def test_generators_are_seeded():
+    assert list(maze_locations(10, 10, seed=1)) == list(maze_locations(10, 10, seed=1))
+    assert list(maze_locations(10, 10, seed=1)) != list(maze_locations(10, 10, seed=2))
+    assert list(random_locations(50, seed=1)) == list(random_locations(50, seed=1))
+
+
+def test_generators_are_lazy():
+    rooms = list(islice(maze_locations(10**5, 10**5), 3))
+
+    assert [data["name"] for data in rooms] == ["Room 0", "Room 1", "Room 2"]
+
+
+def test_generators_reject_invalid_sizes():
+    with pytest.raises(ValueError):
+        next(grid_locations(0, 5))
+    with pytest.raises(ValueError):
+        next(random_locations(10, degree=4))
+
+
+def test_compact_world_from_generator():
+    world = GameFactory().create_world(grid_locations(10, 10), compact=True)
+
+    assert len(world) == 100
+    assert world["Room 11"]["north"].name == "Room 1"
@@ -0,0 +1,156 @@
+from fixtures_v5 import *  # noqa
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.v5.compact_world import CompactWorld
+from grasp_adventure.v5 import world_snapshot
+from grasp_adventure.v5.world import World
+from grasp_adventure.v5.world_snapshot import is_snapshot
+
+
+@pytest.fixture()
+def snapshot_path(tmp_path):
+    path = tmp_path / "dungeon.gaw"
+    GameFactory().create_world(dungeon_locations).save_snapshot(path)
+    return path
+
+
+def test_is_snapshot(snapshot_path, tmp_path):
+    other_path = tmp_path / "dungeon.json"
+    other_path.write_text("[]")
+
+    assert is_snapshot(snapshot_path)
+    assert not is_snapshot(other_path)
+
+
+def test_load_snapshot(snapshot_path):
+    world = World.load_snapshot(snapshot_path)
+
+    assert isinstance(world, CompactWorld)
+    assert len(world) == 5
+    assert world.initial_location_name == "Vestibule"
+    assert list(world.names) == [data["name"] for data in dungeon_locations]
+    assert world["Treasure Chamber"].description.startswith("Invaluable treasures")
+
+
+def test_snapshot_preserves_connections(snapshot_path):
+    world = World.load_snapshot(snapshot_path)
+    original = CompactWorld.from_descriptions(dungeon_locations)
+
+    for name in original.names:
+        assert {
+            direction: location.name
+            for direction, location in world[name].connections.items()
+        } == {
+            direction: location.name
+            for direction, location in original[name].connections.items()
+        }
+
+
+def test_name_lookup_in_snapshot(snapshot_path):
+    world = World.load_snapshot(snapshot_path)
+
+    assert sorted(world.ids) == sorted(data["name"] for data in dungeon_locations)
+    assert world.ids["Dark Corridor"] == 2
+    assert "Kitchen" not in world.ids
+    with pytest.raises(KeyError):
+        world["Kitchen"]  # noqa
+
+
+def test_compact_world_snapshot_round_trip(snapshot_path, tmp_path):
+    path = tmp_path / "copy.gaw"
+    World.load_snapshot(snapshot_path).save_snapshot(path)
+
+    assert path.read_bytes() == snapshot_path.read_bytes()
+
+
+def test_save_snapshot_keeps_mapped_snapshot_readable(snapshot_path):
+    world = World.load_snapshot(snapshot_path)
+
+    GameFactory().create_world(simple_locations).save_snapshot(snapshot_path)
+
+    assert world["Treasure Chamber"].connections == {"east": world["Dark Corridor"]}
+    assert list(World.load_snapshot(snapshot_path).names) == ["Room 1", "Room 2"]
+    assert [path.name for path in snapshot_path.parent.iterdir()] == ["dungeon.gaw"]
+
+
+def test_save_packed_world_writes_its_string_table(
+    snapshot_path, tmp_path, monkeypatch
+):
+    packed_worlds = [
+        CompactWorld.from_descriptions(dungeon_locations),
+        World.load_snapshot(snapshot_path),
+    ]
+
+    def fail(*args):
+        raise AssertionError("packed strings are packed again")
+
+    monkeypatch.setattr(world_snapshot, "pack_strings", fail)
+    for index, world in enumerate(packed_worlds):
+        assert world.is_packed
+        path = tmp_path / f"copy{index}.gaw"
+        world.save_snapshot(path)
+        assert path.read_bytes() == snapshot_path.read_bytes()
+
+
+def test_save_unpacked_world(snapshot_path, tmp_path):
+    world = World.load_snapshot(snapshot_path)
+    unpacked_world = CompactWorld(
+        names=list(world.names),
+        descriptions=list(world.descriptions),
+        offsets=list(world.offsets),
+        directions=list(world.directions),
+        targets=list(world.targets),
+    )
+    path = tmp_path / "copy.gaw"
+
+    assert not unpacked_world.is_packed
+    unpacked_world.save_snapshot(path)
+    assert path.read_bytes() == snapshot_path.read_bytes()
+
+
+def test_snapshot_with_unicode_names(tmp_path):
+    path = tmp_path / "unicode.gaw"
+    world = CompactWorld.from_descriptions(
+        [
+            {"name": "Küche", "description": "Ein Raum", "connections": {"up": "B"}},
+            {"name": "B"},
+        ]
+    )
+    world.save_snapshot(path)
+
+    loaded_world = CompactWorld.load_snapshot(path)
+    assert loaded_world["Küche"]["up"] == loaded_world["B"]
+    assert loaded_world["Küche"].description == "Ein Raum"
+    assert loaded_world["B"].connections == {}
+
+
+def test_load_snapshot_rejects_other_files(tmp_path):
+    path = tmp_path / "dungeon.json"
+    path.write_text('[{"name": "Room 1"}] and some more text to fill the header')
+
+    with pytest.raises(ValueError):
+        World.load_snapshot(path)
+
+
+@pytest.mark.parametrize("num_bytes", [-8, 8])
+def test_load_snapshot_rejects_file_of_wrong_size(snapshot_path, num_bytes):
+    data = snapshot_path.read_bytes()
+    if num_bytes < 0:
+        snapshot_path.write_bytes(data[:num_bytes])
+    else:
+        snapshot_path.write_bytes(data + bytes(num_bytes))
+
+    with pytest.raises(ValueError):
+        World.load_snapshot(snapshot_path)
+
+
+def test_play_game_in_snapshot_world(snapshot_path):
+    factory = GameFactory()
+    world = factory.load_world(snapshot_path)
+    player = factory.create_player("The Hero")
+
+    player.take_turn()
+
+    assert isinstance(world, CompactWorld)
+    assert player.location.name == "Entrance Hall"
+    with pytest.raises(ValueError):
+        factory.load_world(snapshot_path)
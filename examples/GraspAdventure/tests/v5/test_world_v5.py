@@ -0,0 +1,181 @@
+from fixtures_v5 import *  # noqa
+from grasp_adventure.data.locations import dungeon_locations
+from grasp_adventure.v5.location import Location
+from grasp_adventure.v5.world_generator import random_locations
+
+
+@pytest.fixture()
+def dungeon():
+    return GameFactory().create_world(dungeon_locations)
+
+
+def test_shortest_path(dungeon):
+    path = dungeon.shortest_path("Treasure Chamber", "Brightly Lit Corridor")
+
+    assert [location.name for location in path] == [
+        "Treasure Chamber",
+        "Dark Corridor",
+        "Entrance Hall",
+        "Brightly Lit Corridor",
+    ]
+
+
+def test_shortest_path_to_start(dungeon):
+    assert dungeon.shortest_path("Vestibule", "Vestibule") == [dungeon["Vestibule"]]
+
+
+def test_distance(dungeon):
+    assert dungeon.distance("Vestibule", "Vestibule") == 0
+    assert dungeon.distance("Vestibule", "Treasure Chamber") == 3
+    assert dungeon.distance("Treasure Chamber", "Vestibule") == 3
+
+
+def test_unreachable_location():
+    world = GameFactory().create_world(
+        [
+            {"name": "A", "connections": {"north": "B"}},
+            {"name": "B"},
+        ]
+    )
+
+    assert world.distance("A", "B") == 1
+    assert world.distance("B", "A") is None
+    assert world.shortest_path("B", "A") is None
+
+
+def test_unknown_location_raises_key_error(dungeon):
+    with pytest.raises(KeyError):
+        dungeon.distance("Vestibule", "Kitchen")
+    with pytest.raises(KeyError):
+        dungeon.shortest_path("Kitchen", "Vestibule")
+
+
+def test_paths_are_updated_when_connections_change(dungeon):
+    assert dungeon.distance("Vestibule", "Treasure Chamber") == 3
+
+    dungeon["Vestibule"].connect("down", dungeon["Treasure Chamber"])
+    assert dungeon.distance("Vestibule", "Treasure Chamber") == 1
+
+    dungeon["Vestibule"].disconnect("down")
+    assert dungeon.distance("Vestibule", "Treasure Chamber") == 3
+
+    dungeon["Dark Corridor"].connections = {"east": dungeon["Entrance Hall"]}
+    assert dungeon.distance("Vestibule", "Treasure Chamber") is None
+
+
+def test_search_tree_cache_is_bounded(dungeon):
+    dungeon.max_cached_search_trees = 2
+    for location_name in dungeon.locations:
+        dungeon.distance(location_name, "Vestibule")
+
+    assert len(dungeon._search_trees) == 2
+
+
+def test_search_trees_are_kept_when_other_worlds_change(dungeon):
+    tree = dungeon._search_tree("Vestibule")
+
+    other_world = GameFactory().create_world(dungeon_locations)
+    other_world["Vestibule"].connect("down", other_world["Treasure Chamber"])
+    Location("Kitchen", connections={"north": Location("Pantry")})
+
+    assert dungeon._search_tree("Vestibule") is tree
+    assert dungeon.distance("Vestibule", "Treasure Chamber") == 3
+
+
+@pytest.fixture()
+def chain():
+    # A <-> B -> C <-> D, E (isolated)
+    return GameFactory().create_world(
+        [
+            {"name": "A", "connections": {"north": "B"}},
+            {"name": "B", "connections": {"south": "A", "north": "C"}},
+            {"name": "C", "connections": {"north": "D"}},
+            {"name": "D", "connections": {"south": "C"}},
+            {"name": "E"},
+        ]
+    )
+
+
+def test_can_reach(chain):
+    assert chain.can_reach("A", "B")
+    assert chain.can_reach("A", "D")
+    assert not chain.can_reach("D", "A")
+    assert not chain.can_reach("A", "E")
+    assert chain.can_reach("E", "E")
+    assert chain.reachability.num_components == 3
+
+
+def test_unreachable_locations(chain, dungeon):
+    assert [location.name for location in chain.unreachable_locations()] == ["E"]
+    assert dungeon.unreachable_locations() == []
+
+
+def test_can_reach_unknown_location_raises_key_error(chain):
+    with pytest.raises(KeyError):
+        chain.can_reach("A", "Kitchen")
+
+
+def test_connect_updates_index_incrementally(chain):
+    index = chain.reachability
+
+    chain.connect("E", "west", "A")
+
+    assert chain.reachability is index
+    assert chain.can_reach("E", "D")
+    assert not chain.can_reach("A", "E")
+
+
+def test_connect_merging_components_recomputes_index(chain):
+    index = chain.reachability
+
+    chain.connect("D", "west", "A")
+
+    assert chain.reachability is not index
+    assert chain.reachability.num_components == 2
+    assert chain.can_reach("D", "B")
+
+
+def test_index_is_recomputed_when_locations_change(chain):
+    assert not chain.can_reach("D", "A")
+
+    chain["C"].connect("south", chain["B"])
+
+    assert chain.can_reach("D", "A")
+
+
+def test_index_is_kept_when_other_worlds_are_built_or_changed(chain):
+    index = chain.reachability
+
+    other_world = GameFactory().create_world(dungeon_locations)
+    other_world.connect("Vestibule", "down", "Treasure Chamber")
+    other_world["Dark Corridor"].disconnect("west")
+    Location("Kitchen", connections={"north": Location("Pantry")})
+
+    assert chain.reachability is index
+    assert other_world.can_reach("Vestibule", "Treasure Chamber")
+
+
+def test_caches_are_updated_when_connections_change_in_place(chain):
+    assert not chain.can_reach("D", "A")
+    assert chain.distance("D", "A") is None
+
+    chain["C"].connections["south"] = chain["B"]
+
+    assert chain.can_reach("D", "A")
+    assert chain.distance("D", "A") == 3
+
+
+def test_reachability_matches_search():
+    world = GameFactory().create_world(random_locations(60, degree=1, seed=3))
+    for source, direction, target in [
+        ("Room 1", "up", "Room 7"),
+        ("Room 9", "down", "Room 2"),
+        ("Room 5", "east", "Room 40"),
+    ]:
+        world[source].disconnect("north")
+        world.connect(source, direction, target)
+        for start in ["Room 1", "Room 9", "Room 30"]:
+            for goal in world.locations:
+                assert world.can_reach(start, goal) == (
+                    world.distance(start, goal) is not None
+                )
@@ -1,17 +1,137 @@
 import argparse
+import json
 import sys
+from contextlib import nullcontext
+from itertools import islice
+from primes.cache import DEFAULT_MAX_SIZE, FactorizationCache
 from primes.prime_factors import compute_prime_factors
+from primes.parallel import factor_numbers_in_parallel
+from primes.sieve import prime_count, primes_in_range
+from primes.streaming import (
+    DEFAULT_CHUNK_SIZE,
+    FORMATTERS,
+    parse_numbers,
+    write_factorizations,
+)
 
 
 def main(args):
+    if args and args[0] == "range":
+        range_main(args[1:])
+        return
     parser = argparse.ArgumentParser(
         prog="primes",
         description="Factor prime numbers.",
+        epilog="Use 'primes range --help' to list or count primes. Have fun!",
+    )
+    parser.add_argument(
+        "number",
+        nargs="?",
+        help="the number to factor; if omitted, numbers are read from the input",
+    )
+    parser.add_argument(
+        "-i",
+        "--input",
+        default="-",
+        help="file with one number per line (default: standard input)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=sorted(FORMATTERS),
+        default="text",
+        help="output format when reading numbers from the input",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of worker processes when reading numbers from the input "
+        "(0: one per CPU)",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help="SQLite database in which factorizations are cached between runs",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_SIZE,
+        help="maximal number of factorizations cached in memory",
+    )
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="print cache statistics as JSON to standard error",
+    )
+    args = parser.parse_args(args)
+    if args.jobs < 0:
+        parser.error("--jobs must not be negative")
+    if args.cache_size < 1:
+        parser.error("--cache-size must be positive")
+    cache = None
+    if args.cache is not None or args.cache_stats:
+        cache = FactorizationCache(max_size=args.cache_size, path=args.cache)
+    try:
+        if args.number is not None:
+            factor = compute_prime_factors if cache is None else cache.prime_factors
+            print(factor(int(args.number)))
+        else:
+            if args.input == "-":
+                # Standard input is left open for the caller.
+                input_file = nullcontext(sys.stdin)
+            else:
+                try:
+                    input_file = open(args.input, encoding="utf-8")
+                except OSError as error:
+                    parser.error(
+                        f"argument -i/--input: can't open {args.input!r}: {error}"
+                    )
+            with input_file as lines:
+                chunks = factor_numbers_in_parallel(
+                    parse_numbers(lines), args.jobs, cache=cache
+                )
+                write_factorizations(chunks, sys.stdout, FORMATTERS[args.format])
+    except ValueError as error:
+        parser.exit(1, f"{parser.prog}: error: {error}\n")
+    finally:
+        if cache is not None:
+            cache.close()
+            if args.cache_stats:
+                print(json.dumps(cache.statistics.to_dict()), file=sys.stderr)
+
+
+def range_main(args):
+    parser = argparse.ArgumentParser(
+        prog="primes range",
+        description="List or count the primes in a range.",
         epilog="Have fun!",
     )
-    parser.add_argument("number", default="42", help="the number to factor")
+    parser.add_argument(
+        "bounds",
+        type=int,
+        nargs="+",
+        metavar="[START] STOP",
+        help="list the primes p with START <= p < STOP (START defaults to 0)",
+    )
+    parser.add_argument(
+        "-c",
+        "--count",
+        action="store_true",
+        help="print the number of primes instead of the primes",
+    )
     args = parser.parse_args(args)
-    print(compute_prime_factors(int(args.number)))
+    if len(args.bounds) > 2:
+        parser.error("expected at most two bounds")
+    start, stop = args.bounds if len(args.bounds) == 2 else (0, args.bounds[0])
+    if args.count:
+        print(prime_count(stop, lo=start))
+        return
+    primes = primes_in_range(start, stop)
+    while chunk := list(islice(primes, DEFAULT_CHUNK_SIZE)):
+        sys.stdout.write("".join(f"{p}\n" for p in chunk))
 
 
 if __name__ == "__main__":
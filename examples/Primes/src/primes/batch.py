@@ -0,0 +1,129 @@
+from dataclasses import dataclass
+from typing import Iterable, List, Union
+
+import numpy as np
+
+from primes.prime_factors import (
+    SMALL_FACTOR_LIMIT,
+    compute_prime_factors,
+    smallest_prime_factor_table,
+)
+
+
+@dataclass(frozen=True)
+class Factorizations:
+    """The prime factors of a batch of numbers in compressed sparse row form.
+
+    The factors of the `i`-th number are `factors[offsets[i]:offsets[i + 1]]`.
+
+    >>> result = factorize_many([12, 7, 1])
+    >>> result.factors
+    array([2, 2, 3, 7])
+    >>> result.offsets
+    array([0, 3, 4, 4])
+    >>> result[0]
+    array([2, 2, 3])
+    """
+
+    factors: np.ndarray
+    offsets: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        return self.factors[self.offsets[index] : self.offsets[index + 1]]
+
+    def to_lists(self) -> List[List[int]]:
+        """Convert the factorizations into a list of lists of Python ints.
+
+        >>> factorize_many([12, 7, 1]).to_lists()
+        [[2, 2, 3], [7], []]
+        """
+        factors = self.factors.tolist()
+        offsets = self.offsets.tolist()
+        return [factors[start:end] for start, end in zip(offsets, offsets[1:])]
+
+
+def factorize_many(
+    numbers: Union[np.ndarray, Iterable[int]], sieve_limit: int = SMALL_FACTOR_LIMIT
+) -> Factorizations:
+    """Compute the prime factors of every number in a batch.
+
+    Numbers below `sieve_limit` are factored together, using vectorized lookups
+    in a smallest-prime-factor table that is shared between calls. Larger
+    numbers, including Python ints that do not fit into 64 bits, are factored
+    one by one with `compute_prime_factors`. As with `compute_prime_factors`,
+    numbers less than 2 have no factors.
+
+    >>> factorize_many(np.array([4, 5, 600851475143])).to_lists()
+    [[2, 2], [5], [71, 839, 1471, 6857]]
+    """
+    if sieve_limit < 2:
+        raise ValueError("sieve_limit must be at least 2")
+    if not isinstance(numbers, np.ndarray):
+        values = _from_iterable(numbers)
+    elif numbers.dtype == object:
+        values = _from_iterable(numbers.reshape(-1))
+    else:
+        values = numbers.reshape(-1)
+    if values.dtype.kind not in "iuO":
+        raise TypeError("numbers must be integers")
+    if values.dtype == object:
+        # Python ints that do not fit into 64 bits stay Python ints, and so
+        # do their factors.
+        dtype = object
+    else:
+        dtype = np.uint64 if values.dtype == np.uint64 else np.int64
+
+    is_small = values < sieve_limit
+    small_indices = np.flatnonzero(is_small & (values > 1))
+    large_indices = np.flatnonzero(~is_small)
+
+    counts = np.zeros(len(values), dtype=np.int64)
+    small_steps = _factor_small(values[small_indices], small_indices, sieve_limit)
+    for indices, _ in small_steps:
+        counts[indices] += 1
+    large_factors = [compute_prime_factors(int(n)) for n in values[large_indices]]
+    counts[large_indices] = [len(f) for f in large_factors]
+
+    offsets = np.zeros(len(values) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    factors = np.empty(offsets[-1], dtype=dtype)
+    for step, (indices, primes) in enumerate(small_steps):
+        factors[offsets[indices] + step] = primes
+    for index, index_factors in zip(large_indices, large_factors):
+        factors[offsets[index] : offsets[index + 1]] = index_factors
+    return Factorizations(factors=factors, offsets=offsets)
+
+
+def _from_iterable(numbers: Iterable[int]) -> np.ndarray:
+    """Convert `numbers` into a 64-bit integer array, or into an object array
+    if some of them do not fit into 64 bits."""
+    values = np.fromiter(numbers, dtype=object)
+    if not all(isinstance(n, (int, np.integer)) for n in values):
+        raise TypeError("numbers must be integers")
+    try:
+        return values.astype(np.int64)
+    except OverflowError:
+        return values
+
+
+def _factor_small(values: np.ndarray, indices: np.ndarray, sieve_limit: int):
+    """Factor `values` by repeated lookups in the smallest-prime-factor table.
+
+    Returns a list with one `(indices, primes)` pair per step; the `k`-th pair
+    holds the `k`-th prime factor of every number that has at least `k + 1`
+    factors.
+    """
+    table = np.frombuffer(smallest_prime_factor_table(sieve_limit), dtype=np.uint32)
+    rest = values.astype(np.int64)
+    steps = []
+    while len(rest):
+        primes = table[rest].astype(np.int64)
+        steps.append((indices, primes))
+        rest = rest // primes
+        remaining = rest > 1
+        rest = rest[remaining]
+        indices = indices[remaining]
+    return steps
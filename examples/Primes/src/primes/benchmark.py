@@ -0,0 +1,153 @@
+import argparse
+import json
+import platform
+import sys
+import timeit
+from dataclasses import dataclass
+from random import Random
+from typing import Callable, Dict, List
+
+from primes.batch import factorize_many
+from primes.cache import FactorizationCache
+from primes.parallel import factor_numbers_in_parallel
+from primes.prime_factors import compute_prime_factors, small_primes
+from primes.sieve import prime_count, primes_in_range
+
+DEFAULT_TOLERANCE = 0.25
+
+
+@dataclass
+class Benchmark:
+    name: str
+    run: Callable[[], object]
+
+
+def create_benchmarks(seed: int = 42) -> List[Benchmark]:
+    """Create the benchmark workloads, using a fixed seed for their inputs.
+
+    >>> [b.name for b in create_benchmarks()][:2]
+    ['small_composites', 'semiprimes']
+    """
+    rng = Random(seed)
+    primes = small_primes(1 << 16)[1000:]
+    small_composites = [rng.randrange(4, 1 << 20) for _ in range(20_000)]
+    semiprimes = [rng.choice(primes) * rng.choice(primes) for _ in range(2_000)]
+    large_primes = [2**61 - 1, 2**89 - 1, 18446744073709551557, 10**30 + 57]
+    large_semiprimes = [4_294_967_291 * 4_294_967_279, 1_000_003 * (2**61 - 1)]
+    batch = [rng.randrange(2, 1 << 20) for _ in range(200_000)]
+
+    def factor_all(numbers):
+        return lambda: [compute_prime_factors(n) for n in numbers]
+
+    def factor_all_cached():
+        cache = FactorizationCache()
+        for _ in range(2):
+            for n in semiprimes:
+                cache.prime_factors(n)
+
+    return [
+        Benchmark("small_composites", factor_all(small_composites)),
+        Benchmark("semiprimes", factor_all(semiprimes)),
+        Benchmark("large_primes", factor_all(large_primes)),
+        Benchmark("large_semiprimes", factor_all(large_semiprimes)),
+        Benchmark("semiprimes_cached", factor_all_cached),
+        Benchmark("batch_factorize_many", lambda: factorize_many(batch)),
+        Benchmark(
+            "batch_parallel",
+            lambda: list(factor_numbers_in_parallel(semiprimes, jobs=2)),
+        ),
+        Benchmark("sieve_count", lambda: prime_count(10**7)),
+        Benchmark(
+            "sieve_range",
+            lambda: sum(1 for _ in primes_in_range(10**12, 10**12 + 10**6)),
+        ),
+    ]
+
+
+def run_benchmarks(
+    benchmarks: List[Benchmark], repeat: int = 5, selected: str = ""
+) -> Dict[str, float]:
+    """Return the best time in seconds out of `repeat` runs of each benchmark.
+
+    Only benchmarks whose name contains `selected` are run.
+    """
+    return {
+        benchmark.name: min(timeit.repeat(benchmark.run, number=1, repeat=repeat))
+        for benchmark in benchmarks
+        if selected in benchmark.name
+    }
+
+
+def find_regressions(
+    timings: Dict[str, float],
+    baseline: Dict[str, float],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[str]:
+    """Describe every benchmark that is more than `tolerance` slower than its
+    baseline. Benchmarks missing from the baseline are ignored.
+
+    >>> find_regressions({"a": 1.0, "b": 1.5, "c": 9.0}, {"a": 1.0, "b": 1.0})
+    ['b: 1.5000s vs. 1.0000s baseline (+50%)']
+    """
+    regressions = []
+    for name, seconds in timings.items():
+        reference = baseline.get(name)
+        if reference is not None and seconds > reference * (1 + tolerance):
+            slowdown = seconds / reference - 1
+            regressions.append(
+                f"{name}: {seconds:.4f}s vs. {reference:.4f}s baseline "
+                f"(+{slowdown:.0%})"
+            )
+    return regressions
+
+
+def main(args):
+    parser = argparse.ArgumentParser(
+        prog="python -m primes.benchmark",
+        description="Time the factorization strategies of the primes package.",
+        epilog="Have fun!",
+    )
+    parser.add_argument("-o", "--output", help="write the timings as JSON to this file")
+    parser.add_argument(
+        "-b", "--baseline", help="JSON file with baseline timings to compare with"
+    )
+    parser.add_argument(
+        "-t",
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="relative slowdown that counts as a regression (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5, help="runs per benchmark"
+    )
+    parser.add_argument(
+        "-k", "--select", default="", help="only run benchmarks containing this"
+    )
+    args = parser.parse_args(args)
+
+    timings = run_benchmarks(create_benchmarks(), args.repeat, args.select)
+    for name, seconds in timings.items():
+        print(f"{name:24} {seconds:10.4f}s")
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "timings": timings,
+                },
+                file,
+                indent=2,
+            )
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["timings"]
+        regressions = find_regressions(timings, baseline, args.tolerance)
+        if regressions:
+            print("Performance regressions:", *regressions, sep="\n  ")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,147 @@
+import sqlite3
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from os import PathLike
+from typing import Dict, List, Optional, Union
+
+from primes.prime_factors import compute_prime_factors
+
+DEFAULT_MAX_SIZE = 100_000
+DEFAULT_WRITE_BATCH_SIZE = 1000
+
+
+@dataclass
+class CacheStatistics:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Union[int, float]]:
+        return {**asdict(self), "hits": self.hits, "hit_rate": self.hit_rate}
+
+
+class FactorizationCache:
+    """A memoization cache for prime factorizations.
+
+    Factorizations are kept in an in-memory LRU cache holding at most
+    `max_size` entries. If a `path` is given, they are also stored in an SQLite
+    database at that path, so that they survive the process. Writes to the
+    database are batched; call `close()` (or use the cache as a context
+    manager) to flush them.
+
+    >>> cache = FactorizationCache(max_size=2)
+    >>> cache.prime_factors(12)
+    [2, 2, 3]
+    >>> cache.prime_factors(12)
+    [2, 2, 3]
+    >>> cache.statistics
+    CacheStatistics(memory_hits=1, disk_hits=0, misses=1, evictions=0)
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        path: Union[str, "PathLike[str]", None] = None,
+        write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self.write_batch_size = write_batch_size
+        self.statistics = CacheStatistics()
+        self._memory: "OrderedDict[int, List[int]]" = OrderedDict()
+        self._pending_writes: List[tuple] = []
+        self._connection: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._connection = sqlite3.connect(path)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS factorizations "
+                "(number TEXT PRIMARY KEY, factors TEXT NOT NULL)"
+            )
+
+    def __enter__(self) -> "FactorizationCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def get(self, n: int) -> Optional[List[int]]:
+        """Return the cached factors of `n`, or `None` if they are not cached."""
+        factors = self._memory.get(n)
+        if factors is not None:
+            self._memory.move_to_end(n)
+            self.statistics.memory_hits += 1
+            return factors
+        factors = self._load(n)
+        if factors is not None:
+            self._remember(n, factors)
+            self.statistics.disk_hits += 1
+            return factors
+        self.statistics.misses += 1
+        return None
+
+    def put(self, n: int, factors: List[int]) -> None:
+        """Store the factors of `n` in the cache."""
+        self._remember(n, factors)
+        if self._connection is not None:
+            self._pending_writes.append((str(n), " ".join(map(str, factors))))
+            if len(self._pending_writes) >= self.write_batch_size:
+                self.flush()
+
+    def prime_factors(self, n: int) -> List[int]:
+        """Return the prime factors of `n`, computing them only on a cache miss.
+
+        The returned list is shared with the cache and must not be modified.
+        """
+        factors = self.get(n)
+        if factors is None:
+            factors = compute_prime_factors(n)
+            self.put(n, factors)
+        return factors
+
+    def flush(self) -> None:
+        """Write all pending factorizations to the database."""
+        if self._connection is not None and self._pending_writes:
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO factorizations VALUES (?, ?)",
+                    self._pending_writes,
+                )
+            self._pending_writes.clear()
+
+    def close(self) -> None:
+        """Flush pending writes and close the database."""
+        if self._connection is not None:
+            self.flush()
+            self._connection.close()
+            self._connection = None
+
+    def _remember(self, n: int, factors: List[int]) -> None:
+        self._memory[n] = factors
+        self._memory.move_to_end(n)
+        if len(self._memory) > self.max_size:
+            self._memory.popitem(last=False)
+            self.statistics.evictions += 1
+
+    def _load(self, n: int) -> Optional[List[int]]:
+        if self._connection is None:
+            return None
+        row = self._connection.execute(
+            "SELECT factors FROM factorizations WHERE number = ?", (str(n),)
+        ).fetchone()
+        if row is None:
+            return None
+        return [int(factor) for factor in row[0].split()]
@@ -0,0 +1,81 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional
+
+from primes.prime_factors import compute_prime_factors, smallest_prime_factor_table
+from primes.streaming import DEFAULT_CHUNK_SIZE, Factorization, factor_numbers
+
+if TYPE_CHECKING:
+    from primes.cache import FactorizationCache
+
+
+def factor_numbers_in_parallel(
+    numbers: Iterable[int],
+    jobs: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    cache: Optional["FactorizationCache"] = None,
+) -> Iterator[List[Factorization]]:
+    """Factor `numbers` in `jobs` worker processes.
+
+    The input is split into chunks of `chunk_size` numbers that are factored
+    by a process pool. Chunks are yielded in input order, and only a bounded
+    number of chunks is in flight at any time, so `numbers` may be an
+    arbitrarily long iterator. If `jobs` is `None` or 0, one worker per CPU is
+    used; with a single job the numbers are factored in this process.
+
+    If a `cache` is given, it is consulted in this process and only the
+    numbers that are not cached are sent to the workers.
+
+    >>> list(factor_numbers_in_parallel([12, 7, 1], jobs=2, chunk_size=2))
+    [[(12, [2, 2, 3]), (7, [7])], [(1, [])]]
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        factor = compute_prime_factors if cache is None else cache.prime_factors
+        yield from factor_numbers(numbers, chunk_size, factor)
+        return
+    numbers = iter(numbers)
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=smallest_prime_factor_table
+    ) as executor:
+        pending = deque()
+        while True:
+            while len(pending) < 2 * jobs:
+                chunk = list(islice(numbers, chunk_size))
+                if not chunk:
+                    break
+                if cache is None:
+                    cached = [None] * len(chunk)
+                else:
+                    cached = [cache.get(n) for n in chunk]
+                misses = [n for n, factors in zip(chunk, cached) if factors is None]
+                future = executor.submit(_factor_chunk, misses)
+                pending.append((chunk, cached, future))
+            if not pending:
+                return
+            chunk, cached, future = pending.popleft()
+            yield _merge_results(chunk, cached, future.result(), cache)
+
+
+def _merge_results(
+    chunk: List[int],
+    cached: List[Optional[List[int]]],
+    computed: List[List[int]],
+    cache: Optional["FactorizationCache"],
+) -> List[Factorization]:
+    """Fill the cache misses of a chunk with the factors computed for them."""
+    computed_factors = iter(computed)
+    result = []
+    for n, factors in zip(chunk, cached):
+        if factors is None:
+            factors = next(computed_factors)
+            if cache is not None:
+                cache.put(n, factors)
+        result.append((n, factors))
+    return result
+
+
+def _factor_chunk(chunk: List[int]) -> List[List[int]]:
+    return [compute_prime_factors(n) for n in chunk]
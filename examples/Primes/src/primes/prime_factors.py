@@ -1,19 +1,181 @@
+from array import array
+from functools import lru_cache
+from math import gcd, isqrt
 from typing import List
 
+# Numbers below this bound are factored with a smallest-prime-factor table.
+SMALL_FACTOR_LIMIT = 1 << 20
+# Larger numbers are trial-divided by the primes below this bound first.
+TRIAL_DIVISION_LIMIT = 1 << 10
+
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
 
 def compute_prime_factors(n: int) -> List[int]:
     """Compute the prime factors of a positive integer.
 
+    The factors are returned in ascending order, with multiplicity.
+
     >>> compute_prime_factors(2)
     [2]
     >>> compute_prime_factors(12)
     [2, 2, 3]
     >>> compute_prime_factors(1)
     []
+    >>> compute_prime_factors(600851475143)
+    [71, 839, 1471, 6857]
+    >>> compute_prime_factors(18446744073709551557)
+    [18446744073709551557]
+    """
+    if n < 2:
+        return []
+    if n < SMALL_FACTOR_LIMIT:
+        return _factor_with_table(n)
+    result: List[int] = []
+    n = _trial_divide(n, result)
+    if n > 1:
+        _factor_large(n, result)
+        result.sort()
+    return result
+
+
+def is_prime(n: int) -> bool:
+    """Check whether `n` is prime.
+
+    Uses a Miller-Rabin test whose result is exact for all `n` below
+    3.3 * 10**24; above that bound the probability of error is negligible.
+
+    >>> is_prime(1)
+    False
+    >>> is_prime(97)
+    True
+    >>> is_prime(561)
+    False
+    >>> is_prime(2**61 - 1)
+    True
+    """
+    if n < 2:
+        return False
+    for p in _MILLER_RABIN_BASES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+@lru_cache(maxsize=4)
+def smallest_prime_factor_table(limit: int = SMALL_FACTOR_LIMIT) -> array:
+    """Return a table whose entry `i` is the smallest prime factor of `i`.
+
+    Entries 0 and 1 map to themselves. The tables of the most recently used
+    limits are cached.
+
+    >>> list(smallest_prime_factor_table(16))
+    [0, 1, 2, 3, 2, 5, 2, 7, 2, 3, 2, 11, 2, 13, 2, 3]
     """
+    table = array("I", range(limit))
+    # Assigning in descending order lets smaller primes overwrite the entries
+    # of larger ones, so each entry ends up holding its smallest prime factor.
+    for p in reversed(small_primes(isqrt(limit - 1) + 1)):
+        start = p * p
+        count = len(range(start, limit, p))
+        table[start::p] = array("I", [p]) * count
+    return table
+
+
+@lru_cache(maxsize=8)
+def small_primes(limit: int) -> List[int]:
+    """Return all primes below `limit`."""
+    if limit < 3:
+        return []
+    sieve = bytearray([1]) * limit
+    sieve[0] = sieve[1] = 0
+    for i in range(2, isqrt(limit - 1) + 1):
+        if sieve[i]:
+            sieve[i * i :: i] = bytes(len(range(i * i, limit, i)))
+    return [i for i, flag in enumerate(sieve) if flag]
+
+
+def _factor_with_table(n: int) -> List[int]:
+    table = smallest_prime_factor_table()
     result = []
-    for factor in range(2, n + 1):
-        while n % factor == 0:
-            result.append(factor)
-            n /= factor
+    while n > 1:
+        p = table[n]
+        result.append(p)
+        n //= p
     return result
+
+
+def _trial_divide(n: int, result: List[int]) -> int:
+    """Divide out all primes below `TRIAL_DIVISION_LIMIT` and return the rest."""
+    for p in small_primes(TRIAL_DIVISION_LIMIT):
+        if p * p > n:
+            break
+        while n % p == 0:
+            result.append(p)
+            n //= p
+    if 1 < n < SMALL_FACTOR_LIMIT:
+        result.extend(_factor_with_table(n))
+        return 1
+    return n
+
+
+def _factor_large(n: int, result: List[int]) -> None:
+    """Append the prime factors of `n`, which has no factors below the
+    trial-division limit, to `result`."""
+    if n < SMALL_FACTOR_LIMIT:
+        result.extend(_factor_with_table(n))
+    elif is_prime(n):
+        result.append(n)
+    else:
+        divisor = _pollard_brent(n)
+        _factor_large(divisor, result)
+        _factor_large(n // divisor, result)
+
+
+def _pollard_brent(n: int) -> int:
+    """Find a non-trivial divisor of the odd composite number `n`.
+
+    Uses Brent's variant of Pollard's rho algorithm with batched gcds. The
+    polynomial constant is varied deterministically until a divisor is found.
+    """
+    batch_size = 128
+    for c in range(1, n):
+        y, r, q = 2, 1, 1
+        x = ys = y
+        g = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(batch_size, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += batch_size
+            r *= 2
+        if g == n:
+            # The batch overshot; retrace it one step at a time.
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = gcd(abs(x - ys), n)
+        if g != n:
+            return g
+    raise ValueError(f"Could not find a divisor of {n}.")
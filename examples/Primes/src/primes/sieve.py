@@ -0,0 +1,87 @@
+from itertools import compress
+from math import isqrt
+from typing import Iterator, List, Tuple
+
+from primes.prime_factors import small_primes
+
+# Number of odd numbers per segment; one byte each, so that a segment fits
+# comfortably into the L2 cache.
+DEFAULT_SEGMENT_SIZE = 1 << 18
+
+
+def primes_in_range(
+    lo: int, hi: int, segment_size: int = DEFAULT_SEGMENT_SIZE
+) -> Iterator[int]:
+    """Lazily generate the primes `p` with `lo <= p < hi` in ascending order.
+
+    Uses a segmented sieve of Eratosthenes that only keeps the base primes
+    below `sqrt(hi)` and a single segment in memory.
+
+    >>> list(primes_in_range(0, 30))
+    [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    >>> list(primes_in_range(100, 130, segment_size=4))
+    [101, 103, 107, 109, 113, 127]
+    """
+    if lo <= 2 < hi:
+        yield 2
+    for start, segment in _odd_segments(lo, hi, segment_size):
+        yield from compress(range(start, start + 2 * len(segment), 2), segment)
+
+
+def prime_count(
+    hi: int, *, lo: int = 0, segment_size: int = DEFAULT_SEGMENT_SIZE
+) -> int:
+    """Count the primes `p` with `lo <= p < hi`.
+
+    The lower bound is keyword-only, since it is optional and follows the
+    upper bound (unlike in `primes_in_range(lo, hi)`).
+
+    >>> prime_count(10)
+    4
+    >>> prime_count(1_000_000)
+    78498
+    >>> prime_count(100, lo=10)
+    21
+    """
+    count = 1 if lo <= 2 < hi else 0
+    for _, segment in _odd_segments(lo, hi, segment_size):
+        count += segment.count(1)
+    return count
+
+
+def _odd_segments(
+    lo: int, hi: int, segment_size: int
+) -> Iterator[Tuple[int, bytearray]]:
+    """Sieve the odd numbers in `[max(lo, 3), hi)` one segment at a time.
+
+    Yields pairs `(start, segment)` where `segment[i]` is 1 if and only if the
+    odd number `start + 2 * i` is prime. The segment is reused between
+    iterations and must not be kept by the caller.
+    """
+    if segment_size < 1:
+        raise ValueError("segment_size must be positive")
+    start = max(lo, 3) | 1
+    if start >= hi:
+        return
+    base_primes: List[int] = small_primes(isqrt(hi - 1) + 1)[1:]
+    ones = memoryview(b"\x01" * segment_size)
+    zeros = memoryview(bytes(segment_size))
+    segment = bytearray(segment_size)
+    while start < hi:
+        size = min(segment_size, (hi - start + 1) // 2)
+        segment[:] = ones[:size]
+        stop = start + 2 * size
+        for p in base_primes:
+            square = p * p
+            if square >= stop:
+                break
+            if square >= start:
+                first = square
+            else:
+                first = start + (-start % p)
+                if first % 2 == 0:
+                    first += p
+            index = (first - start) // 2
+            segment[index::p] = zeros[: len(range(index, size, p))]
+        yield start, segment
+        start = stop
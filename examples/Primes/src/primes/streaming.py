@@ -0,0 +1,85 @@
+import json
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, TextIO, Tuple
+
+from primes.prime_factors import compute_prime_factors
+
+Factorization = Tuple[int, List[int]]
+
+DEFAULT_CHUNK_SIZE = 4096
+
+
+def parse_numbers(lines: Iterable[str]) -> Iterator[int]:
+    """Parse newline-delimited integers, skipping blank lines.
+
+    >>> list(parse_numbers(["12\\n", "\\n", " 7 \\n"]))
+    [12, 7]
+    """
+    for line_number, line in enumerate(lines, 1):
+        text = line.strip()
+        if text:
+            try:
+                yield int(text)
+            except ValueError:
+                raise ValueError(
+                    f"line {line_number}: invalid integer {text!r}"
+                ) from None
+
+
+def factor_numbers(
+    numbers: Iterable[int],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    factor: Callable[[int], List[int]] = compute_prime_factors,
+) -> Iterator[List[Factorization]]:
+    """Factor `numbers` lazily, yielding lists of at most `chunk_size` results.
+
+    Each number is factored by calling `factor`.
+
+    >>> list(factor_numbers([12, 7, 1], chunk_size=2))
+    [[(12, [2, 2, 3]), (7, [7])], [(1, [])]]
+    """
+    numbers = iter(numbers)
+    while chunk := list(islice(numbers, chunk_size)):
+        yield [(n, factor(n)) for n in chunk]
+
+
+def format_text(factorization: Factorization) -> str:
+    """Format a factorization like the Unix `factor` command.
+
+    >>> format_text((12, [2, 2, 3]))
+    '12: 2 2 3'
+    """
+    number, factors = factorization
+    return " ".join([f"{number}:", *map(str, factors)])
+
+
+def format_json(factorization: Factorization) -> str:
+    """Format a factorization as a JSON object.
+
+    >>> format_json((12, [2, 2, 3]))
+    '{"number": 12, "factors": [2, 2, 3]}'
+    """
+    number, factors = factorization
+    return json.dumps({"number": number, "factors": factors})
+
+
+FORMATTERS: Dict[str, Callable[[Factorization], str]] = {
+    "text": format_text,
+    "json": format_json,
+}
+
+
+def write_factorizations(
+    chunks: Iterable[List[Factorization]],
+    output: TextIO,
+    formatter: Callable[[Factorization], str] = format_text,
+) -> None:
+    """Write one formatted line per factorization, one write call per chunk.
+
+    >>> import sys
+    >>> write_factorizations(factor_numbers([12, 7]), sys.stdout, format_json)
+    {"number": 12, "factors": [2, 2, 3]}
+    {"number": 7, "factors": [7]}
+    """
+    for chunk in chunks:
+        output.write("".join(f"{formatter(f)}\n" for f in chunk))
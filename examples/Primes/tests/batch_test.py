@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from primes.batch import factorize_many
+from primes.prime_factors import compute_prime_factors
+
+
+def test_factorize_many_matches_compute_prime_factors():
+    numbers = list(range(-2, 2000)) + [2**61 - 1, 600851475143, 1_000_003**2]
+    result = factorize_many(numbers)
+    assert len(result) == len(numbers)
+    assert result.to_lists() == [compute_prime_factors(n) for n in numbers]
+
+
+def test_factorize_many_with_small_sieve_limit():
+    numbers = np.arange(0, 500)
+    result = factorize_many(numbers, sieve_limit=64)
+    assert result.to_lists() == [compute_prime_factors(int(n)) for n in numbers]
+
+
+def test_factorize_many_returns_csr_arrays():
+    result = factorize_many(np.array([8, 1, 15]))
+    assert result.factors.tolist() == [2, 2, 2, 3, 5]
+    assert result.offsets.tolist() == [0, 3, 3, 5]
+    assert result[2].tolist() == [3, 5]
+
+
+def test_factorize_many_of_empty_batch():
+    result = factorize_many([])
+    assert len(result) == 0
+    assert result.to_lists() == []
+
+
+def test_factorize_many_of_unsigned_64_bit_numbers():
+    result = factorize_many(np.array([2**64 - 1], dtype=np.uint64))
+    assert result.factors.dtype == np.uint64
+    assert result.to_lists() == [compute_prime_factors(2**64 - 1)]
+
+
+def test_factorize_many_of_generator():
+    result = factorize_many(n for n in [12, 7, 1])
+    assert result.factors.dtype == np.int64
+    assert result.to_lists() == [[2, 2, 3], [7], []]
+
+
+def test_factorize_many_of_numbers_beyond_64_bits():
+    numbers = [12, 2**64 + 1, 2**89 - 1]
+    result = factorize_many(iter(numbers))
+    assert result.factors.dtype == object
+    assert result.to_lists() == [compute_prime_factors(n) for n in numbers]
+
+
+def test_factorize_many_rejects_non_integers():
+    with pytest.raises(TypeError):
+        factorize_many([1.5, 2])
+    with pytest.raises(TypeError):
+        factorize_many(np.array([1.5, 2]))
+
+
+@pytest.mark.parametrize("sieve_limit", [-1, 0, 1])
+def test_factorize_many_rejects_invalid_sieve_limit(sieve_limit):
+    with pytest.raises(ValueError):
+        factorize_many([12], sieve_limit=sieve_limit)
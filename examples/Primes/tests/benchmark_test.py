@@ -0,0 +1,32 @@
+import json
+
+import pytest
+
+from primes.benchmark import create_benchmarks, find_regressions, main
+
+
+def test_benchmark_names_are_unique():
+    names = [benchmark.name for benchmark in create_benchmarks()]
+    assert len(names) == len(set(names))
+
+
+def test_find_regressions_respects_tolerance():
+    baseline = {"a": 1.0, "b": 1.0}
+    assert find_regressions({"a": 1.1, "b": 0.5}, baseline, tolerance=0.2) == []
+    assert len(find_regressions({"a": 1.3}, baseline, tolerance=0.2)) == 1
+
+
+def test_main_writes_timings(capsys, tmp_path):
+    output = tmp_path / "timings.json"
+    main(["--select", "large_primes", "--repeat", "1", "--output", str(output)])
+
+    timings = json.loads(output.read_text())["timings"]
+    assert list(timings) == ["large_primes"]
+    assert "large_primes" in capsys.readouterr().out
+
+
+def test_main_fails_on_regression(tmp_path):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"timings": {"large_primes": 1e-9}}))
+    with pytest.raises(SystemExit):
+        main(["-k", "large_primes", "-r", "1", "--baseline", str(baseline)])
@@ -0,0 +1,62 @@
+import pytest
+
+from primes.cache import FactorizationCache
+
+
+def test_prime_factors_counts_hits_and_misses():
+    cache = FactorizationCache()
+    assert cache.prime_factors(12) == [2, 2, 3]
+    assert cache.prime_factors(12) == [2, 2, 3]
+    assert cache.prime_factors(7) == [7]
+    assert cache.statistics.hits == 1
+    assert cache.statistics.misses == 2
+    assert cache.statistics.hit_rate == pytest.approx(1 / 3)
+
+
+def test_get_of_uncached_number_returns_none():
+    cache = FactorizationCache()
+    assert cache.get(12) is None
+    assert cache.statistics.misses == 1
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = FactorizationCache(max_size=2)
+    cache.put(2, [2])
+    cache.put(3, [3])
+    cache.get(2)
+    cache.put(4, [2, 2])
+
+    assert len(cache) == 2
+    assert cache.get(3) is None
+    assert cache.get(2) == [2]
+    assert cache.statistics.evictions == 1
+
+
+def test_invalid_max_size_raises_error():
+    with pytest.raises(ValueError):
+        FactorizationCache(max_size=0)
+
+
+def test_factorizations_are_persisted_on_disk(tmp_path):
+    path = tmp_path / "cache.sqlite"
+    with FactorizationCache(path=path) as cache:
+        cache.prime_factors(2**64 + 1)
+
+    with FactorizationCache(path=path) as cache:
+        assert cache.get(2**64 + 1) == [274177, 67280421310721]
+        assert cache.statistics.disk_hits == 1
+        assert cache.get(2**64 + 1) == [274177, 67280421310721]
+        assert cache.statistics.memory_hits == 1
+
+
+def test_statistics_to_dict():
+    cache = FactorizationCache()
+    cache.prime_factors(12)
+    assert cache.statistics.to_dict() == {
+        "memory_hits": 0,
+        "disk_hits": 0,
+        "misses": 1,
+        "evictions": 0,
+        "hits": 0,
+        "hit_rate": 0.0,
+    }
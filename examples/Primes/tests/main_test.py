@@ -1,3 +1,8 @@
+import io
+import sys
+
+import pytest
+
 from primes.__main__ import main
 
 
@@ -5,3 +10,87 @@ def test_main_function(capsys):
     main(["42"])
     captured = capsys.readouterr()
     assert captured.out == "[2, 3, 7]\n"
+
+
+def test_main_function_streams_from_file(capsys, tmp_path):
+    input_file = tmp_path / "numbers.txt"
+    input_file.write_text("12\n\n7\n1\n")
+    main(["--input", str(input_file)])
+    captured = capsys.readouterr()
+    assert captured.out == "12: 2 2 3\n7: 7\n1:\n"
+
+
+def test_main_function_streams_json_lines(capsys, tmp_path):
+    input_file = tmp_path / "numbers.txt"
+    input_file.write_text("12\n7\n")
+    main(["--input", str(input_file), "--format", "json"])
+    captured = capsys.readouterr()
+    assert captured.out == (
+        '{"number": 12, "factors": [2, 2, 3]}\n{"number": 7, "factors": [7]}\n'
+    )
+
+
+def test_main_function_streams_from_stdin_and_leaves_it_open(capsys, monkeypatch):
+    stdin = io.StringIO("12\n7\n")
+    monkeypatch.setattr(sys, "stdin", stdin)
+    main([])
+    assert capsys.readouterr().out == "12: 2 2 3\n7: 7\n"
+    assert not stdin.closed
+
+
+def test_main_function_does_not_open_input_when_number_is_given(capsys, tmp_path):
+    main(["42", "--input", str(tmp_path / "missing.txt")])
+    assert capsys.readouterr().out == "[2, 3, 7]\n"
+
+
+def test_main_function_reports_missing_input_file(capsys, tmp_path):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["--input", str(tmp_path / "missing.txt")])
+    assert exit_info.value.code == 2
+    assert "can't open" in capsys.readouterr().err
+
+
+def test_main_function_reports_invalid_input(capsys, tmp_path):
+    input_file = tmp_path / "numbers.txt"
+    input_file.write_text("12\nabc\n")
+    with pytest.raises(SystemExit):
+        main(["--input", str(input_file)])
+    captured = capsys.readouterr()
+    assert "line 2: invalid integer 'abc'" in captured.err
+
+
+def test_main_function_streams_with_multiple_jobs(capsys, tmp_path):
+    input_file = tmp_path / "numbers.txt"
+    input_file.write_text("".join(f"{n}\n" for n in range(2, 50)))
+    main(["--input", str(input_file), "--jobs", "2"])
+    captured = capsys.readouterr()
+    lines = captured.out.splitlines()
+    assert lines[:3] == ["2: 2", "3: 3", "4: 2 2"]
+    assert lines[-1] == "49: 7 7"
+
+
+def test_main_function_reuses_cache_between_runs(capsys, tmp_path):
+    input_file = tmp_path / "numbers.txt"
+    input_file.write_text("12\n7\n")
+    cache_file = tmp_path / "cache.sqlite"
+    main(["--input", str(input_file), "--cache", str(cache_file)])
+    capsys.readouterr()
+
+    main(["--input", str(input_file), "--cache", str(cache_file), "--cache-stats"])
+    captured = capsys.readouterr()
+    assert captured.out == "12: 2 2 3\n7: 7\n"
+    assert '"disk_hits": 2' in captured.err
+    assert '"misses": 0' in captured.err
+
+
+def test_range_subcommand_lists_primes(capsys):
+    main(["range", "10", "30"])
+    captured = capsys.readouterr()
+    assert captured.out == "11\n13\n17\n19\n23\n29\n"
+
+
+def test_range_subcommand_counts_primes(capsys):
+    main(["range", "--count", "100"])
+    main(["range", "--count", "10", "100"])
+    captured = capsys.readouterr()
+    assert captured.out == "25\n21\n"
@@ -0,0 +1,32 @@
+from primes.cache import FactorizationCache
+from primes.parallel import factor_numbers_in_parallel
+from primes.prime_factors import compute_prime_factors
+
+
+def test_factor_numbers_in_parallel_preserves_order():
+    numbers = [2**61 - 1, *range(1000), 600851475143]
+    chunks = list(factor_numbers_in_parallel(numbers, jobs=3, chunk_size=7))
+
+    assert all(len(chunk) <= 7 for chunk in chunks)
+    assert [result for chunk in chunks for result in chunk] == [
+        (n, compute_prime_factors(n)) for n in numbers
+    ]
+
+
+def test_factor_numbers_in_parallel_with_single_job():
+    chunks = list(factor_numbers_in_parallel(iter([12, 7]), jobs=1))
+    assert chunks == [[(12, [2, 2, 3]), (7, [7])]]
+
+
+def test_factor_numbers_in_parallel_of_no_numbers():
+    assert list(factor_numbers_in_parallel([], jobs=2)) == []
+
+
+def test_factor_numbers_in_parallel_uses_cache():
+    cache = FactorizationCache()
+    cache.put(12, [2, 2, 3])
+    chunks = list(factor_numbers_in_parallel([12, 7, 12], jobs=2, cache=cache))
+
+    assert chunks == [[(12, [2, 2, 3]), (7, [7]), (12, [2, 2, 3])]]
+    assert cache.statistics.hits == 2
+    assert cache.get(7) == [7]
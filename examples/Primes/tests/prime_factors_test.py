@@ -1,4 +1,4 @@
-from primes.prime_factors import compute_prime_factors
+from primes.prime_factors import compute_prime_factors, is_prime
 
 
 def test_prime_factors_of_2():
@@ -19,3 +19,35 @@ def test_prime_factors_of_5():
 
 def test_prime_factors_of_1():
     assert compute_prime_factors(1) == []
+
+
+def test_prime_factors_of_0():
+    assert compute_prime_factors(0) == []
+
+
+def test_prime_factors_are_sorted_with_multiplicity():
+    assert compute_prime_factors(2**3 * 3**2 * 1_000_003) == [2, 2, 2, 3, 3, 1_000_003]
+
+
+def test_prime_factors_are_exact_ints():
+    factors = compute_prime_factors(2**61 - 1)
+    assert factors == [2**61 - 1]
+    assert all(type(f) is int for f in factors)
+
+
+def test_prime_factors_of_semiprime_with_large_factors():
+    p, q = 4_294_967_291, 4_294_967_279
+    assert compute_prime_factors(p * q) == [q, p]
+
+
+def test_prime_factors_of_number_larger_than_64_bits():
+    assert compute_prime_factors(2**64 + 1) == [274177, 67280421310721]
+
+
+def test_prime_factors_of_large_prime_power():
+    assert compute_prime_factors(1_000_003**3) == [1_000_003] * 3
+
+
+def test_is_prime():
+    assert [n for n in range(30) if is_prime(n)] == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    assert not is_prime(3_215_031_751)
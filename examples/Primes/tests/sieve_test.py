@@ -0,0 +1,54 @@
+import pytest
+
+from primes.prime_factors import is_prime
+from primes.sieve import prime_count, primes_in_range
+
+
+def test_primes_in_range_matches_primality_test():
+    assert list(primes_in_range(0, 1000)) == [n for n in range(1000) if is_prime(n)]
+
+
+def test_primes_in_range_excludes_upper_bound():
+    assert list(primes_in_range(2, 7)) == [2, 3, 5]
+
+
+def test_primes_in_range_with_small_segments():
+    expected = [n for n in range(500, 2000) if is_prime(n)]
+    assert list(primes_in_range(500, 2000, segment_size=5)) == expected
+
+
+def test_primes_in_range_far_from_zero():
+    assert list(primes_in_range(10**12, 10**12 + 100)) == [
+        n for n in range(10**12, 10**12 + 100) if is_prime(n)
+    ]
+
+
+def test_primes_in_empty_range():
+    assert list(primes_in_range(20, 20)) == []
+    assert list(primes_in_range(30, 10)) == []
+
+
+def test_primes_in_range_is_lazy():
+    primes = primes_in_range(0, 10**12)
+    assert [next(primes) for _ in range(5)] == [2, 3, 5, 7, 11]
+
+
+def test_prime_count():
+    assert [prime_count(n) for n in range(8)] == [0, 0, 0, 1, 2, 2, 3, 3]
+    assert prime_count(10**6, segment_size=1000) == 78498
+
+
+def test_prime_count_with_lower_bound():
+    assert prime_count(100, lo=2) == 25
+    assert prime_count(100, lo=3) == 24
+    assert prime_count(1000, lo=100) == len(list(primes_in_range(100, 1000)))
+
+
+def test_invalid_segment_size_raises_error():
+    with pytest.raises(ValueError):
+        prime_count(100, segment_size=0)
+
+
+def test_prime_count_lower_bound_is_keyword_only():
+    with pytest.raises(TypeError):
+        prime_count(100, 10)